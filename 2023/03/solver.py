@@ -638,7 +638,7 @@ maxX, maxY = 139, 139
 
 def getSymbols(fileLines):
     res = []
-    for i, line in enumerate(file):
+    for i, line in enumerate(fileLines):
         for j, c in enumerate(line):
             if c == '*':
                 res.append([i, j, c])
@@ -674,18 +674,18 @@ def getNumbers(x,y, file):
         pos.add((x,newY))
         newY = newY - 1
     return (res, pos)
-# input ='inputs/test.txt'
-input ='03/input.txt'
+def part2(input):
+    # The grid bounds come from the input, example or real
+    global maxX, maxY
+    with open(input, 'r') as f:
+        file = f.read().replace(',','').splitlines()
+    maxX, maxY = len(file) - 1, len(file[0]) - 1
 
-with open(input, 'r') as f:
-    file = f.read().replace(',','').splitlines()
-    
     symbols = getSymbols(file)
     #print(symbols)
     eights = []
     for x in symbols:
         eights.append(eight(x[0],x[1]))
-    print('8:', eights)
     total = 0
     for x in eights:
         digits = list(filter(lambda x: file[x[0]][x[1]].isdigit(),x))
@@ -707,9 +707,9 @@ with open(input, 'r') as f:
                 unique.append(x)
         if len(unique)  == 2:
             total = total + int(unique[0][0]) * int(unique[1][0])
-    
-    print(total)
 
+    return total
 
-
-            
+if __name__ == "__main__":
+    # input ='inputs/test.txt'
+    print(part2('03/input.txt'))
@@ -0,0 +1,183 @@
+import numpy as np
+from numpy.typing import NDArray
+import pathlib
+import tempfile
+from typing import Iterator, List, Optional, Tuple, Union
+
+from util.input import iter_chunks, parse_ints
+
+# Solver ID Constants
+DAY: str = "01"
+TITLE: str = "Historian Hysteria"
+COMMENTS: str = """
+Out-of-core variant of solve_numpy.py for location lists larger than RAM.
+Each column is sorted a run at a time into memory-mapped int64 temp files,
+then the runs are k-way merged in blocks and both columns walked in lockstep,
+so peak memory is bounded by RUN_BYTES & MERGE_BYTES, not the input length."""
+
+# Types
+PathLike = Union[str, pathlib.Path]
+Array = NDArray[np.int64]
+
+# Input bytes sorted in memory per run, then spilled to disk
+RUN_BYTES: int = 64 * 2**20
+
+# Bytes of all runs' merge buffers together, split evenly between the runs
+MERGE_BYTES: int = 64 * 2**20
+
+# Fewest values read from a run at once, however many runs there are
+MIN_BLOCK: int = 1024
+
+
+def spill_runs(
+    fpath: PathLike, tmpdir: str, run_bytes: Optional[int] = None
+) -> Tuple[List[np.memmap], List[np.memmap]]:
+    """
+    Sort each column run_bytes (default RUN_BYTES) of lines at a time,
+    writing every sorted run to its own int64 file under tmpdir,
+    mapped back read-only.
+
+    Returns:
+        Tuple[List[np.memmap], List[np.memmap]]: The left & right runs.
+    """
+    runs: Tuple[List[np.memmap], List[np.memmap]] = ([], [])
+    chunks = iter_chunks(str(fpath), run_bytes if run_bytes else RUN_BYTES)
+    for i, chunk in enumerate(chunks):
+        values = parse_ints(chunk)
+        if len(values) % 2:
+            raise ValueError(f"Odd number of location IDs in a chunk of {fpath}")
+        for side, column in enumerate([values[0::2], values[1::2]]):
+            if len(column) == 0:
+                continue
+            path = pathlib.Path(tmpdir) / f"run-{side}-{i}.i64"
+            np.sort(column).tofile(path)
+            runs[side].append(np.memmap(path, dtype=np.int64, mode="r"))
+    return runs
+
+
+def merge_runs(runs: List[np.memmap], block: int) -> Iterator[Array]:
+    """
+    K-way merge of sorted runs, yielding sorted blocks in ascending order.
+
+    Every round tops up each run's buffer that ran dry, then emits all
+    buffered values up to the smallest last value of the runs that still
+    have unread values, as nothing unread can be below it.
+    """
+    bufs: List[Array] = [np.zeros(0, dtype=np.int64) for _ in runs]
+    pos = [0] * len(runs)
+    while True:
+        for i, run in enumerate(runs):
+            if len(bufs[i]) == 0 and pos[i] < len(run):
+                bufs[i] = np.asarray(run[pos[i] : pos[i] + block])
+                pos[i] += len(bufs[i])
+        unread = [bufs[i][-1] for i, run in enumerate(runs) if pos[i] < len(run)]
+        if not unread and not any(len(buf) for buf in bufs):
+            return
+        bound = min(unread) if unread else None
+        taken = []
+        for i, buf in enumerate(bufs):
+            cut = len(buf) if bound is None else np.searchsorted(buf, bound, "right")
+            taken.append(buf[:cut])
+            bufs[i] = buf[cut:]
+        merged = np.concatenate(taken)
+        merged.sort(kind="stable")
+        if len(merged):
+            yield merged
+
+
+def counted(blocks: Iterator[Array]) -> Iterator[Tuple[Array, Array]]:
+    """
+    Turn sorted blocks into (values, counts) with each value in one pair only,
+    the last value of a block is held back in case the next block repeats it.
+    """
+    carry: Optional[Tuple[Array, Array]] = None
+    for block in blocks:
+        starts = np.flatnonzero(np.diff(block, prepend=block[0] - 1))
+        values = block[starts]
+        counts = np.diff(np.append(starts, len(block)))
+        if carry is not None:
+            if values[0] == carry[0][0]:
+                counts[0] += carry[1][0]
+            else:
+                values = np.concatenate([carry[0], values])
+                counts = np.concatenate([carry[1], counts])
+        if len(values) > 1:
+            yield values[:-1], counts[:-1]
+        carry = values[-1:], counts[-1:]
+    if carry is not None:
+        yield carry
+
+
+def block_size(runs: int) -> int:
+    return max(MIN_BLOCK, MERGE_BYTES // (8 * max(runs, 1)))
+
+
+def part1(fpath: PathLike, debug: bool = False) -> int:
+    total = 0
+    with tempfile.TemporaryDirectory(prefix="aoc-day01-") as tmpdir:
+        left_runs, right_runs = spill_runs(fpath, tmpdir)
+        if debug:
+            print(f"Spilled {len(left_runs)} + {len(right_runs)} sorted runs")
+        block = block_size(len(left_runs) + len(right_runs))
+        lefts, rights = merge_runs(left_runs, block), merge_runs(right_runs, block)
+        # Pair the i-th smallest of both columns, however their blocks are cut
+        left = right = np.zeros(0, dtype=np.int64)
+        while True:
+            if len(left) == 0:
+                left = next(lefts, left)
+            if len(right) == 0:
+                right = next(rights, right)
+            n = min(len(left), len(right))
+            if n == 0:
+                break
+            total += int(np.abs(left[:n] - right[:n]).sum())
+            left, right = left[n:], right[n:]
+        del left_runs, right_runs, lefts, rights, left, right  # Unmap before cleanup
+    return total
+
+
+def part2(fpath: PathLike, debug: bool = False) -> int:
+    total = 0
+    with tempfile.TemporaryDirectory(prefix="aoc-day01-") as tmpdir:
+        left_runs, right_runs = spill_runs(fpath, tmpdir)
+        if debug:
+            print(f"Spilled {len(left_runs)} + {len(right_runs)} sorted runs")
+        block = block_size(len(left_runs) + len(right_runs))
+        lefts = counted(merge_runs(left_runs, block))
+        rights = counted(merge_runs(right_runs, block))
+        # Merge join the distinct values of both columns, x * count_l * count_r
+        empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+        left, right = empty, empty
+        while True:
+            if len(left[0]) == 0:
+                left = next(lefts, empty)
+            if len(right[0]) == 0:
+                right = next(rights, empty)
+            if len(left[0]) == 0 or len(right[0]) == 0:
+                break
+            bound = min(left[0][-1], right[0][-1])
+            cut_l = np.searchsorted(left[0], bound, "right")
+            cut_r = np.searchsorted(right[0], bound, "right")
+            _, i_l, i_r = np.intersect1d(
+                left[0][:cut_l], right[0][:cut_r], True, return_indices=True
+            )
+            total += int((left[0][i_l] * left[1][i_l] * right[1][i_r]).sum())
+            left = (left[0][cut_l:], left[1][cut_l:])
+            right = (right[0][cut_r:], right[1][cut_r:])
+        del left_runs, right_runs, lefts, rights, left, right  # Unmap before cleanup
+    return total
+
+
+if __name__ == "__main__":
+    import time
+
+    for path in [
+        pathlib.Path(__file__).parent / f for f in ["example.txt", "input.txt"]
+    ]:
+        if not path.exists():
+            continue
+        for part in [part1, part2]:
+            tstart = time.time()
+            sol = part(path)
+            time_ms = 1000 * (time.time() - tstart)
+            print(f"{part.__name__} {path.name}: {sol},\t\ttime: {time_ms:.3f} ms")
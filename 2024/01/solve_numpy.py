@@ -0,0 +1,71 @@
+import numpy as np
+from numpy.typing import NDArray
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from util.input import iter_chunks, parse_ints
+
+# Solver ID Constants
+DAY: str = "01"
+TITLE: str = "Historian Hysteria"
+COMMENTS: str = """
+NumPy variant of solve.py, compare with: aoc solve 1 --all-variants
+The columns are parsed from the raw bytes into int64 arrays, a chunk of
+lines at a time, so even multi-GB lists never become Python strings or ints."""
+
+# Types
+PathLike = Union[str, Path]
+Columns = Tuple[NDArray[np.int64], NDArray[np.int64]]
+
+
+def read_columns(fpath: PathLike, chunk_bytes: Optional[int] = None) -> Columns:
+    """
+    Stream the two columns into int64 arrays a chunk at a time,
+    the chunk size defaults to util.input.CHUNK_BYTES.
+    """
+    lefts: List[NDArray[np.int64]] = []
+    rights: List[NDArray[np.int64]] = []
+    for chunk in iter_chunks(str(fpath), chunk_bytes):
+        values = parse_ints(chunk)
+        if len(values) % 2:
+            raise ValueError(f"Odd number of location IDs in a chunk of {fpath}")
+        lefts.append(values[0::2])
+        rights.append(values[1::2])
+    empty = np.zeros(0, dtype=np.int64)
+    left = np.concatenate(lefts) if lefts else empty
+    right = np.concatenate(rights) if rights else empty
+    return left, right
+
+
+def parse(fpath: PathLike) -> Columns:
+    """Left & right columns shared by both parts, which never mutate them."""
+    return read_columns(fpath)
+
+
+def part1(columns: Columns, debug: bool = False) -> int:
+    left, right = columns
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+
+def part2(columns: Columns, debug: bool = False) -> int:
+    left, right = columns
+    values, counts = np.unique(right, return_counts=True)
+    if len(values) == 0:
+        return 0
+    # Position of each left number among the right's unique values, if there
+    idx = np.minimum(np.searchsorted(values, left), len(values) - 1)
+    found = values[idx] == left
+    return int((left[found] * counts[idx[found]]).sum())
+
+
+if __name__ == "__main__":
+    import time
+
+    for path in [Path(__file__).parent / f for f in ["example.txt", "input.txt"]]:
+        if not path.exists():
+            continue
+        for part in [part1, part2]:
+            tstart = time.time()
+            sol = part(parse(path))
+            time_ms = 1000 * (time.time() - tstart)
+            print(f"{part.__name__} {path.name}: {sol},\t\ttime: {time_ms:.3f} ms")
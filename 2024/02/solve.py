@@ -1,11 +1,11 @@
 import numpy as np
-from typing import List
+from numpy.typing import NDArray
+from typing import Tuple
 
+from util.input import map_input, parse_int_rows
 
-def read_lines(fpath: str) -> List[str]:
-    with open(fpath, "r") as f:
-        lines = f.read().splitlines()
-    return lines
+# Every report's levels padded into one matrix, and the count of each's levels
+Reports = Tuple[NDArray[np.int64], NDArray[np.int64]]
 
 
 def is_safe(report: np.ndarray) -> bool:
@@ -40,25 +40,44 @@ def is_safe(report: np.ndarray) -> bool:
     return True
 
 
-def part1(fpath: str, debug: bool = False) -> int:
+def parse(fpath: str) -> Reports:
     """
-    Each line is a "report" with whitespace separated numbers.
-    Each report is "safe" according to rules in description of is_safe function.
+    Each line is a "report" with whitespace separated numbers,
+    parsed straight from the file's bytes into one padded 2D array
+    so every report is checked at once instead of one small array each.
     """
-    lines = read_lines(fpath)
+    return parse_int_rows(map_input(fpath))
 
-    # Each report is a list of integers, so split by whitespace & parse to int
-    # Use numpy for faster batch processing
-    reports = [np.array(list(map(int, line.split()))) for line in lines]
 
-    safe_reports = 0  # The counter for safe reports
-    # Loop through each report and apply rules to determine if it is safe
-    for report in reports:
-        if is_safe(report):
-            # If report is safe, increment the counter
-            safe_reports += 1
+def safe_mask(levels: NDArray[np.int64], lengths: NDArray[np.int64]) -> NDArray:
+    """
+    The is_safe rules applied to every report (row) at once.
+    Differences past the end of a report are padding and pass every check.
+    """
+    diffs = np.diff(levels, axis=1)
+    padding = np.arange(diffs.shape[1]) >= (lengths - 1)[:, None]
+    increasing = ((diffs >= 1) & (diffs <= 3)) | padding
+    decreasing = ((diffs <= -1) & (diffs >= -3)) | padding
+    return increasing.all(axis=1) | decreasing.all(axis=1)
+
 
-    return safe_reports
+def part1(reports: Reports, debug: bool = False) -> int:
+    """
+    Each report is "safe" according to rules in description of is_safe function.
+    """
+    levels, lengths = reports
+    return int(safe_mask(levels, lengths).sum())
+
+
+def first_violation(report: np.ndarray, direction: int) -> int:
+    """
+    Index of the first adjacent pair (report[j], report[j + 1]) that breaks
+    the is_safe rules for a direction of 1 (increasing) or -1 (decreasing),
+    -1 if none does.
+    """
+    steps = np.diff(report) * direction
+    bad = np.flatnonzero((steps < 1) | (steps > 3))
+    return int(bad[0]) if len(bad) else -1
 
 
 def problem_damper(report: np.ndarray) -> np.ndarray:
@@ -67,45 +86,66 @@ def problem_damper(report: np.ndarray) -> np.ndarray:
     will remove exactly one level problem from a reactor.
     This changes whether a report is safe because
     there's a margin of one unsafe level for each report allowed.
-    This simulates the problem damper by going through the report 1 lvl @ a time.
-    Removing that one level in modified report and
-    seeing if it can be safe safe without that level.
-    If it can at any point, return the modified report.
-    Otherwise after trying all possible modifications, return the original report.
-    """
-    for i in range(len(report)):
-        modified_report = np.delete(report, i)
-        if is_safe(modified_report):
-            return modified_report
+    Every pair before the first violating pair j is fine in that direction,
+    so removing any level but j or j + 1 leaves the violation in place.
+    Only those two removals per direction are checked, not every level.
+    If one makes the report safe, return the modified report.
+    Otherwise return the original report.
+    """
+    for direction in [1, -1]:
+        j = first_violation(report, direction)
+        if j < 0:
+            return report
+        for i in [j, j + 1]:
+            modified_report = np.delete(report, i)
+            if is_safe(modified_report):
+                return modified_report
     return report
 
 
-def part2(fpath: str, debug: bool = False) -> int:
+def damped_mask(levels: NDArray[np.int64], lengths: NDArray[np.int64]) -> NDArray:
+    """
+    The problem_damper applied to every report (row) at once: whether each is
+    safe with at most one level removed. From the first violating pair j,
+    removing level j or j + 1 is safe if the levels around it step right
+    and every pair after it is fine, taken from a suffix of pair checks.
+    """
+    rows, cols = levels.shape
+    if cols < 2:
+        return np.ones(rows, dtype=bool)
+    diffs = np.diff(levels, axis=1)
+    padding = np.arange(cols - 1) >= (lengths - 1)[:, None]
+    index = np.arange(rows)
+    damped = np.zeros(rows, dtype=bool)
+    for direction in [1, -1]:
+        steps = diffs * direction
+        fine = ((steps >= 1) & (steps <= 3)) | padding
+        # suffix[:, k] is whether the pairs from k on are all fine
+        suffix = np.logical_and.accumulate(fine[:, ::-1], axis=1)[:, ::-1]
+        suffix = np.hstack([suffix, np.ones((rows, 2), dtype=bool)])
+        first = fine.argmin(axis=1)  # 0 for rows without a violation
+
+        def bridged(left: NDArray, right: NDArray) -> NDArray:
+            # Do levels left & right step right once the one between is gone
+            step = levels[index, np.minimum(right, cols - 1)] - levels[index, left]
+            step *= direction
+            return (left < 0) | (right >= lengths) | ((step >= 1) & (step <= 3))
+
+        drop_first = bridged(first - 1, first + 1) & suffix[index, first + 1]
+        drop_next = bridged(first, first + 2) & suffix[index, first + 2]
+        damped |= suffix[:, 0] | drop_first | drop_next
+    return damped
+
+
+def part2(reports: Reports, debug: bool = False) -> int:
     """
     Each line is a "report" with whitespace separated numbers.
     Each report is "safe" according to rules in description of is_safe function.
     In part2 however, it's determined that a "safety damper" exists.
-    It is modeled by the problem_damper function.
+    It is modeled by the problem_damper function, applied to every report
+    at once by the damped_mask function.
     It removes one unsafe level from operation.
     That means a report that is unsafe due only to one level can be made safe.
     """
-    lines = read_lines(fpath)
-
-    # Each report is a list of integers, so split by whitespace & parse to int
-    # Use numpy for faster batch processing
-    reports = [np.array(list(map(int, line.split()))) for line in lines]
-
-    safe_reports = 0  # The counter for safe reports
-    for report in reports:
-        # Check if report is safe
-        if is_safe(report):
-            safe_reports += 1
-            continue
-        # If not, apply the damper to see if it can be made safe
-        modified_report = problem_damper(report)
-        # If the lengths are different, the damper worked
-        if len(modified_report) != len(report):
-            safe_reports += 1
-
-    # The answer to part2 is the number of safe reports after applying the damper
-    return safe_reports
+    levels, lengths = reports
+    return int(damped_mask(levels, lengths).sum())
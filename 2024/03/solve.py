@@ -1,14 +1,22 @@
 import re
 from rich.markup import escape
-from typing import List, Tuple
+from typing import Iterator, Optional, Tuple
 
+from util.input import map_input
 from util.sols import cprint
 
+# The instructions, mul(X,Y) with X & Y of 1-3 digits, do() & don't()
+# Matches are (X, Y, b"") for a mul & (b"", b"", b"do" or b"don't") otherwise
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do|don't)\(\)")
 
-def read_lines(fpath: str) -> List[str]:
-    with open(fpath, "r") as f:
-        lines = f.read().splitlines()
-    return lines
+# Longest instruction, so a chunk's last MAX_LEN - 1 bytes may hold a cut one
+MAX_LEN: int = len("mul(123,456)")
+
+# Bytes scanned at once, kept small as all of a chunk's matches are listed
+SCAN_BYTES: int = 2**20
+
+# A matched instruction, see INSTRUCTION
+Instruction = Tuple[bytes, bytes, bytes]
 
 
 def if_debug_print(debug: bool, msg: str, esc: bool = False) -> None:
@@ -16,62 +24,60 @@ def if_debug_print(debug: bool, msg: str, esc: bool = False) -> None:
     cprint(msg) if debug else None
 
 
-def parse_mul_ops(line: str, debug: bool) -> List[Tuple[int, int]]:
-    pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-    matches = re.findall(pattern, line)
-    ops = [(int(x), int(y)) for x, y in matches]
-
-    if debug:
-        cprint("\n[blue]mul operands[/blue]:\n")
-        cprint(ops)
-        cprint()
-
-    return ops
+def scan_instructions(
+    fpath: str, chunk_bytes: Optional[int] = None
+) -> Iterator[Instruction]:
+    """
+    Stream the instructions of the memory mapped input in one pass,
+    chunk_bytes (default SCAN_BYTES) at a time.
+    Line breaks are dropped as the instructions are one long line.
+    Each chunk is matched up to its last ')', as no instruction has one
+    inside it, and what's after is carried into the next chunk,
+    only up to MAX_LEN - 1 bytes so memory stays bounded by the chunk size.
+    """
+    chunk_bytes = chunk_bytes if chunk_bytes else SCAN_BYTES
+    buf = map_input(fpath)
+    view = memoryview(buf)
+    carry = b""
+    for start in range(0, len(buf), chunk_bytes):
+        chunk = (carry + view[start : start + chunk_bytes]).translate(None, b"\r\n")
+        cut = chunk.rfind(b")") + 1
+        yield from INSTRUCTION.findall(chunk, 0, cut)
+        carry = chunk[max(cut, len(chunk) - (MAX_LEN - 1)) :]
+
+
+def sum_muls(fpath: str, conditional: bool, debug: bool = False) -> int:
+    """
+    Sum the products of the mul(X,Y) instructions, if conditional
+    only those enabled, i.e. not after a don't() until the next do().
+    """
+    total, enabled, skipped = 0, True, 0
+    for x, y, switch in scan_instructions(fpath):
+        if switch:
+            enabled = switch == b"do"
+        elif enabled or not conditional:
+            total += int(x) * int(y)
+        else:
+            skipped += 1
+        if debug:
+            msg = f"{switch.decode()}()" if switch else f"mul({int(x)},{int(y)})"
+            disabled = conditional and not enabled and not switch
+            if_debug_print(debug, msg + (" (disabled)" if disabled else ""))
+
+    if debug and conditional:
+        cprint(f"Skipped {skipped} disabled mul instructions", style="bold blue")
 
-
-def filter_dont_blocks(instructions: str, debug: bool) -> str:
-    pattern = r"don't\(\).*?($|do\(\))"
-    do_blocks = re.sub(pattern, "", instructions, flags=re.DOTALL)
-
-    # Print debug info if requested
-    if debug:
-        cprint("\n[blue]instructions[/blue]:\n")
-        cprint(escape(instructions))
-        cprint("\n[green]do_blocks[/green]:\n")
-        cprint(escape(do_blocks))
-        cprint()
-        filter_perc = (1 - (len(do_blocks) / len(instructions))) * 100
-        msg = f"Filtered out {filter_perc:.2f}% of instructions"
-        cprint(msg, style="bold blue")
-
-    return do_blocks
+    return total
 
 
 def part1(fpath: str, debug: bool = False) -> int:
-    darg = {"debug": debug}
-    lines = read_lines(fpath)
-
-    # The instructions need to be one long line this time
-    instructions = "".join(lines)
-
-    # Parse out the mul(X,Y) operands from the instructions
-    muls = parse_mul_ops(instructions, **darg)
-    total = sum(x * y for x, y in muls)
-
-    return total
+    # The instructions are one long line, scanned straight off the file
+    return sum_muls(fpath, conditional=False, debug=debug)
 
 
 def part2(fpath: str, debug: bool = False) -> int:
-    darg = {"debug": debug}
-    lines = read_lines(fpath)
-    instructions = "".join(lines)
-
-    instructions = filter_dont_blocks(instructions, **darg)
-
-    muls = parse_mul_ops(instructions, **darg)
-    total = sum(x * y for x, y in muls)
-
-    return total
+    # Same scan, but mul instructions between don't() & do() are skipped
+    return sum_muls(fpath, conditional=True, debug=debug)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,15 @@ from rich.console import Console
 import sys
 from concurrent.futures import ProcessPoolExecutor
 import os
+import random
+
+try:
+    from util.sols import work
+except ImportError:  # Run standalone, outside the aoc runner
+
+    def work(n: int = 1, kind: str = "item") -> None:
+        pass
+
 
 console = Console()
 cprint = console.print
@@ -346,20 +355,61 @@ def record_path(path: List[Position], pos_marker: Position) -> List[Position]:
     return path
 
 
-def part1(fpath: PathLike, debug: bool = False) -> int:
+# The grid and the guard's starting position & direction shared by both parts
+Parsed = Tuple[Grid, Position, Direction]
+
+
+def parse(fpath: PathLike) -> Parsed:
     """
-    Solve part 1 of the puzzle.
+    Parse the input once for both parts.
 
     Args:
         fpath (PathLike): The path to the input file.
-        debug (bool): If True, prints debugging information whenever the guard hits an obstacle.
 
     Returns:
-        int: The count of visited distinct positions by the guard before leaving the grid.
+        Parsed: The grid and the guard's starting position and direction.
     """
     lines = read_lines(fpath)
     grid = Grid(lines)
     guard_start_pos, guard_start_dir = Guard._parse_marker(lines)
+    return grid, guard_start_pos, guard_start_dir
+
+
+# Grid sides for the scaling harness, see util/scaling.py
+GENERATE_SIZES: List[int] = [64, 128, 256, 512, 1024, 2048, 4096]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a synthetic input for the scaling harness.
+
+    Args:
+        size (int): Side of the square grid.
+        seed (int): Seed of the obstacle placement.
+
+    Returns:
+        str: A grid with ~10% obstacles & the guard facing up in the middle.
+    """
+    rng = random.Random(seed)
+    rows = [
+        ["#" if rng.random() < 0.1 else "." for _ in range(size)] for _ in range(size)
+    ]
+    rows[size // 2][size // 2] = "^"
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def part1(parsed: Parsed, debug: bool = False) -> int:
+    """
+    Solve part 1 of the puzzle.
+
+    Args:
+        parsed (Parsed): The parsed input from parse().
+        debug (bool): If True, prints debugging information whenever the guard hits an obstacle.
+
+    Returns:
+        int: The count of visited distinct positions by the guard before leaving the grid.
+    """
+    grid, guard_start_pos, guard_start_dir = parsed
     guard = Guard(guard_start_pos, guard_start_dir)
 
     sim = Simulator(grid, guard, max_steps=10**6, record_positions=True)
@@ -444,25 +494,24 @@ def run_candidate(args: Tuple[Position, List[str], Position, Direction]) -> bool
     return test_candidate(candidate, test_grid, guard_start_pos, guard_start_dir)
 
 
-def part2(fpath: PathLike, debug: bool = False) -> int:
+def part2(parsed: Parsed, debug: bool = False) -> int:
     """
     Solve part 2 of the puzzle.
 
     Args:
-        fpath (PathLike): The path to the input file.
+        parsed (Parsed): The parsed input from parse().
         debug (bool): If True, prints a message but won't debug for large input due to performance.
 
     Returns:
         int: The count of positions where placing a new obstruction leads to a loop.
     """
+    grid, guard_start_pos, guard_start_dir = parsed
+    lines = grid.lines
+
     # If debugging is enabled but this is the real input, we won't debug due to performance.
-    if debug and "input.txt" in str(fpath):
+    if debug and grid.grid_height > 2 * grid.print_height:
         print("\nDebugging disabled on this part due to performance issues.\n")
 
-    lines = read_lines(fpath)
-    grid = Grid(lines)
-    guard_start_pos, guard_start_dir = Guard._parse_marker(lines)
-
     candidates = [
         (r, c)
         for r in range(grid.grid_height)
@@ -477,6 +526,7 @@ def part2(fpath: PathLike, debug: bool = False) -> int:
     loop_count = 0
     with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
         for result in executor.map(run_candidate, tasks):
+            work(kind="candidate")
             if result:
                 loop_count += 1
 
@@ -537,13 +587,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 1')}:\n")
 
     tstart = time.time()
-    sol = part1(PATH_EX, **kw)
+    sol = part1(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part1(PATH_IN, **kw)
+    sol = part1(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
@@ -551,13 +601,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 2')}:\n")
 
     tstart = time.time()
-    sol = part2(PATH_EX, **kw)
+    sol = part2(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part2(PATH_IN, **kw)
+    sol = part2(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
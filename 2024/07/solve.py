@@ -12,6 +12,14 @@ import time
 from typing import Union, List, Optional, Dict  # , Tuple, Dict, Literal, NewType
 import sys
 
+try:
+    from util.sols import work
+except ImportError:  # Run standalone, outside the aoc runner
+
+    def work(n: int = 1, kind: str = "item") -> None:
+        pass
+
+
 console = Console()
 cprint = console.print
 
@@ -115,6 +123,7 @@ def part1(fpath: PathLike, debug: bool = False) -> int:
     for i, res in enumerate(results):
         ops_seq = dp_recurse(res, nums_list[i], 1, nums_list[i][0])
         sequence_count += len(ops_seq)
+        work(kind="equation")
         if debug:
             cprint_dp_result(res, i, nums_list[i], ops_seq)
         if len(ops_seq) > 0:
@@ -242,6 +251,7 @@ def part2(fpath: PathLike, debug: bool = False) -> int:
     valid_results = []
     for i, res in enumerate(results):
         ops_seq = dp_recurse3(res, nums_list[i], 1, nums_list[i][0])
+        work(kind="equation")
         if debug:
             cprint_dp_result(res, i, nums_list[i], ops_seq)
         if len(ops_seq) > 0:
@@ -1,10 +1,19 @@
 # import numpy as np
 import pathlib
+import random
 from rich.console import Console
 import time
 from typing import Union, List, Tuple
 import sys
 
+try:
+    from util.sols import work
+except ImportError:  # Run standalone, outside the aoc runner
+
+    def work(n: int = 1, kind: str = "item") -> None:
+        pass
+
+
 cnsl = Console()
 cprint = cnsl.print
 
@@ -94,12 +103,31 @@ def calc_checksum(fs: List[int]) -> int:
     return sum(i * id for i, id in enumerate(fs) if id != -1)
 
 
-def part1(fpath: PathLike, debug: bool = False) -> int:
-    fs = read_fs(fpath)
+def parse(fpath: PathLike) -> List[int]:
+    """Expanded block list shared by both parts, which defrag copies of it."""
+    return read_fs(fpath)
+
+
+# Disk map lengths for the scaling harness, see util/scaling.py
+GENERATE_SIZES: List[int] = [1_000, 3_000, 10_000, 30_000, 100_000, 300_000, 1_000_000]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Disk map of size digits, files of 1-9 blocks between 0-9 free blocks."""
+    rng = random.Random(seed)
+    digits = [
+        str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9))
+        for i in range(size)
+    ]
+    return "".join(digits) + "\n"
+
+
+def part1(fs: List[int], debug: bool = False) -> int:
+    fs = fs.copy()  # Defrag works in place, keep the parsed blocks intact
 
     # Defrag
     defrag1(fs)
-    if debug and "example" in str(fpath):
+    if debug and len(fs) < 100:
         print_fs(fs)  # Disable for input.txt, too large
 
     # Calculate checksum
@@ -149,12 +177,13 @@ def defrag2(fs: List[int], debug: bool = False) -> None:
             for i in range(data_size):
                 fs[i_free + i] = fs[i_data + i]  # Copy data into free space
                 fs[i_data + i] = -1  # Delete original
+            work(kind="file move")
         # Move i_data to previous block
         i_data -= 1
 
 
-def part2(fpath: PathLike, debug: bool = False) -> int:
-    fs = read_fs(fpath)
+def part2(fs: List[int], debug: bool = False) -> int:
+    fs = fs.copy()  # Defrag works in place, keep the parsed blocks intact
     defrag2(fs, debug)
     checksum = calc_checksum(fs)
     return checksum
@@ -185,13 +214,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 1')}:\n")
 
     tstart = time.time()
-    sol = part1(PATH_EX, **kw)
+    sol = part1(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part1(PATH_IN, **kw)
+    sol = part1(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
@@ -199,13 +228,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 2')}:\n")
 
     tstart = time.time()
-    sol = part2(PATH_EX, **kw)
+    sol = part2(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part2(PATH_IN, **kw)
+    sol = part2(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
@@ -1,17 +1,20 @@
-t = open("09/input.txt", "rt").read().strip()
-
-m = []  # map of the disk; part 1 and 2
-o = []  # occupied areas, (addr,size); part 2
-f = []  # free areas, (addr,size); part 2
-for i in range(0, len(t), 2):
-    l = int(t[i])
-    o.append((len(m), l))
-    m += [i // 2] * l
-    if i + 1 < len(t):
-        l = int(t[i + 1])
-        if l > 0:
-            f.append([len(m), l])
-            m += [-1] * l
+def read_map(fpath):
+    with open(fpath, "rt") as file:
+        t = file.read().strip()
+
+    m = []  # map of the disk; part 1 and 2
+    o = []  # occupied areas, (addr,size); part 2
+    f = []  # free areas, (addr,size); part 2
+    for i in range(0, len(t), 2):
+        l = int(t[i])
+        o.append((len(m), l))
+        m += [i // 2] * l
+        if i + 1 < len(t):
+            l = int(t[i + 1])
+            if l > 0:
+                f.append([len(m), l])
+                m += [-1] * l
+    return m, o, f
 
 
 def next_free(m, p):
@@ -36,9 +39,6 @@ def defrag1(m):
     return sum(i * m[i] for i in range(last_occupied + 1))
 
 
-print(defrag1(m[:]))
-
-
 def first_suitable(f, sz):
     for i, b in enumerate(f):
         if b[1] >= sz:
@@ -46,7 +46,7 @@ def first_suitable(f, sz):
     return None, None
 
 
-def defrag2(m):
+def defrag2(m, o, f):
     for last_occupied_block in o[::-1]:
         sz = last_occupied_block[1]
         free_block_index, free_block = first_suitable(f, sz)
@@ -63,4 +63,16 @@ def defrag2(m):
     return sum(i * m[i] for i in range(len(m)) if m[i] > 0)
 
 
-print(defrag2(m))
+# Entry points so the runner can use this as a variant, see --all-variants
+def part1(fpath, debug=False):
+    m, _, _ = read_map(fpath)
+    return defrag1(m)
+
+
+def part2(fpath, debug=False):
+    return defrag2(*read_map(fpath))
+
+
+if __name__ == "__main__":
+    print(part1("09/input.txt"))
+    print(part2("09/input.txt"))
@@ -5,6 +5,14 @@ from typing import Union, List, Dict
 from rich.console import Console
 import sys
 
+try:
+    from util.sols import work
+except ImportError:  # Run standalone, outside the aoc runner
+
+    def work(n: int = 1, kind: str = "item") -> None:
+        pass
+
+
 cprint = Console().print
 
 
@@ -43,19 +51,23 @@ def blink(stones_map: Dict[int, int]) -> Dict[int, int]:
         new_stones = process_stone(stone)
         for new_stone in new_stones:
             new_stones_map[new_stone] += count
+    work(kind="blink")
     return new_stones_map
 
 
 # NOTE: 334341 is too high your range was one too high for blink_count
-def part1(fpath: PathLike, debug: bool = False) -> int:
-    stones_map = parse_stones(fpath)
+def parse(fpath: PathLike) -> Dict[int, int]:
+    """Stone counts shared by both parts, blink never mutates its input map."""
+    return parse_stones(fpath)
+
+
+def part1(stones_map: Dict[int, int], debug: bool = False) -> int:
     for _ in range(25):
         stones_map = blink(stones_map)
     return sum(list(stones_map.values()))
 
 
-def part2(fpath: PathLike, debug: bool = False) -> int:
-    stones_map = parse_stones(fpath)
+def part2(stones_map: Dict[int, int], debug: bool = False) -> int:
     for _ in range(75):
         stones_map = blink(stones_map)
     if debug:
@@ -89,13 +101,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 1')}:\n")
 
     tstart = time.time()
-    sol = part1(PATH_EX, **kw)
+    sol = part1(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part1(PATH_IN, **kw)
+    sol = part1(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
@@ -103,7 +115,7 @@ def run(debug: bool = False) -> None:
     # print(f"\n{bgrn('Part 2')}:\n")
 
     tstart = time.time()
-    sol = part2(PATH_IN, **kw)
+    sol = part2(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
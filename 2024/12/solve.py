@@ -1,12 +1,26 @@
-import numpy as np
 import pathlib
-from scipy.ndimage import label
-from scipy.signal import convolve2d
+import random
 import time
-from typing import Union, List, Dict, Any
-from numpy.typing import NDArray
+from typing import TYPE_CHECKING, Union, List, Dict, Any
 import sys
 
+# NumPy & SciPy are imported where used & by warm(), scipy.signal takes about 1s
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+try:
+    from util.input import read_grid
+except ImportError:  # Run standalone, outside the aoc runner
+
+    def read_grid(fpath: str) -> "NDArray":
+        import numpy as np
+
+        with open(fpath, "rb") as f:
+            lines = f.read().splitlines()
+        return np.array([list(line) for line in lines], dtype=np.uint8)
+
+
 # Solver ID Constants
 DAY: str = "12"
 TITLE: str = "Garden Groups"
@@ -22,13 +36,8 @@ Continue the work on the next grid based problem"""
 
 # Types
 PathLike = Union[str, pathlib.Path]
-ArrayMask = NDArray[np.bool_]
-
-
-def read_lines(fpath: PathLike) -> List[str]:
-    with open(fpath, "r") as f:
-        lines = f.read().splitlines()
-    return lines
+if TYPE_CHECKING:
+    ArrayMask = NDArray[np.bool_]
 
 
 def debug_print_conv(**kw: Dict[str, Any]) -> None:
@@ -37,12 +46,25 @@ def debug_print_conv(**kw: Dict[str, Any]) -> None:
     print(msg)
 
 
-def process_region(region: np.ndarray, unique_val: str, debug: bool = False):
+def warm() -> None:
+    """
+    Imports NumPy & SciPy ahead of solving, the runner calls it untimed.
+    """
+    import numpy  # noqa: F401
+    import scipy.ndimage  # noqa: F401
+    import scipy.signal  # noqa: F401
+
+
+def process_region(region: "np.ndarray", unique_val: "np.uint8", debug: bool = False):
     """
     Processes connected regions of a specific value in the grid.
     Computes region properties like area, perimeter, and convolution results.
     Returns a list of dictionaries with the metrics for each region.
     """
+    import numpy as np
+    from scipy.ndimage import label
+    from scipy.signal import convolve2d
+
     results = []  # Collect results for each region
     # Label connected regions
     labeled_array, num_features = label(region == unique_val)  # type: ignore
@@ -75,15 +97,42 @@ def process_region(region: np.ndarray, unique_val: str, debug: bool = False):
             }
         )
         if debug:
-            debug_print_conv(i=i, v=unique_val, a=area, p=perimeter, c=cost)  # type: ignore
+            debug_print_conv(i=i, v=chr(unique_val), a=area, p=perimeter, c=cost)  # type: ignore
         if results is None:
             raise ValueError("Results is None")
     return results
 
 
-def part1(fpath: PathLike, debug: bool = False) -> int:
-    lines = read_lines(fpath)  # Parse input to ndarray grid
-    grid = np.array([list(line.strip()) for line in lines])
+def parse(fpath: PathLike) -> "NDArray":
+    # Plot letters as a uint8 view of the mapped file, no per-line strings
+    return read_grid(str(fpath))
+
+
+# Grid sides for the scaling harness, see util/scaling.py
+GENERATE_SIZES: List[int] = [64, 128, 256, 512, 1024, 2048, 4096]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # Plots mostly copy a neighbour so regions form instead of single cells
+    rng = random.Random(seed)
+    rows: List[List[str]] = []
+    for r in range(size):
+        row: List[str] = []
+        for c in range(size):
+            roll = rng.random()
+            if roll < 0.4 and c > 0:
+                row.append(row[c - 1])
+            elif roll < 0.8 and r > 0:
+                row.append(rows[r - 1][c])
+            else:
+                row.append(rng.choice("ABCDEFGH"))
+        rows.append(row)
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def part1(grid: "NDArray", debug: bool = False) -> int:
+    import numpy as np
+
     total_cost = 0  # Init total cost tracker
     for unique_val in np.unique(grid):  # Iterate over unique values
         results = process_region(grid, unique_val, debug)
@@ -91,9 +140,9 @@ def part1(fpath: PathLike, debug: bool = False) -> int:
     return total_cost
 
 
-def part2(fpath: PathLike, debug: bool = False) -> int:
-    lines = read_lines(fpath)  # Parse input to ndarray grid
-    grid = np.array([list(line.strip()) for line in lines])
+def part2(grid: "NDArray", debug: bool = False) -> int:
+    import numpy as np
+
     total_cost = 0
     for unique_val in np.unique(grid):
         results = process_region(grid, unique_val, debug)
@@ -118,13 +167,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 1')}:\n")
 
     tstart = time.time()
-    sol = part1(PATH_EX, **kw)
+    sol = part1(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part1(PATH_IN, **kw)
+    sol = part1(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
@@ -132,13 +181,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 2')}:\n")
 
     tstart = time.time()
-    sol = part2(PATH_EX, **kw)
+    sol = part2(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part2(PATH_IN, **kw)
+    sol = part2(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
@@ -0,0 +1,102 @@
+# cmd/compare.py
+import argparse
+import sys
+
+from util.sols import cprint
+
+
+def parse_args(args):
+    # Create parser
+    desc = "Solve & time days of several years side by side"
+    parser = argparse.ArgumentParser(description=desc)
+
+    # Define arguments for 'compare' subcommand
+    years_help = "Comma separated years to sweep (default: 2022,2023,2024)"
+    parser.add_argument("--years", type=str, default="2022,2023,2024", help=years_help)
+    days_help = "Days to sweep, e.g. '6', '1-14' or '1,3,5-7' (default: all)"
+    parser.add_argument("--days", type=str, default="all", help=days_help)
+    example_help = "Only solve example inputs"
+    parser.add_argument("--example", "-e", action="store_true", help=example_help)
+    real_help = "Only solve real inputs"
+    parser.add_argument("--real", "-r", action="store_true", help=real_help)
+    workers_help = "Process pool size (default: cpu count)"
+    parser.add_argument("--workers", "-j", type=int, default=None, help=workers_help)
+    runs_help = "Timed runs per job, the fastest is reported (default: 1)"
+    parser.add_argument("--runs", "-n", type=int, default=1, help=runs_help)
+
+    # Parse
+    args = parser.parse_args(args)
+    if args.runs < 1:
+        parser.error(f"--runs must be at least 1, got {args.runs}")
+    args.years = args.years.split(",")
+    if not args.example and not args.real:
+        args.example = True
+        args.real = True
+    return args
+
+
+def main(args):
+    from rich.table import Table
+    from util.adapters import YEARS, discover_days, input_files, run_year_jobs
+    from util.bench import fmt_ns
+    from util.sweep import parse_days
+
+    args = parse_args(args)
+    unknown = [year for year in args.years if year not in YEARS]
+    if unknown:
+        cprint(f"Unknown years {unknown}, expected some of {YEARS}", style="bold red")
+        sys.exit(1)
+
+    jobs = []
+    kinds = [
+        kind for kind, on in [("EXAMPLE", args.example), ("INPUT", args.real)] if on
+    ]
+    for year in args.years:
+        available = discover_days(year)
+        try:
+            days = parse_days(args.days, available)
+        except ValueError as e:
+            cprint(str(e), style="bold red")
+            sys.exit(1)
+        for day in [day for day in days if day in available]:
+            for part in ["1", "2"]:
+                files = input_files(year, day, part)
+                for kind in kinds:
+                    if files[kind].exists():
+                        jobs.append((year, day, part, kind, str(files[kind])))
+    if not jobs:
+        cprint("No jobs to solve", style="bold red")
+        sys.exit(1)
+
+    cprint(f"Solving {len(jobs)} jobs across {len(args.years)} years...", style="blue")
+    results = run_year_jobs(jobs, args.workers, args.runs)
+
+    table = Table(title="Advent of Code - Solve Times by Year (ms)")
+    for col in ["Year", "Day", "Part", "Input", "Answer", "Solve", "MiB/s"]:
+        table.add_column(col, justify="right")
+    for r in results:
+        if r["error"] is None:
+            answer = str(r["answer"])
+            rate = f"{r['bytes'] / 2**20 / (r['ns'] / 1e9):.2f}" if r["ns"] else "-"
+        else:
+            answer, rate = f"[red]{r['error']}[/red]", "-"
+        row = [r["year"], r["day"], r["part"], r["input"], answer]
+        table.add_row(*row, fmt_ns(r["ns"]), rate)
+    cprint(table)
+
+    # Throughput over all inputs a year solved, failed jobs aren't counted
+    table = Table(title="Throughput by Year")
+    for col in ["Year", "Solved", "Failed", "Total (ms)", "Median (ms)", "MiB/s"]:
+        table.add_column(col, justify="right")
+    for year in args.years:
+        solved = [r for r in results if r["year"] == year and r["error"] is None]
+        failed = sum(r["year"] == year and r["error"] is not None for r in results)
+        total_ns = sum(r["ns"] for r in solved)
+        times = sorted(r["ns"] for r in solved)
+        median = fmt_ns(times[len(times) // 2]) if times else "-"
+        total_bytes = sum(r["bytes"] for r in solved)
+        rate = f"{total_bytes / 2**20 / (total_ns / 1e9):.2f}" if total_ns else "-"
+        table.add_row(
+            year, str(len(solved)), str(failed), fmt_ns(total_ns), median, rate
+        )
+    cprint(table)
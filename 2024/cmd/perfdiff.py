@@ -0,0 +1,118 @@
+# cmd/perfdiff.py
+import argparse
+import sys
+
+from util.sols import cprint
+
+
+def parse_args(args):
+    # Create parser
+    desc = "Benchmark days and flag slowdowns against the timing history"
+    parser = argparse.ArgumentParser(description=desc)
+
+    # Define arguments for 'perfdiff' subcommand
+    days_help = "Days to check, e.g. '6', '1-14' or '1,3,5-7' (default: all)"
+    parser.add_argument("days", nargs="?", default="all", help=days_help)
+    threshold_help = "Percent median slowdown flagged as regression (default: 10)"
+    parser.add_argument(
+        "--threshold", "-t", type=float, default=10.0, help=threshold_help
+    )
+    baseline_help = "Compare against runs of this commit (default: the previous run)"
+    parser.add_argument(
+        "--baseline", type=str, default=None, metavar="COMMIT", help=baseline_help
+    )
+    runs_help = "Number of timed runs per part & input (default: 5)"
+    parser.add_argument("--runs", "-n", type=int, default=5, help=runs_help)
+    warmup_help = "Number of untimed warmup runs (default: 1)"
+    parser.add_argument("--warmup", type=int, default=1, help=warmup_help)
+    example_help = "Only check example inputs"
+    parser.add_argument("--example", "-e", action="store_true", help=example_help)
+    real_help = "Only check real inputs"
+    parser.add_argument("--real", "-r", action="store_true", help=real_help)
+    no_run_help = "Compare the latest recorded runs instead of benchmarking"
+    parser.add_argument("--no-run", action="store_true", help=no_run_help)
+
+    # Parse
+    args = parser.parse_args(args)
+    if args.runs < 1:
+        parser.error(f"--runs must be at least 1, got {args.runs}")
+    if args.warmup < 0:
+        parser.error(f"--warmup can't be negative, got {args.warmup}")
+    if not args.example and not args.real:
+        args.example = True
+        args.real = True
+    return args
+
+
+def main(args):
+    from rich.table import Table
+    from util.bench import bench_part, fmt_ns
+    from util.history import append, baseline, compare, git_commit, load
+    from util.history import input_hash, make_entry, same_run
+    from util.sols import input_paths, warm_day
+    from util.sweep import get_module, get_part_func, parse_days
+
+    args = parse_args(args)
+    try:
+        days = parse_days(args.days)
+    except ValueError as e:
+        cprint(str(e), style="bold red")
+        sys.exit(1)
+
+    # Latest entries to check, freshly benchmarked unless --no-run
+    history = load()
+    commit = git_commit()
+    current = []
+    for day in days:
+        paths = input_paths(day)
+        for part in ["1", "2"]:
+            kinds = [("EXAMPLE", args.example), ("INPUT", args.real)]
+            for (kind, wanted), fpath in zip(kinds, paths[part]):
+                func = get_part_func(day, part)
+                if not wanted or not fpath.exists() or func is None:
+                    continue
+                if args.no_run:
+                    probe = {"day": day, "part": part, "input": kind}
+                    probe["input_hash"] = input_hash(str(fpath))
+                    latest = [e for e in history if same_run(e, probe)]
+                    current.extend(latest[-1:])
+                    continue
+                cprint(f"Benchmarking Day {day} - Part {part} - {kind}...")
+                module = get_module(day)
+                warm_day(module)
+                parse_func = getattr(module, "parse", None)
+                result = bench_part(
+                    func, str(fpath), args.runs, args.warmup, parse_func=parse_func
+                )
+                current.append(make_entry(day, part, kind, str(fpath), result, commit))
+    if not args.no_run:
+        append(current)
+        history.extend(current)
+
+    table = Table(title=f"Median Solve Time vs Baseline (ms) - {commit}")
+    for col in ["Day", "Part", "Input", "Baseline", "Commit", "Current", "Change"]:
+        table.add_column(col, justify="right")
+    regressions = 0
+    for entry in current:
+        base = baseline(history, entry, args.baseline)
+        if base is None:
+            row = ["-", "-", fmt_ns(entry["stats_ns"]["median"]), "no baseline"]
+        else:
+            diff = compare(base, entry, args.threshold)
+            regressions += diff["regression"]
+            style = "red" if diff["regression"] else "green"
+            change = f"[{style}]{diff['change']:+.1f}%[/{style}]"
+            row = [
+                fmt_ns(diff["base_ns"]),
+                str(base.get("commit")),
+                fmt_ns(diff["current_ns"]),
+                change,
+            ]
+        table.add_row(entry["day"], entry["part"], entry["input"], *row)
+    cprint(table)
+
+    if regressions:
+        msg = f"{regressions} run(s) slower than baseline by over {args.threshold}%"
+        cprint(msg, style="bold red")
+        sys.exit(1)
+    cprint("No regressions", style="bold green")
@@ -0,0 +1,122 @@
+# cmd/scaling.py
+import argparse
+import sys
+from typing import List
+
+from util.sols import cprint
+
+
+def sizes_type(value: str) -> List[int]:
+    # Comma separated positive sizes, e.g. '64,128,256'
+    try:
+        sizes = [int(size) for size in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma separated ints: '{value}'")
+    if any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError(f"sizes must be at least 1: '{value}'")
+    return sizes
+
+
+def parse_args(args):
+    # Create parser
+    desc = "Fit how a day's solve time & memory grow with generated input size"
+    parser = argparse.ArgumentParser(description=desc)
+
+    # Define arguments for 'scaling' subcommand
+    parser.add_argument("day", type=str, help="Day with a generate hook (1-25)")
+    part_help = "Which part to scale (default: 1)"
+    parser.add_argument("--part", "-p", choices=["1", "2"], default="1", help=part_help)
+    sizes_help = "Comma separated sizes to generate (default: the day's sizes)"
+    parser.add_argument("--sizes", type=sizes_type, default=None, help=sizes_help)
+    budget_help = "Stop before larger sizes once a run takes SECONDS (default: 10)"
+    parser.add_argument(
+        "--budget", type=float, default=10.0, metavar="SECONDS", help=budget_help
+    )
+    no_mem_help = "Skip the tracemalloc run measuring peak memory of each size"
+    parser.add_argument("--no-mem", action="store_true", help=no_mem_help)
+    seed_help = "Seed passed to the generator (default: 0)"
+    parser.add_argument("--seed", type=int, default=0, help=seed_help)
+    json_help = "Write the points & fits as JSON to PATH, '-' for stdout"
+    parser.add_argument(
+        "--json", type=str, default=None, metavar="PATH", help=json_help
+    )
+
+    # Parse
+    args = parser.parse_args(args)
+    if not args.day.isdigit():
+        parser.error(f"invalid day '{args.day}', expected 1-25")
+    args.day = f"{int(args.day):02d}"
+    return args
+
+
+def main(args):
+    from rich.table import Table
+    from util.bench import fmt_ns, write_json
+    from util.memory import fmt_bytes
+    from util.scaling import SUPERLINEAR_K, fit_points, scale_part
+    from util.sweep import get_module, get_part_func
+
+    args = parse_args(args)
+    module = get_module(args.day)
+    generate = getattr(module, "generate", None)
+    if generate is None:
+        cprint(f"Day {args.day} has no generate(size, seed) hook", style="bold red")
+        sys.exit(1)
+    sizes = args.sizes if args.sizes else getattr(module, "GENERATE_SIZES")
+
+    def on_point(point):
+        msg = f"Size {point['size']}: {fmt_ns(point['ns'])} ms"
+        cprint(msg, style="blue")
+
+    cprint(f"Scaling Day {args.day} - Part {args.part}...", style="bold blue")
+    points = scale_part(
+        get_part_func(args.day, args.part),
+        generate,
+        sizes,
+        getattr(module, "parse", None),
+        args.budget,
+        not args.no_mem,
+        args.seed,
+        on_point,
+    )
+    fits = fit_points(points)
+
+    table = Table(title=f"Day {args.day} - Part {args.part} - Scaling")
+    for col in ["Size", "Bytes", "Answer", "Parse (ms)", "Solve (ms)", "Peak Mem"]:
+        table.add_column(col, justify="right")
+    for p in points:
+        table.add_row(
+            str(p["size"]),
+            str(p["bytes"]),
+            str(p["answer"]),
+            fmt_ns(p["parse_ns"]),
+            fmt_ns(p["ns"]),
+            fmt_bytes(p["peak_bytes"]),
+        )
+    cprint(table)
+
+    table = Table(title="Empirical Exponent k of measure ~ bytes^k")
+    for col in ["Measure", "k", "r^2"]:
+        table.add_column(col, justify="right")
+    for key, label in [("ns", "Solve"), ("parse_ns", "Parse"), ("peak_bytes", "Mem")]:
+        fit = fits[key]
+        if fit is None:
+            table.add_row(label, "-", "-")
+            continue
+        style = "red" if fit[0] > SUPERLINEAR_K else "green"
+        table.add_row(label, f"[{style}]{fit[0]:.2f}[/{style}]", f"{fit[1]:.3f}")
+    cprint(table)
+    stop = points[-1]["stop"] if points else None
+    if stop is not None and len(points) < len(sizes):
+        reasons = {
+            "no answer": "it gave no answer",
+            "over budget": f"it took over the {args.budget}s budget",
+        }
+        msg = f"Stopped after size {points[-1]['size']}, {reasons[stop]}"
+        cprint(msg, style="yellow")
+
+    if args.json:
+        write_json(
+            [{"day": args.day, "part": args.part, "points": points, "fits": fits}],
+            args.json,
+        )
@@ -0,0 +1,62 @@
+# cmd/serve.py
+import argparse
+import json
+import pathlib
+
+from util.sols import cprint
+
+
+def parse_args(args):
+    # Create parser
+    desc = "Keep solvers warm in a server answering requests on a Unix socket"
+    parser = argparse.ArgumentParser(description=desc)
+
+    # Define arguments for 'serve' subcommand
+    socket_help = "Path of the Unix socket (default: .cache/aoc.sock)"
+    parser.add_argument(
+        "--socket", "-s", type=pathlib.Path, default=None, help=socket_help
+    )
+    send_help = (
+        "Send a request like 'solve day 6 part 1 input example' "
+        "to a running server instead of serving"
+    )
+    parser.add_argument("--send", type=str, default=None, help=send_help)
+    no_cache_help = "Don't use the persistent answer cache"
+    parser.add_argument("--no-cache", action="store_true", help=no_cache_help)
+    no_preload_help = "Don't import every day when the server starts"
+    parser.add_argument("--no-preload", action="store_true", help=no_preload_help)
+
+    # Parse
+    args = parser.parse_args(args)
+    return args
+
+
+def main(args):
+    from util.daemon import PATH_SOCKET, SolveServer, WarmSolver, send
+
+    args = parse_args(args)
+    path = args.socket if args.socket is not None else PATH_SOCKET
+
+    if args.send is not None:
+        try:
+            reply = send(args.send, path)
+        except OSError as e:
+            cprint(f"Could not reach server at {path}: {e}", style="bold red")
+            exit(1)
+        print(json.dumps(reply))
+        return
+
+    solver = WarmSolver(use_cache=not args.no_cache)
+    if not args.no_preload:
+        from util.sweep import discover_days
+
+        days = discover_days()
+        cprint(f"Preloading {len(days)} days...", style="blue")
+        solver.preload(days)
+
+    with SolveServer(path, solver) as server:
+        cprint(f"Serving on {path}, Ctrl+C to stop", style="bold green")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            cprint("Stopping server", style="blue")
@@ -3,11 +3,16 @@ import argparse
 import pathlib
 from rich import rule
 import sys
+import time
 
-from typing import List, Callable
+from typing import Any, List, Callable, Dict, Optional, Tuple
 
-from util.sols import dynamic_import, execute_part
+from util.sols import load_day, execute_part, get_parser, input_paths, warm_day
 from util.sols import print_solution, cprint
+from util.cache import AnswerCache
+
+# NOTE: Helpers only used by one mode (bench, sweep, profile, mem) and
+# rich tables are imported inside the functions using them to keep startup fast
 
 
 def parser_factory() -> argparse.ArgumentParser:
@@ -18,7 +23,31 @@ def parser_factory() -> argparse.ArgumentParser:
 
     # Define arguments for 'solve' subcommand
     parser.add_argument(
-        "day", type=int, help="Day of the Advent of Code problem to solve (1-25)"
+        "day",
+        type=str,
+        nargs="?",
+        default=None,
+        help="Day of the Advent of Code problem to solve (1-25) or 'all'",
+    )
+    parser.add_argument(
+        "--days",
+        type=str,
+        default=None,
+        metavar="SPEC",
+        help="Solve a range of days in parallel, e.g. '1-14' or '1,3,5-7'",
+    )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=None,
+        help="Process pool size for multi-day solves (default: cpu count)",
+    )
+    parser.add_argument(
+        "--concurrent",
+        "-c",
+        action="store_true",
+        help="Solve all parts & inputs of the day at once in a process pool",
     )
     parser.add_argument(
         "--part",
@@ -45,6 +74,126 @@ def parser_factory() -> argparse.ArgumentParser:
         action="store_true",
         help="Whether to print debug information (default: no)",
     )
+    parser.add_argument(
+        "--bench",
+        "-b",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Benchmark each part & input with N timed runs (default: off)",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        metavar="W",
+        help="Number of untimed warmup runs before benchmarking (default: 1)",
+    )
+    parser.add_argument(
+        "--json",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write benchmark results as JSON to PATH, '-' for stdout",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Don't record benchmark results in the timing history",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run each part & input once under cProfile (default: no)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=15,
+        metavar="N",
+        help="Number of functions to list by cumulative & self time (default: 15)",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=pathlib.Path,
+        default=None,
+        metavar="DIR",
+        help="Where to write .pstats & .collapsed files (default: .cache/profiles)",
+    )
+    parser.add_argument(
+        "--sample",
+        action="store_true",
+        help="Run each part & input once under the sampling profiler, which"
+        " barely slows tight loops & follows the solver's process pools",
+    )
+    parser.add_argument(
+        "--sample-hz",
+        type=float,
+        default=200.0,
+        metavar="HZ",
+        help="Stack samples per second of --sample (default: 200)",
+    )
+    parser.add_argument(
+        "--mem",
+        action="store_true",
+        help="Run each part & input once under tracemalloc (default: no)",
+    )
+    parser.add_argument(
+        "--mem-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of top allocation sites to list (default: 10)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Solve each part in a child process killed after SECONDS",
+    )
+    parser.add_argument(
+        "--max-mem",
+        type=int,
+        default=None,
+        metavar="MB",
+        help="Solve each part in a child process with address space capped at MB",
+    )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Don't show the live rate of work solvers report while solving",
+    )
+    parser.add_argument(
+        "--variant",
+        type=str,
+        action="append",
+        default=None,
+        metavar="NAME",
+        help="Race the day's main solve.py against alternate implementation NAME,"
+        " e.g. 'try1' for 09/try1.py, repeatable",
+    )
+    parser.add_argument(
+        "--all-variants",
+        action="store_true",
+        help="Race every implementation of the day & rank them by speed",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["rich", "ndjson"],
+        default="rich",
+        help="Output rich panels or one JSON object per line (default: rich)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the solvers instead of using cached answers",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print answer cache hits, misses & size after solving",
+    )
     return parser
 
 
@@ -53,8 +202,52 @@ def parse_args(args):
     args = parser.parse_args(args)  # Parse
 
     # Here we make some small adjustments to the parsed arguments
-    # First zero pad the day number as a string
-    args.day = f"{args.day:02d}"
+    # First work out if this is a multi-day sweep or a single day
+    if args.day is None and args.days is None:
+        parser.error("either a day or --days is required")
+    if args.days is None and args.day == "all":
+        args.days = "all"
+    if args.bench < 0:
+        parser.error(f"--bench can't be negative, got {args.bench}")
+    if args.warmup < 0:
+        parser.error(f"--warmup can't be negative, got {args.warmup}")
+    modes = [args.bench > 0, args.profile, args.sample, args.mem]
+    measured = any(modes)
+    if sum(modes) > 1:
+        parser.error("only one of --bench, --profile, --sample & --mem can be used")
+    if args.days is not None and measured:
+        parser.error("--bench, --profile, --sample & --mem only work for a single day")
+    if args.concurrent and measured:
+        parser.error(
+            "--concurrent can't be combined with --bench, --profile, --sample & --mem"
+        )
+    if args.format == "ndjson" and measured:
+        parser.error(
+            "--format ndjson can't be combined with"
+            " --bench, --profile, --sample & --mem"
+        )
+    limited = args.timeout is not None or args.max_mem is not None
+    if limited and (args.days is not None or measured or args.concurrent):
+        parser.error(
+            "--timeout & --max-mem only work when solving a single day"
+            " without --concurrent"
+        )
+    variants = args.variant is not None or args.all_variants
+    others = [args.days, args.profile, args.sample, args.mem, args.concurrent, limited]
+    if variants and (any(others) or args.format == "ndjson"):
+        parser.error("--variant & --all-variants only work with a single day & --bench")
+    if args.days is not None:
+        from util.sweep import parse_days
+
+        try:
+            args.days = parse_days(args.days)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        # Zero pad the single day number as a string
+        if not args.day.isdigit():
+            parser.error(f"invalid day '{args.day}', expected 1-25 or 'all'")
+        args.day = f"{int(args.day):02d}"
 
     # If both example and real flags are unset, set both to True
     if not args.example and not args.real:
@@ -75,8 +268,9 @@ SolverType = Callable[[str, bool], int]
 
 
 def get_solvers(day: str, part: str) -> List[SolverType]:
-    # Dynamically import the module for the specified day
-    solver_module = dynamic_import(day)
+    # Get the module for the specified day, imported only once per process
+    # Parts & parse hook must come from the same module for shared types
+    solver_module = load_day(day)
 
     solvers = []  # Init the list of solvers
     # Check part 1 is requested and exists then add to solvers
@@ -95,12 +289,499 @@ def get_solvers(day: str, part: str) -> List[SolverType]:
     return solvers
 
 
+RunType = Tuple[str, str, pathlib.Path]
+
+
+def get_runs(args, day: Optional[str] = None) -> List[RunType]:
+    """
+    Build the list of (part, kind, path) runs requested by the arguments.
+    Kind is either EXAMPLE or INPUT, in the order they have always run in:
+    part 1 example, part 1 input, part 2 example, part 2 input.
+    The day defaults to args.day.
+    """
+    day = day if day else args.day
+    paths = input_paths(day)
+    runs = []
+    for part in ["1", "2"]:
+        if part not in args.part:
+            continue
+        if args.example:
+            runs.append((part, "EXAMPLE", paths[part][0]))
+        if args.real:
+            runs.append((part, "INPUT", paths[part][1]))
+    return runs
+
+
+def bench(
+    args,
+    solvers: List[SolverType],
+    runs: List[RunType],
+    parse_func: Optional[Callable[[str], Any]] = None,
+) -> None:
+    """
+    Benchmark every run and print a table of timing stats in milliseconds.
+    Solve stats exclude parsing, the median parse time gets its own column.
+    Results are appended to the timing history unless --no-history is set.
+    """
+    from rich.table import Table
+    from util.bench import bench_part, fmt_ns, write_json
+    from util.history import append, make_entry
+
+    results, entries = [], []
+    for part, kind, fpath in runs:
+        cprint(f"Benchmarking Part {part} - {kind}...", style="blue")
+        result = bench_part(
+            solvers[int(part) - 1],
+            str(fpath),
+            args.bench,
+            args.warmup,
+            args.debug,
+            parse_func,
+        )
+        results.append({"day": args.day, "part": part, "input": kind, **result})
+        if not args.no_history:
+            entries.append(make_entry(args.day, part, kind, str(fpath), result))
+
+    table = Table(title=f"Day {args.day} - {args.bench} runs (ms)")
+    cols = ["Part", "Input", "Answer", "Min", "Median", "P95", "StdDev"]
+    for col in cols + (["Parse"] if parse_func is not None else []):
+        table.add_column(col, justify="right")
+    for r in results:
+        stats = r["stats_ns"]
+        parse = [fmt_ns(r["parse_stats_ns"]["median"])] if "parse_ns" in r else []
+        table.add_row(
+            r["part"],
+            r["input"],
+            str(r["answer"]),
+            *[fmt_ns(stats[k]) for k in ["min", "median", "p95", "stddev"]],
+            *parse,
+        )
+    cprint(table)
+
+    if entries:
+        append(entries)
+
+    if args.json:
+        write_json(results, args.json)
+
+
+def profile(
+    args,
+    solvers: List[SolverType],
+    runs: List[RunType],
+    parse_func: Optional[Callable[[str], Any]] = None,
+) -> None:
+    """
+    Profile every run once, printing the top functions by cumulative
+    & self time and writing .pstats & collapsed stack files for each.
+    """
+    from rich.table import Table
+    from util.profiling import PATH_PROFILES, profile_part, top_functions
+    from util.profiling import write_profile
+
+    profile_dir = args.profile_dir if args.profile_dir else PATH_PROFILES
+    for part, kind, fpath in runs:
+        title = f"Day {args.day} - Part {part} - {kind}"
+        answer, stats = profile_part(
+            solvers[int(part) - 1], str(fpath), args.debug, parse_func
+        )
+        cprint(rule.Rule(title=f"Profile of {title} - Answer: {answer}"))
+
+        for sort, label in [("cumulative", "Cumulative"), ("tottime", "Self")]:
+            table = Table(title=f"Top {args.profile_top} by {label} Time (ms)")
+            for col in ["Function", "Calls", "Self", "Cumulative"]:
+                table.add_column(col, justify="left" if col == "Function" else "right")
+            for row in top_functions(stats, sort, args.profile_top):
+                table.add_row(
+                    row["func"],
+                    str(row["ncalls"]),
+                    f"{row['tottime'] * 1e3:.3f}",
+                    f"{row['cumtime'] * 1e3:.3f}",
+                )
+            cprint(table)
+
+        name = f"day{args.day}-part{part}-{kind.lower()}"
+        path_pstats, path_collapsed = write_profile(stats, name, profile_dir)
+        cprint(f"Wrote {path_pstats}", style="blue")
+        cprint(f"Wrote {path_collapsed}", style="blue")
+
+
+def sample(
+    args,
+    solvers: List[SolverType],
+    runs: List[RunType],
+    parse_func: Optional[Callable[[str], Any]] = None,
+) -> None:
+    """
+    Sample every run once, printing the hottest source lines and writing
+    a collapsed stack file of the samples for each.
+    """
+    from rich.markup import escape
+    from rich.table import Table
+    from util.profiling import PATH_PROFILES
+    from util.sampling import hot_lines, sample_part, write_samples
+
+    profile_dir = args.profile_dir if args.profile_dir else PATH_PROFILES
+    for part, kind, fpath in runs:
+        title = f"Day {args.day} - Part {part} - {kind}"
+        answer, result = sample_part(
+            solvers[int(part) - 1], str(fpath), args.debug, parse_func, args.sample_hz
+        )
+        cprint(rule.Rule(title=f"Samples of {title} - Answer: {answer}"))
+        total = sum(result["samples"].values())
+        msg = f"{total} samples over {result['seconds'] * 1e3:.3f} ms"
+        if result["worker_samples"]:
+            msg += f", {result['worker_samples']} from pool workers"
+        cprint(msg, style="blue")
+
+        table = Table(title=f"Top {args.profile_top} Hot Lines")
+        for col in ["Line", "Source", "Samples", "%"]:
+            table.add_column(col, justify="right" if col in "Samples %" else "left")
+        for row in hot_lines(result["samples"], args.profile_top):
+            table.add_row(
+                row["line"],
+                escape(row["source"]),
+                str(row["samples"]),
+                f"{row['percent']:.1f}",
+            )
+        cprint(table)
+
+        name = f"day{args.day}-part{part}-{kind.lower()}"
+        cprint(f"Wrote {write_samples(result['samples'], name, profile_dir)}")
+
+
+def mem(
+    args,
+    solvers: List[SolverType],
+    runs: List[RunType],
+    parse_func: Optional[Callable[[str], Any]] = None,
+) -> None:
+    """
+    Measure every run's peak traced memory & max RSS growth once,
+    printing a summary table followed by each run's top allocation sites.
+    """
+    from rich.table import Table
+    from util.memory import fmt_bytes, mem_part
+
+    results = []
+    for part, kind, fpath in runs:
+        cprint(f"Measuring memory of Part {part} - {kind}...", style="blue")
+        result = mem_part(
+            solvers[int(part) - 1], str(fpath), args.debug, parse_func, args.mem_top
+        )
+        results.append({"part": part, "input": kind, **result})
+
+    table = Table(title=f"Day {args.day} - Memory")
+    for col in [
+        "Part",
+        "Input",
+        "Answer",
+        "Peak Traced",
+        "Max RSS Δ",
+        "Children RSS Δ",
+    ]:
+        table.add_column(col, justify="right")
+    for r in results:
+        table.add_row(
+            r["part"],
+            r["input"],
+            str(r["answer"]),
+            fmt_bytes(r["peak_bytes"]),
+            fmt_bytes(r["rss_delta_bytes"]),
+            fmt_bytes(r["rss_children_delta_bytes"]),
+        )
+    cprint(table)
+
+    for r in results:
+        title = f"Part {r['part']} - {r['input']} - Top Allocation Sites near Peak"
+        table = Table(title=title)
+        for col in ["Site", "Size", "Blocks"]:
+            table.add_column(col, justify="left" if col == "Site" else "right")
+        for site in r["top"]:
+            table.add_row(site["site"], fmt_bytes(site["bytes"]), str(site["count"]))
+        cprint(table)
+
+
+def solve_limited(args, runs: List[RunType]) -> None:
+    """
+    Solve every run in a child process bounded by --timeout & --max-mem,
+    reporting runs that time out or run out of memory and carrying on.
+    Answers are still looked up in & stored to the cache by this process.
+    """
+    from util.bench import fmt_ns
+    from util.limits import OK, run_limited
+    from util.sweep import get_part_func
+
+    cache = None if args.no_cache else AnswerCache()
+    for part, kind, fpath in runs:
+        title = f"Day {args.day} - Part {part} - {kind}"
+        func = get_part_func(args.day, part)
+        key = cache.key(func, str(fpath)) if cache and not args.debug else None
+        answer = cache.get(key) if cache is not None and key is not None else None
+        if answer is not None:
+            print_solution(str(answer), title=title)
+            continue
+
+        result = run_limited(
+            args.day, part, str(fpath), args.debug, args.timeout, args.max_mem
+        )
+        answer = result["answer"]
+        if result["status"] != OK:
+            msg = f"{result['status'].capitalize()} for {title}: {result['error']}"
+            cprint(msg, style="bold red")
+        elif isinstance(answer, int) and answer:
+            print_solution(str(answer), title=title)
+            if cache is not None and key is not None:
+                cache.put(key, answer)
+        else:
+            cprint(f"No solution found for {title}", style="bold red")
+        msg = f"Parse: {fmt_ns(result['parse_ns'])} ms - "
+        msg += f"Solve: {fmt_ns(result['ns'])} ms"
+        cprint(msg, style="blue", justify="center")
+
+    if args.cache_stats and cache is not None:
+        print_cache_stats(cache.stats())
+
+
+def solve_concurrent(args, runs: List[RunType]) -> None:
+    """
+    Solve every run at once in a process pool, printing each solution panel
+    as soon as it's done, then a summary table in the usual run order.
+    """
+    from rich.table import Table
+    from util.bench import fmt_ns
+    from util.sweep import stream_jobs
+
+    jobs = [(args.day, part, kind, str(fpath)) for part, kind, fpath in runs]
+
+    def on_result(r: Dict[str, Any]) -> None:
+        title = f"Day {r['day']} - Part {r['part']} - {r['input']}"
+        if isinstance(r["answer"], int) and r["answer"]:
+            print_solution(str(r["answer"]), title=title)
+        else:
+            cprint(f"No solution found for {title}", style="bold red")
+
+    tstart = time.perf_counter_ns()
+    results = stream_jobs(jobs, on_result, args.workers, args.debug, not args.no_cache)
+    wall_ns = time.perf_counter_ns() - tstart
+
+    table = Table(title=f"Day {args.day} - Summary (ms)")
+    for col in ["Part", "Input", "Answer", "Parse", "Solve"]:
+        table.add_column(col, justify="right")
+    for r in results:
+        answer = str(r["answer"]) if r["error"] is None else f"[red]{r['error']}[/red]"
+        parse = fmt_ns(r["parse_ns"]) if r["parse_ns"] else "-"
+        table.add_row(r["part"], r["input"], answer, parse, fmt_ns(r["ns"]))
+    cprint(table)
+    total_ns = sum(r["ns"] + r["parse_ns"] for r in results)
+    msg = f"Wall time: {fmt_ns(wall_ns)} ms - Summed job time: {fmt_ns(total_ns)} ms"
+    cprint(msg, style="bold blue")
+
+
+def race_variants(args, runs: List[RunType]) -> None:
+    """
+    Solve every run with each implementation of the day, check they agree
+    with the main solve.py (or the first to answer) & rank them by speed.
+    Each is timed with its parse included, the fastest of --bench runs.
+    """
+    from rich.table import Table
+    from util.adapters import MAIN_VARIANTS, discover_variants, run_year_job
+    from util.bench import fmt_ns
+
+    available = discover_variants("2024", args.day)
+    if args.all_variants:
+        variants = available
+    else:
+        variants = [MAIN_VARIANTS["2024"]] + [
+            v for v in args.variant if v != MAIN_VARIANTS["2024"]
+        ]
+    unknown = [v for v in variants if v not in available]
+    if unknown:
+        cprint(
+            f"Unknown variants {unknown}, Day {args.day} has {available}",
+            style="bold red",
+        )
+        sys.exit(1)
+
+    mismatch = False
+    for part, kind, fpath in runs:
+        title = f"Day {args.day} - Part {part} - {kind}"
+        if not fpath.exists():
+            cprint(f"No input for {title}: {fpath} not found", style="bold red")
+            continue
+        job = ("2024", args.day, part, kind, str(fpath))
+        results = {v: run_year_job(job, max(args.bench, 1), v) for v in variants}
+        answers = [r["answer"] for r in results.values() if r["error"] is None]
+        expected = answers[0] if answers else None
+        solved = sorted((r["ns"], v) for v, r in results.items() if r["error"] is None)
+        fastest = solved[0][0] if solved else 0
+
+        table = Table(title=f"{title} - Variants (ms)")
+        for col in ["Rank", "Variant", "Answer", "Time", "Slowdown", "Agrees"]:
+            table.add_column(col, justify="left" if col == "Variant" else "right")
+        for rank, (ns, v) in enumerate(solved, start=1):
+            agrees = results[v]["answer"] == expected
+            mismatch |= not agrees
+            slowdown = f"{ns / fastest:.2f}x" if fastest else "-"
+            mark = "[green]yes[/green]" if agrees else "[bold red]NO[/bold red]"
+            row = [str(rank), v, str(results[v]["answer"]), fmt_ns(ns), slowdown]
+            table.add_row(*row, mark)
+        for v, r in results.items():
+            if r["error"] is not None:
+                table.add_row("-", v, f"[red]{r['error']}[/red]", "-", "-", "-")
+        cprint(table)
+
+    if mismatch:
+        cprint("Variants disagree on some answers", style="bold red")
+        sys.exit(1)
+
+
+def solve_ndjson(args) -> None:
+    """
+    Solve like the other modes but write one JSON object per day, part &
+    input to stdout, with the answer, solve & parse ns, the peak RSS of the
+    process while that job ran and any error. Rich output like solver errors
+    is sent to stderr instead. Multiple days or --concurrent stream from a
+    process pool as jobs finish, --timeout & --max-mem run each in a child.
+    """
+    import json
+    from util.sols import console
+    from util.sweep import run_job, stream_jobs
+
+    console.file = sys.stderr
+
+    def emit(result: Dict[str, Any]) -> None:
+        answer = result["answer"]
+        if hasattr(answer, "item"):
+            result["answer"] = answer.item()  # NumPy scalars
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+    def missing(day: str, part: str, kind: str, fpath: pathlib.Path) -> None:
+        result = {"day": day, "part": part, "input": kind, "cached": False}
+        result.update({"answer": None, "ns": 0, "parse_ns": 0})
+        emit({**result, "max_rss_bytes": None, "error": f"input not found: {fpath}"})
+
+    # Missing inputs are reported without sending them to a solver
+    if args.days is not None or args.concurrent:
+        jobs = []
+        for day in args.days if args.days is not None else [args.day]:
+            for part, kind, fpath in get_runs(args, day):
+                if fpath.exists():
+                    jobs.append((day, part, kind, str(fpath)))
+                else:
+                    missing(day, part, kind, fpath)
+        stream_jobs(jobs, emit, args.workers, args.debug, not args.no_cache)
+        return
+
+    # Bounded runs solve each part & input in its own child process
+    if args.timeout is not None or args.max_mem is not None:
+        from util.limits import OK, run_limited
+
+        for part, kind, path in get_runs(args):
+            if not path.exists():
+                missing(args.day, part, kind, path)
+                continue
+            r = run_limited(
+                args.day, part, str(path), args.debug, args.timeout, args.max_mem
+            )
+            error = None if r["answer"] is not None else "no solution"
+            if r["status"] != OK:
+                error = f"{r['status']}: {r['error']}"
+            result = {"day": args.day, "part": part, "input": kind, "cached": False}
+            result.update({k: r[k] for k in ["answer", "ns", "parse_ns"]})
+            emit({**result, "max_rss_bytes": r["max_rss_bytes"], "error": error})
+        return
+
+    # A single day is solved in process, parsing each input once for both parts
+    parser = get_parser(load_day(args.day))
+    for part, kind, path in get_runs(args):
+        if not path.exists():
+            missing(args.day, part, kind, path)
+            continue
+        job = (args.day, part, kind, str(path))
+        emit(run_job(job, args.debug, not args.no_cache, parser))
+
+
+def sweep(args) -> None:
+    """
+    Solve every requested day, part & input in a process pool.
+    Prints one timing table sorted by cost, most expensive job first.
+    """
+    from rich.table import Table
+    from util.bench import fmt_ns
+    from util.sweep import run_jobs
+
+    # Missing input files are skipped rather than failing in a worker
+    jobs, skipped = [], []
+    for day in args.days:
+        for part, kind, fpath in get_runs(args, day):
+            if fpath.exists():
+                jobs.append((day, part, kind, str(fpath)))
+            else:
+                skipped.append(f"{day}/{fpath.name}")
+    if skipped:
+        cprint(f"Skipping missing inputs: {', '.join(skipped)}", style="yellow")
+    if not jobs:
+        cprint("No jobs to solve", style="bold red")
+        sys.exit(1)
+
+    cprint(rule.Rule(title=f"Solving {len(jobs)} jobs across {len(args.days)} days"))
+    tstart = time.perf_counter_ns()
+    results = run_jobs(jobs, args.workers, args.debug, not args.no_cache)
+    wall_ns = time.perf_counter_ns() - tstart
+
+    table = Table(title="Advent of Code 2024 - Solve Times (ms)")
+    for col in ["Day", "Part", "Input", "Answer", "Parse", "Solve"]:
+        table.add_column(col, justify="right")
+    for r in results:
+        answer = str(r["answer"]) if r["error"] is None else f"[red]{r['error']}[/red]"
+        parse = fmt_ns(r["parse_ns"]) if r["parse_ns"] else "-"
+        table.add_row(r["day"], r["part"], r["input"], answer, parse, fmt_ns(r["ns"]))
+    cprint(table)
+
+    total_ns = sum(r["ns"] + r["parse_ns"] for r in results)
+    msg = f"Wall time: {fmt_ns(wall_ns)} ms - Summed job time: {fmt_ns(total_ns)} ms"
+    cprint(msg, style="bold blue")
+
+    if args.cache_stats:
+        # Workers keep their own counters so tally hits from the results
+        stats = AnswerCache().stats()
+        stats["hits"] = sum(r["cached"] for r in results)
+        stats["misses"] = len(results) - stats["hits"]
+        print_cache_stats(stats)
+
+
+def print_cache_stats(stats: Dict[str, int]) -> None:
+    """
+    Print the answer cache statistics on one line.
+    """
+    msg = ", ".join(f"{k}: {v}" for k, v in stats.items())
+    cprint(f"Answer cache - {msg}", style="bold blue")
+
+
 def main(args):
     args = parse_args(args)
 
-    # Set day's title via dynamic import
+    # Machine readable output skips every rich rendering below
+    if args.format == "ndjson":
+        solve_ndjson(args)
+        return
+
+    # Racing implementations against each other skips the usual solve
+    if args.variant is not None or args.all_variants:
+        race_variants(args, get_runs(args))
+        return
+
+    # Multiple days get solved in parallel instead
+    if args.days is not None:
+        sweep(args)
+        return
+
+    # Set day's title & optional parse hook via dynamic import
     YEAR = str(2024)
-    title = getattr(dynamic_import(args.day), "TITLE", None)
+    module = load_day(args.day)
+    title = getattr(module, "TITLE", None)
     title = title if title else "CANNOT FIND TITLE!!!"
 
     # Print the Title of the Day and solving prompt
@@ -125,58 +806,79 @@ def main(args):
     if len(solvers) < 2 and "2" in args.part:
         solvers.append(solvers[0])
 
-    # Calculate paths for solvers to use as input
-    path_aoc = pathlib.Path(__file__).parent.parent
-    path_real = path_aoc / args.day / "input.txt"
-    path_real2 = path_aoc / args.day / "input2.txt"
-    path_ex = path_aoc / args.day / "example.txt"
-    path_ex2 = path_aoc / args.day / "example2.txt"
-    sol1_ex, sol1_r, sol2_ex, sol2_r = None, None, None, None
-
-    # If either example2.txt or input2.txt doesn't exist set to None
-    if not path_ex2.exists():
-        path_ex2 = path_ex
-    if not path_real2.exists():
-        path_real2 = path_real
-
-    # First run the first part's solver with example data if requested
+    # Calculate the (part, input) runs requested
+    runs = get_runs(args)
+
+    # Heavy imports a day defers are paid here, not by its first timed part
+    warm_day(module)
+
+    # Benchmark mode replaces the single solve of each run
+    if args.bench > 0:
+        bench(args, solvers, runs, getattr(module, "parse", None))
+        return
+
+    # Profile mode likewise replaces it, always bypassing the answer cache
+    if args.profile:
+        profile(args, solvers, runs, getattr(module, "parse", None))
+        return
+
+    # As does sampling mode
+    if args.sample:
+        sample(args, solvers, runs, getattr(module, "parse", None))
+        return
+
+    # And memory mode
+    if args.mem:
+        mem(args, solvers, runs, getattr(module, "parse", None))
+        return
+
+    # Bounded runs solve each part & input in its own child process
+    if args.timeout is not None or args.max_mem is not None:
+        solve_limited(args, runs)
+        return
+
+    # Concurrent runs stream each solution as soon as its worker is done
+    if args.concurrent:
+        solve_concurrent(args, runs)
+        return
+
+    from util.progress import WorkSampler
+
+    # Run each requested part & input combination in order
     # FIXME: Weird bug where if sol is 0 it thinks no solution found
-    if args.example and "1" in args.part:
-        sol1_ex = execute_part(solvers[0], path_ex, args.debug)
-        sol1_ex = sol1_ex if isinstance(sol1_ex, int) else None
+    cache = None if args.no_cache else AnswerCache()
+    # Days with a parse hook parse each input once for both parts
+    parser = get_parser(module)
+    for part, kind, fpath in runs:
+        parsed = set(parser.times_ns) if parser is not None else set()
+        # Solvers reporting work through util.sols.work get a live rate
+        sampler = WorkSampler(live=not args.no_progress)
+        sampler.start()
+        tstart = time.perf_counter_ns()
+        sol = execute_part(
+            solvers[int(part) - 1], str(fpath), args.debug, cache, parser
+        )
+        elapsed = time.perf_counter_ns() - tstart
+        sampler.stop()
+        # Only charge parse time to the run that actually parsed the input
+        parse_ns = 0
+        if parser is not None and str(fpath) not in parsed:
+            parse_ns = parser.times_ns.get(str(fpath), 0)
+        sol = sol if isinstance(sol, int) else None
         # Print the solution for part if it exists
-        if sol1_ex:
-            print_solution(str(sol1_ex), title=f"Day {args.day} - Part 1 - EXAMPLE")
+        if sol:
+            print_solution(str(sol), title=f"Day {args.day} - Part {part} - {kind}")
         else:
-            msg = f"No solution found for Day {args.day} - Part 1 - EXAMPLE"
+            msg = f"No solution found for Day {args.day} - Part {part} - {kind}"
             cprint(msg, style="bold red")
+        if parser is not None:
+            from util.bench import fmt_ns
 
-    # Next run the first part's solver with real data if requested
-    if args.real and "1" in args.part:
-        sol1_r = execute_part(solvers[0], path_real, args.debug)
-        sol1_r = sol1_r if isinstance(sol1_r, int) else None
-        if sol1_r:
-            print_solution(str(sol1_r), title=f"Day {args.day} - Part 1 - INPUT")
-        else:
-            msg = f"No solution found for Day {args.day} - Part 1 - INPUT"
-            cprint(msg, style="bold red")
+            solve_ns = elapsed - parse_ns
+            msg = f"Parse: {fmt_ns(parse_ns)} ms - Solve: {fmt_ns(solve_ns)} ms"
+            cprint(msg, style="blue", justify="center")
+        if sampler.summary() is not None:
+            cprint(f"Work: {sampler.summary()}", style="blue", justify="center")
 
-    # Next run the second part's solver with example data if requested
-    if args.example and "2" in args.part:
-        sol2_ex = execute_part(solvers[1], path_ex2, args.debug)
-        sol2_ex = sol2_ex if isinstance(sol2_ex, int) else None
-        if sol2_ex:
-            print_solution(str(sol2_ex), title=f"Day {args.day} - Part 2 - EXAMPLE")
-        else:
-            msg = f"No solution found for Day {args.day} - Part 2 - EXAMPLE"
-            cprint(msg, style="bold red")
-
-    # Finally run the second part's solver with real data if requested
-    if args.real and "2" in args.part:
-        sol2_r = execute_part(solvers[1], path_real2, args.debug)
-        sol2_r = sol2_r if isinstance(sol2_r, int) else None
-        if sol2_r:
-            print_solution(str(sol2_r), title=f"Day {args.day} - Part 2 - INPUT")
-        else:
-            msg = f"No solution found for Day {args.day} - Part 2 - INPUT"
-            cprint(msg, style="bold red")
+    if args.cache_stats and cache is not None:
+        print_cache_stats(cache.stats())
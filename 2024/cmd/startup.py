@@ -0,0 +1,60 @@
+# cmd/startup.py
+import argparse
+
+from util.sols import cprint
+
+
+def parse_args(args):
+    # Create parser
+    desc = "Benchmark cold start import time of the AOC runner"
+    parser = argparse.ArgumentParser(description=desc)
+
+    # Define arguments for 'startup' subcommand
+    module_help = "Module to cold import (default: cmd.solve)"
+    parser.add_argument("module", nargs="?", default="cmd.solve", help=module_help)
+    runs_help = "Number of cold starts to time (default: 10)"
+    parser.add_argument("--runs", "-n", type=int, default=10, help=runs_help)
+    top_help = "Number of slowest imports to list (default: 15)"
+    parser.add_argument("--top", "-t", type=int, default=15, help=top_help)
+    json_help = "Write the results as JSON to PATH, '-' for stdout"
+    parser.add_argument(
+        "--json", type=str, default=None, metavar="PATH", help=json_help
+    )
+
+    # Parse
+    args = parser.parse_args(args)
+    if args.runs < 1:
+        parser.error(f"--runs must be at least 1, got {args.runs}")
+    return args
+
+
+def main(args):
+    from rich.table import Table
+    from util.bench import fmt_ns, summarize, write_json
+    from util.startup import measure_startup
+
+    args = parse_args(args)
+    cprint(f"Timing {args.runs} cold imports of {args.module}...", style="blue")
+    result = measure_startup(args.module, args.runs)
+
+    wall = summarize(result["wall_ns"])
+    imports = summarize([us * 1000 for us in result["import_us"]])
+    table = Table(title=f"Cold Start of {args.module} (ms)")
+    for col in ["Measure", "Min", "Median", "P95", "StdDev"]:
+        table.add_column(col, justify="right")
+    for label, stats in [("Process wall", wall), ("Imports", imports)]:
+        table.add_row(
+            label, *[fmt_ns(stats[k]) for k in ["min", "median", "p95", "stddev"]]
+        )
+    cprint(table)
+
+    table = Table(title=f"Top {args.top} Imports by Cumulative Time (ms)")
+    for col in ["Module", "Self", "Cumulative"]:
+        table.add_column(col, justify="left" if col == "Module" else "right")
+    slowest = sorted(result["imports"], key=lambda imp: imp[2], reverse=True)
+    for module, self_us, cumulative_us in slowest[: args.top]:
+        table.add_row(module, f"{self_us / 1e3:.3f}", f"{cumulative_us / 1e3:.3f}")
+    cprint(table)
+
+    if args.json:
+        write_json([result], args.json)
@@ -1,10 +1,19 @@
 import argparse
 import datetime
+import hashlib
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "https://adventofcode.com"
+
+# Pages fetched at once by the bulk mode, AoC asks to keep automated load low
+DEFAULT_WORKERS = 4
 
 
 def get_default_year(months_delay=4) -> int:
@@ -19,19 +28,50 @@ def get_default_year(months_delay=4) -> int:
     return today.year
 
 
-def parse_args_year_day():
+def parse_days(spec: str) -> List[int]:
+    """
+    Parse a day spec like 'all', '6', '1-14' or '1,3,5-7' into days.
+    """
+    if spec == "all":
+        return list(range(1, 26))
+    days = set()
+    for chunk in spec.split(","):
+        if "-" in chunk:
+            start, end = chunk.split("-", 1)
+            days.update(range(int(start), int(end) + 1))
+        else:
+            days.add(int(chunk))
+    if any(day < 1 or day > 25 for day in days):
+        raise ValueError(f"Days must be between 1 and 25, got '{spec}'")
+    return sorted(days)
+
+
+def parse_args(args=None):
     # Parse 1st positional argument for day, can only be 1 to 25 inclusive.
+    # Or --days for a range of days fetched at once over pooled connections.
     # Optional kw argument --year or -y overrides the default year (this year).
     ap = argparse.ArgumentParser()
     msg = "The day of the month to download"
-    day_params = {"type": int, "choices": range(1, 26), "help": msg}
+    day_params = {"type": int, "choices": range(1, 26), "nargs": "?", "help": msg}
     ap.add_argument("day", **day_params)
+    msg = "Download a range of days at once, e.g. 'all', '1-14' or '1,3,5-7'"
+    ap.add_argument("--days", type=str, default=None, metavar="SPEC", help=msg)
     yr = get_default_year()
     msg = f"The year to download from (default: {yr})"
     year_params = {"type": int, "default": yr, "help": msg}
     ap.add_argument("--year", "-y", **year_params)
-    args = ap.parse_args()
-    return args.year, args.day
+    msg = f"Pages downloaded at once with --days (default: {DEFAULT_WORKERS})"
+    ap.add_argument("--workers", "-j", type=int, default=DEFAULT_WORKERS, help=msg)
+    msg = "Always download pages instead of revalidating cached copies"
+    ap.add_argument("--no-cache", action="store_true", help=msg)
+    args = ap.parse_args(args)
+    if (args.day is None) == (args.days is None):
+        ap.error("either a day or --days is required")
+    try:
+        args.days = parse_days(args.days) if args.days else [args.day]
+    except ValueError as e:
+        ap.error(str(e))
+    return args
 
 
 def get_cookie_token(file=".token.txt") -> str:
@@ -64,23 +104,146 @@ def get_cookie_token(file=".token.txt") -> str:
         raise Exception(f"An error occurred while reading the token file: {e}") from e
 
 
-def download_advent_of_code_html(year, day):
-    url = f"https://adventofcode.com/{year}/day/{day}"
-    cookies = {"session": get_cookie_token()}
+def make_session(
+    token: Optional[str] = None, workers: int = DEFAULT_WORKERS
+) -> requests.Session:
+    """
+    A session keeping up to `workers` connections to the host alive,
+    so consecutive pages reuse them instead of a cold connection each.
+
+    Args:
+        token: The session cookie, read with get_cookie_token() if None.
+        workers: The number of threads that will share the session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.cookies.set("session", token if token else get_cookie_token())
     uagent_tag = "AdventOfCodeDownloader/1.0"
     uagent = f"{uagent_tag} (+https://github.com/marcus-grant/advent-of-code)"
-    headers = {"User-Agent": uagent}
-    response = requests.get(url, cookies=cookies, headers=headers)
+    session.headers["User-Agent"] = uagent
+    return session
+
+
+def get_cache_dir() -> str:
+    return os.path.join(get_script_dir(), ".cache", "diary")
+
+
+def fetch_cached(
+    session: requests.Session, url: str, cache_dir: Optional[str] = None
+) -> Tuple[str, bool]:
+    """
+    GET a page, revalidating a cached copy with its ETag & Last-Modified
+    so an unchanged page is answered by a body-less 304 Not Modified.
+
+    Args:
+        session: The session to send the request with.
+        url: The page to fetch.
+        cache_dir: Where pages & their validators are kept, None to not cache.
+
+    Returns:
+        The page's text and whether it came from the cache.
+
+    Raises:
+        requests.HTTPError: If the request was unsuccessful.
+    """
+    headers = {}
+    path_body = path_meta = None
+    if cache_dir is not None:
+        name = hashlib.sha256(url.encode()).hexdigest()[:16]
+        path_body = os.path.join(cache_dir, f"{name}.html")
+        path_meta = os.path.join(cache_dir, f"{name}.json")
+        if os.path.exists(path_body) and os.path.exists(path_meta):
+            with open(path_meta, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = session.get(url, headers=headers)
+    if response.status_code == 304 and path_body is not None:
+        with open(path_body, "r", encoding="utf-8") as f:
+            return f.read(), True
     response.raise_for_status()  # Raise an exception if the request was unsuccessful
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if path_body is not None and path_meta is not None and (etag or last_modified):
+        os.makedirs(cache_dir, exist_ok=True)  # type: ignore
+        with open(path_body, "w", encoding="utf-8") as f:
+            f.write(response.text)
+        with open(path_meta, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "etag": etag, "last_modified": last_modified}, f)
+    return response.text, False
+
+
+def extract_main(html: str) -> str:
+    """
+    The page's <main> tag holding the puzzle description.
+
+    Raises:
+        ValueError: If the page has no main tag.
+    """
+    # Only needed once a page is in, keeps the fetching side importable alone
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
     main_content = soup.find("main")
     if not main_content:
         raise ValueError("No main content tag found in the response.")
-
     return str(main_content)
 
 
+def download_advent_of_code_html(
+    year,
+    day,
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[str] = None,
+    base_url: str = BASE_URL,
+):
+    url = f"{base_url}/{year}/day/{day}"
+    session = session if session is not None else make_session()
+    html, _ = fetch_cached(session, url, cache_dir)
+    return extract_main(html)
+
+
+def download_days(
+    year: int,
+    days: List[int],
+    workers: int = DEFAULT_WORKERS,
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[str] = None,
+    base_url: str = BASE_URL,
+) -> Tuple[Dict[int, str], Dict[int, Exception]]:
+    """
+    Download several days' pages at once over one pooled session,
+    at most `workers` requests in flight.
+
+    Returns:
+        The <main> content of each downloaded day and the error of each
+        day that failed, so one missing day doesn't lose the others.
+    """
+    session = session if session is not None else make_session(workers=workers)
+    pages: Dict[int, str] = {}
+    errors: Dict[int, Exception] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                download_advent_of_code_html, year, day, session, cache_dir, base_url
+            ): day
+            for day in days
+        }
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                pages[day] = future.result()
+            except Exception as e:
+                errors[day] = e
+    return pages, errors
+
+
 def get_script_dir() -> str:
     """
     Return the directory where the current script is located.
@@ -122,11 +285,20 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 if __name__ == "__main__":
     try:
-        year, day = parse_args_year_day()
-        logging.info(f"Downloading AoC {year} Day {day}...")
-        html_content = download_advent_of_code_html(year, day)
-        save_html(html_content, day)
-        logging.info(f"Successfully saved Day {day:02d} content.")
+        args = parse_args()
+        year = args.year
+        cache_dir = None if args.no_cache else get_cache_dir()
+        logging.info(f"Downloading AoC {year} Days {args.days}...")
+        pages, errors = download_days(
+            year, args.days, args.workers, cache_dir=cache_dir
+        )
+        for day, html_content in sorted(pages.items()):
+            save_html(html_content, day)
+            logging.info(f"Successfully saved Day {day:02d} content.")
+        for day, error in sorted(errors.items()):
+            logging.error(f"Day {day:02d}: {error}")
+        if errors:
+            exit(1)
     except Exception as e:
         logging.error(e)
         exit(1)
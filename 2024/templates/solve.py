@@ -27,17 +27,19 @@ def read_lines(fpath: PathLike) -> List[str]:
     return lines
 
 
-def part1(fpath: PathLike, debug: bool = False) -> int:
-    lines = read_lines(fpath)
+def parse(fpath: PathLike) -> List[str]:
+    # Runner parses each input once & hands the result to both parts
+    # Parts must treat it as read-only, copy anything they mutate
+    return read_lines(fpath)
 
+
+def part1(lines: List[str], debug: bool = False) -> int:
     # TODO: Implement solution here
 
     return 69
 
 
-def part2(fpath: PathLike, debug: bool = False) -> int:
-    lines = read_lines(fpath)
-
+def part2(lines: List[str], debug: bool = False) -> int:
     # TODO: Implement solution here
 
     return 420
@@ -68,13 +70,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 1')}:\n")
 
     tstart = time.time()
-    sol = part1(PATH_EX, **kw)
+    sol = part1(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part1(PATH_IN, **kw)
+    sol = part1(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
@@ -82,13 +84,13 @@ def run(debug: bool = False) -> None:
     print(f"\n{bgrn('Part 2')}:\n")
 
     tstart = time.time()
-    sol = part2(PATH_EX, **kw)
+    sol = part2(parse(PATH_EX), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Example Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
 
     tstart = time.time()
-    sol = part2(PATH_IN, **kw)
+    sol = part2(parse(PATH_IN), **kw)
     ms = f"{1000 * (time.time() - tstart):.3f}"
     print(f"\n{mgta('Solution with Real Data:')}\t{bgrn(sol)}\n")
     print(blue(f"Time taken (ms):\t\t{ms}\n"))
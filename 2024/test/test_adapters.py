@@ -0,0 +1,134 @@
+# test/test_adapters.py
+import unittest
+import sys
+import os
+import tempfile
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.adapters import (  # noqa: E402
+    adapt,
+    call_2023,
+    discover_variants,
+    input_files,
+    run_year_job,
+)
+
+
+def solver_lines(input_lines: list[str]) -> int:
+    return len(input_lines)
+
+
+def solver_path(f: str, verbose) -> int:
+    return -1 if verbose else len(f)
+
+
+def solver_details(input_file: str, quiet: bool = False):
+    return (["details"], 42)
+
+
+class TestCall2023(unittest.TestCase):
+    def setUp(self):
+        fd, self.fpath = tempfile.mkstemp()
+        with os.fdopen(fd, "w") as f:
+            f.write("a\nb\nc\n")
+
+    def tearDown(self):
+        os.remove(self.fpath)
+
+    def test_call_conventions(self):
+        """
+        Test lines or paths are passed, verbose turned off & answers unpacked.
+        """
+        self.assertEqual(call_2023(solver_lines, self.fpath), 3)
+        self.assertEqual(call_2023(solver_path, self.fpath), len(self.fpath))
+        self.assertEqual(call_2023(solver_details, self.fpath), 42)
+
+
+class TestAdapt(unittest.TestCase):
+    def test_adapt_2024(self):
+        """
+        Test 2024 days solve from a path, parse hooks included.
+        """
+        solvers = adapt("2024", "06")
+        self.assertEqual(
+            solvers["1"](str(input_files("2024", "06", "1")["EXAMPLE"])), 41
+        )
+
+    def test_adapt_2022_solver_class(self):
+        """
+        Test 2022 Solver classes are wrapped into one solver per part.
+        """
+        solvers = adapt("2022", "06")
+        fpath = str(input_files("2022", "06", "1")["EXAMPLE"])
+        self.assertEqual((solvers["1"](fpath), solvers["2"](fpath)), (10, 29))
+
+    def test_adapt_unsupported(self):
+        """
+        Test top level scripts & unknown years raise a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            adapt("2022", "01")
+        with self.assertRaises(ValueError):
+            adapt("2021", "01")
+
+    def test_run_year_job_error(self):
+        """
+        Test a failing day is reported in the result rather than raised.
+        """
+        fpath = str(input_files("2022", "01", "1")["INPUT"])
+        result = run_year_job(("2022", "01", "1", "INPUT", fpath))
+        self.assertIsNone(result["answer"])
+        self.assertIn("ValueError", result["error"])
+
+    def test_run_year_job_zero_runs(self):
+        """
+        Test zero runs still solve the job once instead of crashing.
+        """
+        fpath = os.path.join(project_root, "01", "example.txt")
+        result = run_year_job(("2024", "01", "1", "EXAMPLE", fpath), runs=0)
+        self.assertEqual(result["answer"], 11)
+        self.assertIsNone(result["error"])
+
+
+class TestVariants(unittest.TestCase):
+    def test_discover_variants(self):
+        """
+        Test every implementation of a day is found, the main one first.
+        """
+        self.assertEqual(
+            discover_variants("2024", "09"), ["solve", "solve_numpy", "try1"]
+        )
+        self.assertEqual(discover_variants("2023", "07"), ["solve", "solve.old"])
+        self.assertEqual(discover_variants("2023", "03"), ["solve", "solver"])
+        self.assertEqual(discover_variants("2024", "99"), [])
+
+    def test_variants_agree(self):
+        """
+        Test each day 09 variant solves the example to the same answers.
+        """
+        for part, expected in [("1", 1928), ("2", 2858)]:
+            fpath = str(input_files("2024", "09", part)["EXAMPLE"])
+            for variant in discover_variants("2024", "09"):
+                with self.subTest(part=part, variant=variant):
+                    job = ("2024", "09", part, "EXAMPLE", fpath)
+                    result = run_year_job(job, variant=variant)
+                    self.assertIsNone(result["error"])
+                    self.assertEqual(result["answer"], expected)
+
+    def test_2023_script_variant(self):
+        """
+        Test 2023/03's former top level script solves part 2 as a variant.
+        """
+        fpath = str(input_files("2023", "03", "2")["EXAMPLE"])
+        result = run_year_job(("2023", "03", "2", "EXAMPLE", fpath), variant="solver")
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["answer"], 467835)
+
+
+if __name__ == "__main__":
+    unittest.main()
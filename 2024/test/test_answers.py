@@ -0,0 +1,97 @@
+# test/test_answers.py
+import unittest
+import sys
+import os
+import json
+import time
+from unittest.mock import patch
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.sols import execute_part, get_parser, input_paths  # noqa: E402
+from util.sweep import get_module, get_part_func  # noqa: E402
+
+# Known-good answers & time budgets of each day, part & input
+PATH_MANIFEST = os.path.join(current_dir, "answers.json")
+
+# Multiplies every budget, e.g. AOC_BUDGET_SCALE=3 on a slow machine
+BUDGET_SCALE = float(os.environ.get("AOC_BUDGET_SCALE", "1"))
+
+# A run over budget is retried this many times to rule out a noisy run
+BUDGET_TRIES = 3
+
+
+def load_manifest(path=PATH_MANIFEST):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def solve_timed(day, part, fpath):
+    """
+    Solve a part from scratch, parsing included and without the answer cache.
+
+    Returns:
+        tuple: The answer and the elapsed milliseconds.
+    """
+    parser = get_parser(get_module(day))
+    tstart = time.perf_counter_ns()
+    answer = execute_part(get_part_func(day, part), fpath, parser=parser)
+    return answer, (time.perf_counter_ns() - tstart) / 1e6
+
+
+class TestAnswers(unittest.TestCase):
+    """
+    Check every answer in the manifest and that it's solved within budget.
+    Real inputs aren't checked in, so INPUT entries are skipped without one.
+    An INPUT answer of null only checks the time budget.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manifest = load_manifest()
+
+    def check(self, kind):
+        budgets = self.manifest["budget_ms"]
+        for day, parts in sorted(self.manifest["days"].items()):
+            for part, inputs in sorted(parts.items()):
+                if kind not in inputs:
+                    continue
+                entry = inputs[kind]
+                path_ex, path_real = input_paths(day)[part]
+                fpath = str(path_ex if kind == "EXAMPLE" else path_real)
+                with self.subTest(day=day, part=part, input=kind):
+                    if not os.path.exists(fpath):
+                        self.skipTest(f"{fpath} not found")
+                    budget = entry.get("budget_ms", budgets[kind]) * BUDGET_SCALE
+                    with patch("util.sols.console.print"):
+                        for _ in range(BUDGET_TRIES):
+                            answer, ms = solve_timed(day, part, fpath)
+                            if ms <= budget:
+                                break
+                    if hasattr(answer, "item"):
+                        answer = answer.item()  # NumPy scalars
+                    if entry["answer"] is not None:
+                        self.assertEqual(answer, entry["answer"])
+                    self.assertLessEqual(
+                        ms, budget, f"took {ms:.1f} ms, budget {budget:.0f} ms"
+                    )
+
+    def test_examples(self):
+        """
+        Test example answers & budgets of every day in the manifest.
+        """
+        self.check("EXAMPLE")
+
+    def test_inputs(self):
+        """
+        Test real input answers & budgets where the input file is present.
+        """
+        self.check("INPUT")
+
+
+if __name__ == "__main__":
+    unittest.main()
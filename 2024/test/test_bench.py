@@ -0,0 +1,63 @@
+# test/test_bench.py
+import unittest
+import sys
+import os
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.bench import percentile, summarize, bench_part  # noqa: E402
+
+
+class TestBenchStats(unittest.TestCase):
+    def test_percentile_nearest_rank(self):
+        """
+        Test the nearest-rank percentile against known values.
+        """
+        samples = list(range(1, 21))  # 1..20
+        self.assertEqual(percentile(samples, 95), 19)
+        self.assertEqual(percentile(samples, 50), 10)
+        self.assertEqual(percentile(samples, 100), 20)
+        self.assertEqual(percentile(samples, 0), 1)
+        self.assertEqual(percentile([5], 95), 5)
+
+    def test_percentile_empty(self):
+        """
+        Test that empty samples raise a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            percentile([], 95)
+
+    def test_summarize(self):
+        """
+        Test the summary stats of a small set of timings.
+        """
+        stats = summarize([4, 1, 3, 2])
+        self.assertEqual(stats["min"], 1)
+        self.assertEqual(stats["max"], 4)
+        self.assertEqual(stats["median"], 2.5)
+        self.assertEqual(stats["p95"], 4)
+        self.assertAlmostEqual(stats["stddev"], 1.2909944, places=6)
+        self.assertEqual(summarize([7])["stddev"], 0.0)
+
+    def test_bench_part_counts_runs(self):
+        """
+        Test that bench_part runs warmup + timed runs and keeps the answer.
+        """
+        calls = []
+
+        def part1(fpath, debug=False):
+            calls.append(fpath)
+            return 42
+
+        result = bench_part(part1, "example.txt", runs=3, warmup=2)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(result["answer"], 42)
+        self.assertEqual(len(result["times_ns"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
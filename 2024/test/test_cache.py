@@ -0,0 +1,103 @@
+# test/test_cache.py
+import unittest
+import sys
+import os
+import pathlib
+import tempfile
+from unittest.mock import patch
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.cache import AnswerCache  # noqa: E402
+from util.sols import execute_part  # noqa: E402
+
+
+def part1(fpath, debug=False):
+    part1.calls += 1
+    with open(fpath) as f:
+        return len(f.read())
+
+
+part1.calls = 0
+
+
+class TestAnswerCache(unittest.TestCase):
+    def setUp(self):
+        """
+        Give each test its own cache directory & input file.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.tmpdir.name)
+        self.cache = AnswerCache(self.path / "answers")
+        self.fpath = str(self.path / "input.txt")
+        with open(self.fpath, "w") as f:
+            f.write("abc")
+        part1.calls = 0
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_hit_skips_solver(self):
+        """
+        Test a second execution with unchanged input returns the cached answer.
+        """
+        self.assertEqual(execute_part(part1, self.fpath, cache=self.cache), 3)
+        self.assertEqual(execute_part(part1, self.fpath, cache=self.cache), 3)
+        self.assertEqual(part1.calls, 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_input_change_misses(self):
+        """
+        Test that changing the input bytes changes the key.
+        """
+        key1 = self.cache.key(part1, self.fpath)
+        with open(self.fpath, "w") as f:
+            f.write("abcd")
+        key2 = self.cache.key(part1, self.fpath)
+        self.assertNotEqual(key1, key2)
+        self.assertEqual(execute_part(part1, self.fpath, cache=self.cache), 4)
+
+    def test_debug_bypasses_cache(self):
+        """
+        Test debug runs always execute the solver.
+        """
+        execute_part(part1, self.fpath, cache=self.cache)
+        execute_part(part1, self.fpath, debug=True, cache=self.cache)
+        self.assertEqual(part1.calls, 2)
+
+    def test_lru_eviction(self):
+        """
+        Test least recently used entries are evicted past max_bytes.
+        """
+        self.cache.max_bytes = 30  # Room for two 13 byte entries
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        # Make 'a' the most recently used before adding 'c'
+        os.utime(self.path / "answers" / "b.json", (0, 0))
+        self.cache.get("a")
+        self.cache.put("c", 3)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.evictions, 1)
+
+    @patch("util.sols.console.print")
+    def test_errors_not_cached(self, _mock_print):
+        """
+        Test that failed solves don't get stored.
+        """
+
+        def part2(fpath, debug=False):
+            raise ValueError("boom")
+
+        with patch("traceback.print_exc"):
+            self.assertIsNone(execute_part(part2, self.fpath, cache=self.cache))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# test/test_daemon.py
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.daemon import SolveServer, WarmSolver, parse_request, send  # noqa: E402
+from util.sols import registry  # noqa: E402
+
+
+class TestRequests(unittest.TestCase):
+    def test_parse_request(self):
+        """
+        Test a request line is split into a padded day, part and input.
+        """
+        request = parse_request("solve day 1 part 2 input example")
+        self.assertEqual(request, {"day": "01", "part": "2", "input": "example"})
+
+    def test_parse_request_invalid(self):
+        """
+        Test malformed requests raise a ValueError.
+        """
+        for line in ["solve", "solve day 26 part 1 input example", "solve day 1"]:
+            with self.assertRaises(ValueError):
+                parse_request(line)
+
+
+class TestWarmSolver(unittest.TestCase):
+    def setUp(self):
+        self.solver = WarmSolver(use_cache=False)
+
+    def test_solve_example(self):
+        """
+        Test a solve request returns the answer and timings.
+        """
+        reply = self.solver.handle("solve day 1 part 1 input example")
+        self.assertEqual(reply["answer"], 11)
+        self.assertIsNone(reply["error"])
+        self.assertGreater(reply["ns"], 0)
+
+    def test_reload_on_mtime_change(self):
+        """
+        Test a day is re-imported only when its solve.py mtime changes.
+        """
+        self.solver.handle("solve day 1 part 1 input example")
+        reply = self.solver.handle("solve day 1 part 1 input example")
+        self.assertFalse(reply["reloaded"])
+        registry.mtimes["01"] = 0.0  # As if solve.py was edited since
+        reply = self.solver.handle("solve day 1 part 1 input example")
+        self.assertTrue(reply["reloaded"])
+        self.assertEqual(reply["answer"], 11)
+
+    def test_missing_input(self):
+        """
+        Test a missing input file is reported as an error, not raised.
+        """
+        reply = self.solver.handle("solve day 1 part 1 input /does/not/exist")
+        self.assertIn("not found", reply["error"])
+
+
+class TestServer(unittest.TestCase):
+    def test_socket_roundtrip(self):
+        """
+        Test requests are answered over the Unix socket.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "aoc.sock")
+            server = SolveServer(path, WarmSolver(use_cache=False))
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                self.assertTrue(send("ping", path, timeout=10)["pong"])
+                reply = send("solve day 1 part 2 input example", path, timeout=10)
+                self.assertEqual(reply["answer"], 31)
+            finally:
+                server.shutdown()
+                server.server_close()
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
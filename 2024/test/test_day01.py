@@ -0,0 +1,81 @@
+# test/test_day01.py
+import unittest
+import sys
+import os
+import random
+import tempfile
+from unittest.mock import patch
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.adapters import day_dir, import_source  # noqa: E402
+from util.sols import load_day  # noqa: E402
+
+solve_numpy = import_source(day_dir("2024", "01") / "solve_numpy.py", "day01_numpy")
+solve_external = import_source(
+    day_dir("2024", "01") / "solve_external.py", "day01_external"
+)
+
+
+class TestDay01Numpy(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(0)
+        lines = [f"{rng.randint(1, 99999)}   {rng.randint(1, 999)}" for _ in range(500)]
+        fd, cls.fpath = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.fpath)
+
+    def test_chunks_keep_lines_whole(self):
+        """
+        Test tiny chunks parse the same columns as one chunk of the file.
+        """
+        left, right = solve_numpy.read_columns(self.fpath)
+        for chunk_bytes in [1, 7, 64]:
+            chunked = solve_numpy.read_columns(self.fpath, chunk_bytes)
+            self.assertEqual(chunked[0].tolist(), left.tolist())
+            self.assertEqual(chunked[1].tolist(), right.tolist())
+        self.assertEqual(len(left), 500)
+
+    def test_agrees_with_solve(self):
+        """
+        Test both parts agree with solve.py, part 2 with repeated numbers.
+        """
+        solve = load_day("01")
+        columns = solve_numpy.parse(self.fpath)
+        self.assertEqual(solve_numpy.part1(columns), solve.part1(self.fpath))
+        self.assertEqual(solve_numpy.part2(columns), solve.part2(self.fpath))
+
+    def test_external_many_runs(self):
+        """
+        Test the out-of-core parts agree when spilling & merging many runs.
+        """
+        columns = solve_numpy.parse(self.fpath)
+        small = {"RUN_BYTES": 200, "MERGE_BYTES": 8 * 64, "MIN_BLOCK": 3}
+        with patch.multiple(solve_external, **small):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                left_runs, _ = solve_external.spill_runs(self.fpath, tmpdir)
+                self.assertGreater(len(left_runs), 10)
+                merged = list(solve_external.merge_runs(left_runs, 3))
+                del left_runs
+            self.assertEqual(
+                [int(x) for block in merged for x in block], sorted(columns[0].tolist())
+            )
+            self.assertEqual(
+                solve_external.part1(self.fpath), solve_numpy.part1(columns)
+            )
+            self.assertEqual(
+                solve_external.part2(self.fpath), solve_numpy.part2(columns)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# test/test_day02.py
+import unittest
+import sys
+import os
+import random
+import tempfile
+
+import numpy as np
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.sols import load_day  # noqa: E402
+
+solve = load_day("02")
+
+
+def random_reports(n, seed=0):
+    # Mostly near-safe reports so every rule & the damper get exercised
+    rng = random.Random(seed)
+    reports = []
+    for _ in range(n):
+        level, step = rng.randint(30, 60), rng.choice([-1, 1])
+        report = [level]
+        for _ in range(rng.randint(0, 7)):
+            report.append(report[-1] + step * rng.choice([1, 2, 3, 3, 0, 4, -1]))
+        reports.append(report)
+    return reports
+
+
+class TestDay02(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.reports = random_reports(2000)
+        fd, cls.fpath = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write("\n".join(" ".join(map(str, r)) for r in cls.reports) + "\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.fpath)
+
+    def test_safe_mask(self):
+        """
+        Test the whole matrix check agrees with is_safe on every report.
+        """
+        levels, lengths = solve.parse(self.fpath)
+        expected = [solve.is_safe(np.array(r)) for r in self.reports]
+        self.assertEqual(solve.safe_mask(levels, lengths).tolist(), expected)
+
+    def test_part2(self):
+        """
+        Test part 2 agrees with trying every single level removal.
+        """
+        expected = sum(
+            any(solve.is_safe(np.array(r[:i] + r[i + 1 :])) for i in range(len(r) + 1))
+            for r in self.reports
+        )
+        self.assertEqual(solve.part2(solve.parse(self.fpath)), expected)
+
+    def test_problem_damper(self):
+        """
+        Test the per report damper agrees with the whole matrix check.
+        """
+        levels, lengths = solve.parse(self.fpath)
+        expected = solve.damped_mask(levels, lengths).tolist()
+        for report, damped in zip(self.reports, expected):
+            report = np.array(report)
+            fixed = solve.problem_damper(report)
+            self.assertEqual(solve.is_safe(report) or len(fixed) < len(report), damped)
+            self.assertEqual(solve.is_safe(fixed), damped)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# test/test_day03.py
+import unittest
+import sys
+import os
+import random
+import re
+import tempfile
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.sols import load_day  # noqa: E402
+
+solve = load_day("03")
+
+
+def corrupted_memory(n, seed=0):
+    # Instructions, near misses & noise, broken over lines at random
+    rng = random.Random(seed)
+    pieces = ["do()", "don't()", "mul(", "mul(1234,5)", "mul ( 2 , 4 )", "\n"]
+    pieces += ["d", "o", "(", ")", ",", "x", "'", "n", "mul[3,7]"]
+    out = []
+    for _ in range(n):
+        if rng.random() < 0.3:
+            out.append(f"mul({rng.randint(0, 999)},{rng.randint(0, 999)})")
+        else:
+            out.append(rng.choice(pieces))
+    return "".join(out)
+
+
+def reference(memory, conditional):
+    # The whole string approach the scanner replaces
+    instructions = "".join(memory.splitlines())
+    if conditional:
+        instructions = re.sub(r"don't\(\).*?($|do\(\))", "", instructions, flags=re.S)
+    matches = re.findall(r"mul\((\d{1,3}),(\d{1,3})\)", instructions)
+    return sum(int(x) * int(y) for x, y in matches)
+
+
+class TestDay03(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.memory = corrupted_memory(3000)
+        fd, cls.fpath = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write(cls.memory)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.fpath)
+
+    def test_parts(self):
+        """
+        Test both parts agree with joining the lines & matching it whole.
+        """
+        self.assertEqual(solve.part1(self.fpath), reference(self.memory, False))
+        self.assertEqual(solve.part2(self.fpath), reference(self.memory, True))
+
+    def test_chunk_boundaries(self):
+        """
+        Test instructions cut between chunks of any size are still found once.
+        """
+        whole = list(solve.scan_instructions(self.fpath))
+        for chunk_bytes in list(range(1, 2 * solve.MAX_LEN)) + [97, 1000]:
+            with self.subTest(chunk_bytes=chunk_bytes):
+                scanned = solve.scan_instructions(self.fpath, chunk_bytes)
+                self.assertEqual(list(scanned), whole)
+
+
+if __name__ == "__main__":
+    unittest.main()
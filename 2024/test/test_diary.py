@@ -0,0 +1,129 @@
+# test/test_diary.py
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from get_day_diary import download_days, fetch_cached  # noqa: E402
+from get_day_diary import make_session, parse_days  # noqa: E402
+
+
+class DiaryHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for adventofcode.com serving /YEAR/day/N pages, odd days
+    validated by ETag & even days by Last-Modified, day 13 missing.
+    """
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connections can be reused
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.ports.add(self.client_address[1])
+        day = int(self.path.rsplit("/", 1)[1])
+        if day == 13:
+            self.send_response(404)  # Not send_error, which closes the connection
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        version = server.versions.get(day, 1)
+        etag = f'"day{day}-v{version}"'
+        modified = f"Mon, 0{version} Dec 2024 05:00:00 GMT"
+        if day % 2:
+            fresh = self.headers.get("If-None-Match") == etag
+        else:
+            fresh = self.headers.get("If-Modified-Since") == modified
+        with server.lock:
+            server.statuses.append((day, 304 if fresh else 200))
+        if fresh:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = f"<html><main>Day {day} v{version}</main></html>".encode()
+        self.send_response(200)
+        self.send_header(
+            "ETag" if day % 2 else "Last-Modified", etag if day % 2 else modified
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDiary(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), DiaryHandler)
+        self.server.lock = threading.Lock()
+        self.server.ports, self.server.statuses, self.server.versions = set(), [], {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.session = make_session(token="test", workers=3)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def fetch(self, day):
+        url = f"{self.base_url}/2024/day/{day}"
+        return fetch_cached(self.session, url, self.tmpdir.name)
+
+    def test_parse_days(self):
+        """
+        Test day specs expand to sorted days & 'all' to all 25.
+        """
+        self.assertEqual(parse_days("1,3,5-7"), [1, 3, 5, 6, 7])
+        self.assertEqual(parse_days("all"), list(range(1, 26)))
+        with self.assertRaises(ValueError):
+            parse_days("20-26")
+
+    def test_revalidation(self):
+        """
+        Test unchanged pages come back from a 304 & changed ones are refetched.
+        """
+        self.assertEqual(self.fetch(1), ("<html><main>Day 1 v1</main></html>", False))
+        self.assertEqual(self.fetch(2)[1], False)
+        self.assertEqual(self.fetch(1), ("<html><main>Day 1 v1</main></html>", True))
+        self.assertEqual(self.fetch(2)[1], True)
+        self.server.versions[1] = 2
+        self.assertEqual(self.fetch(1), ("<html><main>Day 1 v2</main></html>", False))
+        self.assertEqual(
+            self.server.statuses, [(1, 200), (2, 200), (1, 304), (2, 304), (1, 200)]
+        )
+
+    def test_download_days_pooled(self):
+        """
+        Test a range of days shares at most `workers` connections,
+        a failing day is reported apart & a second run is all 304s.
+        """
+        days = list(range(1, 16))
+        kwargs = {"cache_dir": self.tmpdir.name, "base_url": self.base_url}
+        try:
+            import bs4  # noqa: F401
+        except ImportError:
+            self.skipTest("bs4 is needed to extract the pages' <main>")
+        pages, errors = download_days(2024, days, 3, self.session, **kwargs)
+        self.assertEqual(sorted(errors), [13])
+        self.assertEqual(pages[5], "<main>Day 5 v1</main>")
+        self.assertLessEqual(len(self.server.ports), 3)
+        self.server.statuses.clear()
+        pages_again, _ = download_days(2024, days, 3, self.session, **kwargs)
+        self.assertEqual(pages_again, pages)
+        self.assertTrue(all(s == 304 for d, s in self.server.statuses if d != 13))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# test/test_history.py
+import unittest
+import sys
+import os
+import pathlib
+import tempfile
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.history import append, baseline, compare, load, make_entry  # noqa: E402
+
+
+def entry(commit, median, day="01", input_hash="abc"):
+    return {
+        "commit": commit,
+        "day": day,
+        "part": "1",
+        "input": "INPUT",
+        "input_hash": input_hash,
+        "stats_ns": {"median": median},
+    }
+
+
+class TestHistory(unittest.TestCase):
+    def test_append_and_load(self):
+        """
+        Test entries round trip through the JSONL file, skipping torn lines.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "history.jsonl"
+            self.assertEqual(load(path), [])
+            append([entry("a", 100), entry("b", 200)], path)
+            with open(path, "a") as f:
+                f.write('{"commit": "c", "da')
+            self.assertEqual([e["commit"] for e in load(path)], ["a", "b"])
+
+    def test_make_entry(self):
+        """
+        Test an entry keeps the stats & hashes the input, not the raw timings.
+        """
+        fpath = os.path.join(project_root, "01", "example.txt")
+        result = {"runs": 2, "times_ns": [1, 3], "stats_ns": {"median": 2}}
+        made = make_entry("01", "1", "EXAMPLE", fpath, result, "abc1234")
+        self.assertEqual(made["commit"], "abc1234")
+        self.assertEqual(len(made["input_hash"]), 16)
+        self.assertNotIn("times_ns", made)
+
+    def test_baseline(self):
+        """
+        Test the baseline is the latest previous run of the same input,
+        or the latest run of a given commit.
+        """
+        history = [
+            entry("a", 100),
+            entry("b", 110),
+            entry("c", 90, input_hash="other"),
+            entry("c", 90, day="02"),
+        ]
+        current = entry("d", 120)
+        history.append(current)
+        self.assertEqual(baseline(history, current)["commit"], "b")
+        self.assertEqual(baseline(history, current, "a")["commit"], "a")
+        self.assertIsNone(baseline(history, current, "z"))
+        self.assertIsNone(baseline([current], current))
+
+    def test_compare_threshold(self):
+        """
+        Test only slowdowns beyond the threshold count as regressions.
+        """
+        diff = compare(entry("a", 100), entry("b", 115), 10)
+        self.assertAlmostEqual(diff["change"], 15.0)
+        self.assertTrue(diff["regression"])
+        self.assertFalse(compare(entry("a", 100), entry("b", 105), 10)["regression"])
+        self.assertFalse(compare(entry("a", 100), entry("b", 50), 10)["regression"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,7 @@ if project_root not in sys.path:
 
 # Now import dynamic_import after adjusting sys.path
 try:
-    from util.sols import dynamic_import
+    from util.sols import dynamic_import, ModuleRegistry
 except ModuleNotFoundError as e:
     print(f"❌ Failed to import dynamic_import: {e}")
     dynamic_import = None
@@ -75,5 +75,31 @@ class TestDynamicImport(unittest.TestCase):
                 self.assertIsNone(module, msg)
 
 
+class TestModuleRegistry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if dynamic_import is None:
+            raise unittest.SkipTest("dynamic_import function is not available.")
+
+    def test_imports_once(self):
+        """
+        Test the registry hands out the same module object on every get.
+        """
+        registry = ModuleRegistry()  # type: ignore
+        module = registry.get("01")
+        self.assertIsNotNone(module)
+        self.assertIs(registry.get("01"), module)
+        self.assertGreater(registry.mtimes["01"], 0)
+
+    def test_load_reimports(self):
+        """
+        Test an explicit load replaces the registered module.
+        """
+        registry = ModuleRegistry()  # type: ignore
+        module = registry.get("01")
+        self.assertIsNot(registry.load("01"), module)
+        self.assertIsNot(registry.get("01"), module)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,109 @@
+# test/test_input.py
+import unittest
+import sys
+import os
+import re
+import tempfile
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.input import iter_chunks, iter_lines, map_input  # noqa: E402
+from util.input import parse_int_rows, parse_ints, read_grid  # noqa: E402
+
+
+class TestMappedInput(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, content: bytes) -> str:
+        # A new file each time, truncating a still mapped one would fault
+        fd, fpath = tempfile.mkstemp(suffix=".txt", dir=self.tmpdir.name)
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        return fpath
+
+    def test_map_input(self):
+        """
+        Test the mapping can be regex scanned like bytes & empty files work.
+        """
+        buf = map_input(self.write(b"mul(2,4)xmul(3,7)\n"))
+        self.assertEqual(
+            re.findall(rb"mul\((\d+),(\d+)\)", buf), [(b"2", b"4"), (b"3", b"7")]
+        )
+        self.assertEqual(map_input(self.write(b"")), b"")
+
+    def test_iter_lines(self):
+        """
+        Test lines are memoryviews without LF or CRLF endings.
+        """
+        for content in [b"3   4\n4   3\n", b"3   4\r\n4   3", b"3   4\n4   3"]:
+            lines = list(iter_lines(self.write(content)))
+            self.assertTrue(all(isinstance(line, memoryview) for line in lines))
+            self.assertEqual([str(line, "ascii") for line in lines], ["3   4", "4   3"])
+        self.assertEqual(list(iter_lines(self.write(b""))), [])
+
+    def test_read_grid(self):
+        """
+        Test grids are read-only (rows, cols) uint8 views whatever the endings.
+        """
+        for content in [b"#.^\n.#.\n", b"#.^\r\n.#.\r\n", b"#.^\n.#."]:
+            grid = read_grid(self.write(content))
+            self.assertEqual(grid.shape, (2, 3))
+            self.assertEqual(grid.tobytes(), b"#.^.#.")
+            self.assertFalse(grid.flags.writeable)
+        self.assertEqual(
+            list(zip(*(read_grid(self.write(b"#.\n.#\n")) == ord("#")).nonzero())),
+            [(0, 0), (1, 1)],
+        )
+
+    def test_read_grid_invalid(self):
+        """
+        Test empty files & ragged lines raise a ValueError.
+        """
+        for content in [b"", b"\n", b"ab\ncde\n", b"abc\nd\n", b"ab\n\n"]:
+            with self.assertRaises(ValueError):
+                read_grid(self.write(content))
+
+    def test_iter_chunks(self):
+        """
+        Test chunks end after a newline & cover the file, long lines whole.
+        """
+        content = b"1 2\n33 44\n555 666\n7 8"
+        fpath = self.write(content)
+        for chunk_bytes in [1, 4, 9, 100]:
+            chunks = [bytes(c) for c in iter_chunks(fpath, chunk_bytes)]
+            self.assertEqual(b"".join(chunks), content)
+            self.assertTrue(all(c.endswith(b"\n") for c in chunks[:-1]))
+        self.assertEqual(list(iter_chunks(self.write(b""))), [])
+
+    def test_parse_ints(self):
+        """
+        Test numbers of any width are parsed whatever separates them.
+        """
+        values = parse_ints(b"3   40\r\n123456789012 0\n\n7")
+        self.assertEqual(values.tolist(), [3, 40, 123456789012, 0, 7])
+        self.assertEqual(parse_ints(b"mul(2,4)").tolist(), [2, 4])
+        self.assertEqual(parse_ints(b"").tolist(), [])
+
+    def test_parse_int_rows(self):
+        """
+        Test ragged lines are padded into a matrix, blank lines skipped.
+        """
+        matrix, lengths = parse_int_rows(b"7 6 4\n\n1 2 7 8 9\r\n5", fill=-1)
+        self.assertEqual(lengths.tolist(), [3, 5, 1])
+        self.assertEqual(
+            matrix.tolist(),
+            [[7, 6, 4, -1, -1], [1, 2, 7, 8, 9], [5, -1, -1, -1, -1]],
+        )
+        self.assertEqual(parse_int_rows(b"")[0].shape, (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# test/test_limits.py
+import unittest
+import sys
+import os
+import multiprocessing
+import time
+from unittest.mock import patch
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.limits import OK, OOM, TIMEOUT, ERROR, run_limited  # noqa: E402
+
+FORK = multiprocessing.get_start_method() == "fork"
+EXAMPLE = os.path.join(project_root, "01", "example.txt")
+
+
+def hang(fpath, debug=False):
+    time.sleep(60)
+
+
+def hog(fpath, debug=False):
+    return len(bytearray(8 * 2**30))
+
+
+def fail(fpath, debug=False):
+    raise ValueError("bad input")
+
+
+def crash(fpath, debug=False):
+    os._exit(3)
+
+
+def abort(fpath, debug=False):
+    os.abort()
+
+
+class TestRunLimited(unittest.TestCase):
+    def test_ok(self):
+        """
+        Test a bounded run of day 01's example returns its answer.
+        """
+        result = run_limited("01", "1", EXAMPLE, timeout=30, max_mem_mb=4096)
+        self.assertEqual(result["status"], OK)
+        self.assertEqual(result["answer"], 11)
+
+    # The child is forked, so it inherits these patched solvers
+    @unittest.skipUnless(FORK, "needs fork to patch the child's solver")
+    @patch("util.limits.get_part_func", return_value=hang)
+    def test_timeout(self, _):
+        """
+        Test a hanging solver is killed & reported as timed out.
+        """
+        tstart = time.perf_counter()
+        result = run_limited("01", "1", EXAMPLE, timeout=0.5)
+        self.assertEqual(result["status"], TIMEOUT)
+        self.assertIsNone(result["answer"])
+        self.assertLess(time.perf_counter() - tstart, 10)
+
+    @unittest.skipUnless(FORK, "needs fork to patch the child's solver")
+    @patch("util.limits.get_part_func", return_value=hog)
+    def test_oom(self, _):
+        """
+        Test an allocation beyond the address space cap is reported as OOM.
+        """
+        result = run_limited("01", "1", EXAMPLE, timeout=30, max_mem_mb=4096)
+        self.assertEqual(result["status"], OOM)
+
+    @unittest.skipUnless(FORK, "needs fork to patch the child's solver")
+    @patch("util.limits.get_part_func", return_value=fail)
+    def test_error(self, _):
+        """
+        Test exceptions are reported with their message.
+        """
+        with patch("sys.stderr"):
+            result = run_limited("01", "1", EXAMPLE, timeout=30)
+        self.assertEqual(result["status"], ERROR)
+        self.assertIn("bad input", result["error"])
+
+    @unittest.skipUnless(FORK, "needs fork to patch the child's solver")
+    @patch("util.limits.get_part_func", return_value=crash)
+    def test_crash_with_max_mem(self, _):
+        """
+        Test a child exiting without a result isn't taken for an OOM.
+        """
+        result = run_limited("01", "1", EXAMPLE, timeout=30, max_mem_mb=4096)
+        self.assertEqual(result["status"], ERROR)
+        self.assertEqual(result["error"], "exit code 3")
+
+    @unittest.skipUnless(FORK, "needs fork to patch the child's solver")
+    @patch("util.limits.get_part_func", return_value=abort)
+    def test_abort_with_max_mem(self, _):
+        """
+        Test a child aborting under a memory cap is reported as OOM.
+        """
+        result = run_limited("01", "1", EXAMPLE, timeout=30, max_mem_mb=4096)
+        self.assertEqual(result["status"], OOM)
+
+
+if __name__ == "__main__":
+    unittest.main()
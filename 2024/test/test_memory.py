@@ -0,0 +1,68 @@
+# test/test_memory.py
+import unittest
+import sys
+import os
+import inspect
+import time
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.memory import (  # noqa: E402
+    fmt_bytes,
+    mem_part,
+    peak_rss_bytes,
+    reset_peak_rss,
+)
+
+
+def part1(fpath, debug=False):
+    # Hold roughly 8 MiB of distinct tuples alive at once
+    states = {(i, i + 1) for i in range(100_000)}
+    time.sleep(0.05)  # Give the snapshot thread time to see the peak
+    return len(states)
+
+
+class TestMemPart(unittest.TestCase):
+    def test_peak_and_sites(self):
+        """
+        Test the peak covers the big set & its line tops the allocation sites.
+        """
+        result = mem_part(part1, "example.txt", top=3)
+        self.assertEqual(result["answer"], 100_000)
+        self.assertGreater(result["peak_bytes"], 4 * 2**20)
+        self.assertLessEqual(len(result["top"]), 3)
+        # The site is the line building the set, wherever it moves to
+        lines, first = inspect.getsourcelines(part1)
+        line = first + next(i for i, s in enumerate(lines) if "states =" in s)
+        site = f"{os.path.basename(__file__)}:{line}"
+        self.assertTrue(result["top"][0]["site"].endswith(site))
+
+    def test_reset_peak_rss(self):
+        """
+        Test a reset drops the peak of an earlier allocation that was freed.
+        """
+        if not reset_peak_rss():
+            self.skipTest("peak RSS can't be reset here")
+        baseline = peak_rss_bytes()
+        block = bytearray(64 * 2**20)
+        self.assertGreater(peak_rss_bytes(), baseline + 32 * 2**20)
+        del block
+        reset_peak_rss()
+        self.assertLess(peak_rss_bytes(), baseline + 32 * 2**20)
+
+    def test_fmt_bytes(self):
+        """
+        Test byte counts pick a fitting binary unit.
+        """
+        self.assertEqual(fmt_bytes(None), "-")
+        self.assertEqual(fmt_bytes(512), "512.0 B")
+        self.assertEqual(fmt_bytes(1536), "1.5 KiB")
+        self.assertEqual(fmt_bytes(3 * 2**30), "3.0 GiB")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# test/test_ndjson.py
+import unittest
+import sys
+import os
+import json
+import subprocess
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+KEYS = ["day", "part", "input", "cached", "answer", "ns", "parse_ns"]
+KEYS += ["max_rss_bytes", "error"]
+
+
+def run_aoc(*args):
+    cmd = [sys.executable, os.path.join(project_root, "aoc"), "solve", *args]
+    proc = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True)
+    return [json.loads(line) for line in proc.stdout.splitlines()]
+
+
+class TestNdjson(unittest.TestCase):
+    def test_single_day(self):
+        """
+        Test every stdout line is a JSON result, in the usual run order.
+        """
+        results = run_aoc("1", "--format", "ndjson", "--no-cache")
+        self.assertEqual([list(r) for r in results], [KEYS] * 4)
+        examples = [r for r in results if r["input"] == "EXAMPLE"]
+        self.assertEqual([r["answer"] for r in examples], [11, 31])
+        self.assertEqual([r["part"] for r in results], ["1", "1", "2", "2"])
+        # No input.txt is checked in, so those are reported as errors
+        for r in results:
+            if r["input"] == "INPUT" and r["answer"] is None:
+                self.assertIn("not found", r["error"])
+
+    def test_limited(self):
+        """
+        Test --timeout runs each job in a child & still reports its results.
+        """
+        results = run_aoc("1", "-e", "--format", "ndjson", "--timeout", "30")
+        self.assertEqual([list(r) for r in results], [KEYS] * 2)
+        self.assertEqual([r["answer"] for r in results], [11, 31])
+        self.assertTrue(all(r["error"] is None for r in results))
+
+    def test_days(self):
+        """
+        Test multiple days stream one result per job from the pool.
+        """
+        results = run_aoc("--days", "1-2", "-e", "--format", "ndjson", "--no-cache")
+        answers = {(r["day"], r["part"]): r["answer"] for r in results}
+        self.assertEqual(
+            answers, {("01", "1"): 11, ("01", "2"): 31, ("02", "1"): 2, ("02", "2"): 4}
+        )
+
+    def test_days_without_inputs(self):
+        """
+        Test days whose inputs are all missing only report the missing inputs.
+        """
+        results = run_aoc("--days", "1-2", "-r", "--format", "ndjson", "--no-cache")
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all("not found" in r["error"] for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# test/test_parse.py
+import unittest
+import sys
+import os
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from types import SimpleNamespace  # noqa: E402
+
+from util.sols import ParseOnce, dynamic_import, execute_part, get_parser  # noqa
+from util.sols import warm_day  # noqa: E402
+
+
+class TestParseOnce(unittest.TestCase):
+    def test_parses_each_input_once(self):
+        """
+        Test both parts share one parse per input file.
+        """
+        calls = []
+
+        def parse(fpath):
+            calls.append(fpath)
+            return [1, 2, 3]
+
+        parser = ParseOnce(parse)
+        self.assertEqual(execute_part(sum, "a.txt", parser=parser), 6)
+        self.assertEqual(execute_part(max, "a.txt", parser=parser), 3)
+        self.assertEqual(execute_part(min, "b.txt", parser=parser), 1)
+        self.assertEqual(calls, ["a.txt", "b.txt"])
+        self.assertEqual(set(parser.times_ns), {"a.txt", "b.txt"})
+
+    def test_parse_hook_days(self):
+        """
+        Test days with a parse hook still solve their examples.
+        """
+        expected = {"06": (41, 6), "09": (1928, 2858), "12": (1930, 1206)}
+        for day, answers in expected.items():
+            with self.subTest(day=day):
+                module = dynamic_import(day)
+                parser = get_parser(module)
+                self.assertIsNotNone(parser)
+                fpath = os.path.join(project_root, day, "example.txt")
+                for part, answer in zip([module.part1, module.part2], answers):
+                    self.assertEqual(execute_part(part, fpath, parser=parser), answer)
+                self.assertEqual(len(parser.parsed), 1)
+
+    def test_no_parse_hook(self):
+        """
+        Test days without a parse hook get no parser.
+        """
+        self.assertIsNone(get_parser(dynamic_import("01")))
+
+    def test_warm_once(self):
+        """
+        Test a day's warm hook runs once per module, and days without one pass.
+        """
+        calls = []
+        module = SimpleNamespace(warm=lambda: calls.append(1))
+        warm_day(module)
+        warm_day(module)
+        warm_day(dynamic_import("01"))
+        warm_day(None)
+        self.assertEqual(calls, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
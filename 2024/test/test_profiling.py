@@ -0,0 +1,68 @@
+# test/test_profiling.py
+import unittest
+import sys
+import os
+import pathlib
+import pstats
+import tempfile
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.profiling import collapsed_stacks, profile_part  # noqa: E402
+from util.profiling import top_functions, write_profile  # noqa: E402
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+def part1(fpath, debug=False):
+    return busy(20000) + busy(20000)
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.answer, self.stats = profile_part(part1, "example.txt")
+
+    def test_answer_and_top(self):
+        """
+        Test the part's answer comes back & it shows up in the top functions.
+        """
+        self.assertEqual(self.answer, 2 * busy(20000))
+        top = top_functions(self.stats, "cumulative", 5)
+        self.assertTrue(any(row["func"].startswith("part1 (") for row in top))
+        self.assertEqual(len(top_functions(self.stats, "tottime", 2)), 2)
+
+    def test_collapsed_stacks(self):
+        """
+        Test stacks are rooted at execute_part and pass through part1 & busy.
+        """
+        stacks = collapsed_stacks(self.stats)
+        self.assertTrue(stacks)
+        self.assertTrue(all(s.startswith("execute_part (") for s in stacks))
+        self.assertTrue(any("part1 (" in s and "busy (" in s for s in stacks))
+        self.assertTrue(all(us > 0 for us in stacks.values()))
+
+    def test_write_profile(self):
+        """
+        Test the .pstats file loads back & the collapsed file is 'stack count'.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path_pstats, path_collapsed = write_profile(
+                self.stats, "day00-part1-example", pathlib.Path(tmpdir)
+            )
+            pstats.Stats(str(path_pstats))
+            with open(path_collapsed) as f:
+                lines = f.read().splitlines()
+            self.assertTrue(lines)
+            for line in lines:
+                stack, count = line.rsplit(" ", 1)
+                self.assertTrue(count.isdigit())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# test/test_progress.py
+import unittest
+import sys
+import os
+import time
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.progress import WorkSampler, fmt_work  # noqa: E402
+from util.sols import reset_work, work, work_counts  # noqa: E402
+
+
+class TestWork(unittest.TestCase):
+    def tearDown(self):
+        reset_work()
+
+    def test_work_counts(self):
+        """
+        Test work is summed per kind & counts are a copy.
+        """
+        reset_work()
+        work()
+        work(3, kind="blink")
+        work(kind="blink")
+        counts = work_counts()
+        self.assertEqual(counts, {"item": 1, "blink": 4})
+        counts["blink"] = 0
+        self.assertEqual(work_counts()["blink"], 4)
+
+    def test_fmt_work(self):
+        """
+        Test counts are formatted with their rates, sorted by kind.
+        """
+        msg = fmt_work({"file": 10, "blink": 2000}, 2.0)
+        self.assertEqual(msg, "2,000 blink (1,000/s) - 10 file (5/s)")
+
+
+class TestWorkSampler(unittest.TestCase):
+    def test_totals(self):
+        """
+        Test the sampler keeps totals reported while it ran & resets them.
+        """
+        work(5, kind="stale")  # Reported before start, not counted
+        sampler = WorkSampler(interval=0.01, live=False)
+        sampler.start()
+        for _ in range(10):
+            work(kind="candidate")
+            time.sleep(0.002)
+        sampler.stop()
+        self.assertEqual(sampler.totals, {"candidate": 10})
+        self.assertGreater(sampler.seconds, 0)
+        self.assertIn("10 candidate", sampler.summary())
+        self.assertEqual(work_counts(), {})
+
+    def test_no_work(self):
+        """
+        Test solvers that report nothing get no summary.
+        """
+        sampler = WorkSampler(interval=0.01, live=False)
+        sampler.start()
+        sampler.stop()
+        self.assertIsNone(sampler.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# test/test_sampling.py
+import unittest
+import sys
+import os
+import pathlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.sampling import WORKER_LABEL, collapsed_samples, hot_lines  # noqa: E402
+from util.sampling import sample_part, write_samples  # noqa: E402
+
+
+def busy(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def part1(fpath, debug=False):
+    return busy(300_000)
+
+
+def part2(fpath, debug=False):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        return sum(executor.map(busy, [300_000] * 4))
+
+
+class TestSampling(unittest.TestCase):
+    def test_sample_part(self):
+        """
+        Test samples are rooted at execute_part & the hot line is in busy.
+        """
+        answer, result = sample_part(part1, "example.txt", hz=1000)
+        self.assertEqual(answer, busy(300_000))
+        self.assertGreater(sum(result["samples"].values()), 0)
+        self.assertEqual(result["worker_samples"], 0)
+        self.assertTrue(hot_lines(result["samples"], 1)[0]["line"].startswith("busy"))
+        stacks = collapsed_samples(result["samples"])
+        self.assertTrue(all(s.startswith("execute_part (") for s in stacks))
+
+    def test_sample_pool_workers(self):
+        """
+        Test workers of a pool the part starts are sampled too.
+        """
+        answer, result = sample_part(part2, "example.txt", hz=1000)
+        self.assertEqual(answer, 4 * busy(300_000))
+        self.assertGreater(result["worker_samples"], 0)
+        stacks = collapsed_samples(result["samples"])
+        workers = [s for s in stacks if s.startswith(WORKER_LABEL)]
+        self.assertTrue(any("busy (" in s for s in workers))
+
+    def test_write_samples(self):
+        """
+        Test the collapsed file has a 'stack count' line per stack.
+        """
+        _, result = sample_part(part1, "example.txt", hz=1000)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = write_samples(result["samples"], "day00-part1", pathlib.Path(tmpdir))
+            with open(path) as f:
+                lines = f.read().splitlines()
+        self.assertEqual(path.name, "day00-part1.sampled.collapsed")
+        total = sum(int(line.rsplit(" ", 1)[1]) for line in lines)
+        self.assertEqual(total, sum(result["samples"].values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# test/test_scaling.py
+import unittest
+import sys
+import os
+import time
+from unittest.mock import patch
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.scaling import fit_exponent, fit_points, scale_part  # noqa: E402
+from util.sols import load_day  # noqa: E402
+
+
+def generate(size, seed=0):
+    return "x" * size
+
+
+def count_pairs(fpath, debug=False):
+    with open(fpath) as f:
+        n = len(f.read())
+    return sum(1 for _ in range(n) for _ in range(n))
+
+
+class TestFit(unittest.TestCase):
+    def test_fit_exponent_exact(self):
+        """
+        Test exact power laws recover their exponent with r^2 of 1.
+        """
+        sizes = [10, 100, 1000]
+        k, r2 = fit_exponent(sizes, [3 * s**2 for s in sizes])
+        self.assertAlmostEqual(k, 2.0)
+        self.assertAlmostEqual(r2, 1.0)
+        k, _ = fit_exponent(sizes, [5.0 for _ in sizes])
+        self.assertAlmostEqual(k, 0.0)
+
+    def test_fit_exponent_too_few(self):
+        """
+        Test a single size can't be fitted.
+        """
+        with self.assertRaises(ValueError):
+            fit_exponent([10], [1])
+
+
+class TestScalePart(unittest.TestCase):
+    def test_quadratic_part(self):
+        """
+        Test a quadratic part fits an exponent well above linear.
+        """
+        points = scale_part(
+            count_pairs, generate, [100, 200, 400, 800], measure_mem=False
+        )
+        self.assertEqual(
+            [p["answer"] for p in points], [100**2, 200**2, 400**2, 800**2]
+        )
+        k, _ = fit_points(points)["ns"]
+        self.assertGreater(k, 1.5)
+
+    def test_budget_stops_early(self):
+        """
+        Test sizes stop once a run exceeds the budget.
+        """
+
+        def slow(fpath, debug=False):
+            time.sleep(0.02)
+            return 1
+
+        points = scale_part(slow, generate, [1, 2, 3], budget=0.01, measure_mem=False)
+        self.assertEqual(len(points), 1)
+        self.assertEqual(points[0]["stop"], "over budget")
+
+    def test_no_answer_stops_early(self):
+        """
+        Test sizes stop at a run without an answer, recording why.
+        """
+
+        def unsolved(fpath, debug=False):
+            return None
+
+        with patch("util.sols.console.print"):
+            points = scale_part(unsolved, generate, [1, 2], measure_mem=False)
+        self.assertEqual([p["stop"] for p in points], ["no answer"])
+
+    def test_warmup_untimed(self):
+        """
+        Test a slow first call, like importing, isn't charged to the first size.
+        """
+        calls = []
+
+        def cold(fpath, debug=False):
+            if not calls:
+                time.sleep(0.3)
+            calls.append(fpath)
+            return 1
+
+        points = scale_part(cold, generate, [1, 2], measure_mem=False)
+        self.assertEqual(len(calls), 3)
+        self.assertLess(points[0]["ns"], 0.1 * 1e9)
+        self.assertEqual([p["stop"] for p in points], [None, None])
+
+    def test_day_generators(self):
+        """
+        Test the days' generators give inputs their parse hooks accept.
+        """
+        for day in ["06", "09", "12"]:
+            module = load_day(day)
+            points = scale_part(
+                module.part1,
+                module.generate,
+                module.GENERATE_SIZES[:2],
+                module.parse,
+                measure_mem=False,
+            )
+            self.assertEqual(len(points), 2)
+            self.assertTrue(all(p["answer"] for p in points))
+
+
+if __name__ == "__main__":
+    unittest.main()
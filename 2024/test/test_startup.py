@@ -0,0 +1,42 @@
+# test/test_startup.py
+import unittest
+import sys
+import os
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.startup import measure_startup, parse_importtime  # noqa: E402
+
+IMPORTTIME_STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       362 |      10012 |         attr.converters
+import time:       401 |      21884 |     attrs
+some other warning
+"""
+
+
+class TestStartup(unittest.TestCase):
+    def test_parse_importtime(self):
+        """
+        Test the header & unrelated lines are skipped and names are stripped.
+        """
+        timings = parse_importtime(IMPORTTIME_STDERR)
+        expected = [("attr.converters", 362, 10012), ("attrs", 401, 21884)]
+        self.assertEqual(timings, expected)
+
+    def test_measure_startup(self):
+        """
+        Test a cold import of a small stdlib module is timed every run.
+        """
+        result = measure_startup("json", runs=2)
+        self.assertEqual(len(result["wall_ns"]), 2)
+        self.assertEqual(len(result["import_us"]), 2)
+        self.assertIn("json", [name for name, _, _ in result["imports"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# test/test_sweep.py
+import unittest
+import sys
+import os
+import queue
+from unittest.mock import patch
+
+# Adjust sys.path to include the project root directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from util.sweep import (  # noqa: E402
+    discover_days,
+    group_jobs,
+    init_worker,
+    parse_days,
+    run_input_jobs,
+    run_job,
+    stream_jobs,
+)
+
+
+class TestDaySpecs(unittest.TestCase):
+    def test_parse_days(self):
+        """
+        Test single days, ranges and comma separated mixes.
+        """
+        self.assertEqual(parse_days("6"), ["06"])
+        self.assertEqual(parse_days("1-3"), ["01", "02", "03"])
+        self.assertEqual(parse_days("9,1-2,2"), ["01", "02", "09"])
+        self.assertEqual(parse_days("all", ["02", "01"]), ["01", "02"])
+
+    def test_parse_days_out_of_range(self):
+        """
+        Test that days outside 1-25 raise a ValueError.
+        """
+        for spec in ["0", "24-26", "x"]:
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    parse_days(spec)
+
+    def test_discover_days(self):
+        """
+        Test that the existing 2024 days are discovered in order.
+        """
+        days = discover_days()
+        self.assertIn("01", days)
+        self.assertEqual(days, sorted(days))
+        self.assertNotIn("templates", days)
+
+
+class TestRunJob(unittest.TestCase):
+    @patch("util.sols.console.print")
+    def test_run_job_example(self, _mock_print):
+        """
+        Test a single job solves day 01's example in-process.
+        """
+        path = os.path.join(project_root, "01", "example.txt")
+        result = run_job(("01", "1", "EXAMPLE", path))
+        self.assertEqual(result["answer"], 11)
+        self.assertIsNone(result["error"])
+        self.assertGreater(result["ns"], 0)
+
+    def test_parts_share_parse(self):
+        """
+        Test the parts of one input are grouped & only the first parses it.
+        Days without a parse hook share nothing, so each part goes alone.
+        """
+        path = os.path.join(project_root, "02", "example.txt")
+        other = os.path.join(project_root, "01", "example.txt")
+        jobs = [("02", "1", "EXAMPLE", path), ("01", "1", "EXAMPLE", other)]
+        jobs += [("02", "2", "EXAMPLE", path), ("01", "2", "EXAMPLE", other)]
+        self.assertEqual(group_jobs(jobs), [[0, 2], [1], [3]])
+        results = run_input_jobs([jobs[0], jobs[2]])
+        self.assertEqual([r["answer"] for r in results], [2, 4])
+        self.assertGreater(results[0]["parse_ns"], 0)
+        self.assertEqual(results[1]["parse_ns"], 0)
+
+    def test_group_queues_each_result(self):
+        """
+        Test a streaming worker queues each result of a group as it's done.
+        """
+        path = os.path.join(project_root, "02", "example.txt")
+        jobs = [("02", part, "EXAMPLE", path) for part in ["1", "2"]]
+        results = queue.Queue()
+        init_worker(results)
+        try:
+            run_input_jobs(jobs, indices=[3, 5])
+        finally:
+            init_worker(None)
+        queued = [results.get_nowait() for _ in range(results.qsize())]
+        self.assertEqual([(i, r["answer"]) for i, r in queued], [(3, 2), (5, 4)])
+
+    def test_stream_jobs_order(self):
+        """
+        Test every result is streamed once and returned in job order.
+        """
+        path = os.path.join(project_root, "01", "example.txt")
+        jobs = [("01", part, "EXAMPLE", path) for part in ["2", "1", "2"]]
+        streamed = []
+        results = stream_jobs(jobs, streamed.append, workers=2)
+        self.assertEqual([r["answer"] for r in results], [31, 11, 31])
+        self.assertEqual(len(streamed), 3)
+
+    def test_stream_no_jobs(self):
+        """
+        Test no jobs, e.g. every input missing, stream nothing.
+        """
+        streamed = []
+        self.assertEqual(stream_jobs([], streamed.append), [])
+        self.assertEqual(streamed, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,300 @@
+# util/adapters.py
+import contextlib
+import importlib.util
+import inspect
+import io
+import os
+import pathlib
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from util.sols import input_paths, load_day, warm_day
+
+PATH_ROOT = pathlib.Path(__file__).parent.parent.parent
+YEARS = ["2022", "2023", "2024"]
+
+# Every adapted solver takes an input file path and returns the answer
+AdaptedSolver = Callable[[str], Any]
+
+# A job is (year, day, part, kind, path) where kind is EXAMPLE or INPUT
+YearJobType = Tuple[str, str, str, str, str]
+YearJobResult = Dict[str, Any]
+
+# 2023 used a different entry point name nearly every day
+ENTRY_POINTS_2023 = ["part{part}", "solver_part{part}", "solver{part}"]
+
+# File name (without .py) of each year's main implementation of a day
+MAIN_VARIANTS = {"2022": "solver", "2023": "solve", "2024": "solve"}
+
+# Source patterns showing a file has an entry point the year's adapter finds
+VARIANT_PATTERNS = {
+    "2022": r"^class Solver\b",
+    "2023": r"^def (part|solver_part|solver)[12]\(",
+    "2024": r"^def part[12]\(",
+}
+
+# Adapters of this worker process, created on first use per (year, day, variant)
+_adapters: Dict[Tuple[str, str, str], Dict[str, AdaptedSolver]] = {}
+
+
+def day_dir(year: str, day: str) -> pathlib.Path:
+    """
+    Directory of a day's solution, 2022 names them 'dayNN' instead of 'NN'.
+    """
+    return PATH_ROOT / year / (f"day{day}" if year == "2022" else day)
+
+
+def discover_days(year: str) -> List[str]:
+    """
+    Find the zero padded days of a year that have a directory.
+    """
+    path_year = PATH_ROOT / year
+    if not path_year.exists():
+        return []
+    pattern = r"day(\d{2})" if year == "2022" else r"(\d{2})"
+    days = []
+    for path in path_year.iterdir():
+        match = re.fullmatch(pattern, path.name)
+        if match and path.is_dir():
+            days.append(match.group(1))
+    return sorted(days)
+
+
+def input_files(year: str, day: str, part: str) -> Dict[str, pathlib.Path]:
+    """
+    The EXAMPLE & INPUT files of a day's part following each year's naming.
+    """
+    if year == "2024":
+        path_ex, path_real = input_paths(day)[part]
+        return {"EXAMPLE": path_ex, "INPUT": path_real}
+    path_day = day_dir(year, day)
+    if year == "2022":
+        return {"EXAMPLE": path_day / "test.txt", "INPUT": path_day / "input.txt"}
+    examples = ["example2.txt"] if part == "2" else []
+    examples += ["example.txt", "example1"]
+    path_ex = next((path_day / f for f in examples if (path_day / f).exists()), None)
+    path_real = path_day / "input.txt"
+    if not path_real.exists() and (path_day / "input").exists():
+        path_real = path_day / "input"
+    return {"EXAMPLE": path_ex or path_day / "example.txt", "INPUT": path_real}
+
+
+def module_name(year: str, day: str, variant: str) -> str:
+    """
+    Unique sys.modules name of a day's implementation, e.g. aoc2023_day07_solve_old.
+    """
+    return f"aoc{year}_day{day}_" + re.sub(r"\W", "_", variant)
+
+
+def discover_variants(year: str, day: str) -> List[str]:
+    """
+    Find every implementation of a day, i.e. the .py files in its directory
+    defining an entry point of the year's convention, main one first.
+
+    Returns:
+        List[str]: The variant names, the file names without .py.
+    """
+    path_day = day_dir(year, day)
+    if not path_day.exists():
+        return []
+    variants = []
+    for path in sorted(path_day.glob("*.py")):
+        with open(path, "r", errors="replace") as f:
+            source = f.read()
+        if re.search(VARIANT_PATTERNS[year], source, re.MULTILINE):
+            variants.append(path.name[: -len(".py")])
+    main = MAIN_VARIANTS[year]
+    return sorted(variants, key=lambda variant: variant != main)
+
+
+def import_source(path: pathlib.Path, name: str) -> Any:
+    """
+    Import a solution file by path, with its directory importable
+    so sibling helper modules like 2023/02/pp.py resolve.
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"could not load spec for {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    sys.path.insert(0, str(path.parent))
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+    finally:
+        sys.path.remove(str(path.parent))
+    return module
+
+
+def adapt_2022(day: str, variant: str = "solver") -> Dict[str, AdaptedSolver]:
+    # Solver(input_str, is_test).solve() sets both the part1 & part2 attributes
+    path = day_dir("2022", day) / f"{variant}.py"
+    if not path.exists():
+        raise ValueError("no Solver class, only a top level script")
+    solver_class = import_source(path, module_name("2022", day, variant)).Solver
+
+    def make(part: str) -> AdaptedSolver:
+        def solve(fpath: str) -> Any:
+            with open(fpath, "r") as f:
+                solver = solver_class(f.read(), os.path.basename(fpath) == "test.txt")
+            solver.solve()
+            return getattr(solver, f"part{part}")
+
+        return solve
+
+    return {part: make(part) for part in ["1", "2"]}
+
+
+def call_2023(func: Callable, fpath: str) -> Any:
+    """
+    Call a 2023 solver whatever it takes: a path or lines as first argument,
+    optional verbose or quiet flags, some return tuples of details
+    where the answer is the only int, first in 02's part 1 but last in part 2.
+    """
+    params = list(inspect.signature(func).parameters.values())
+    first = params[0]
+    if first.name in ["lines", "input_lines"] or "list" in str(first.annotation):
+        with open(fpath, "r") as f:
+            arg: Any = f.read().splitlines()
+    else:
+        arg = fpath
+    kwargs = {}
+    for param in params[1:]:
+        if param.name == "verbose":
+            kwargs["verbose"] = False
+        elif param.name == "quiet":
+            kwargs["quiet"] = True
+        elif param.default is inspect.Parameter.empty:
+            raise TypeError(f"don't know how to pass '{param.name}'")
+    answer = func(arg, **kwargs)
+    if isinstance(answer, tuple):
+        return next((a for a in answer if isinstance(a, int)), answer[0])
+    return answer
+
+
+def adapt_2023(day: str, variant: str = "solve") -> Dict[str, AdaptedSolver]:
+    path = day_dir("2023", day) / f"{variant}.py"
+    module = import_source(path, module_name("2023", day, variant))
+    solvers = {}
+    for part in ["1", "2"]:
+        names = [name.format(part=part) for name in ENTRY_POINTS_2023]
+        func = next((getattr(module, n) for n in names if hasattr(module, n)), None)
+        if func is not None:
+            solvers[part] = lambda fpath, func=func: call_2023(func, fpath)
+    if not solvers:
+        raise ValueError("no part or solver functions")
+    return solvers
+
+
+def adapt_2024(day: str, variant: str = "solve") -> Dict[str, AdaptedSolver]:
+    # The main solve.py is shared with the runner, other variants load apart
+    if variant == "solve":
+        module = load_day(day)
+    else:
+        path = day_dir("2024", day) / f"{variant}.py"
+        module = import_source(path, module_name("2024", day, variant))
+    if module is None:
+        raise ImportError(f"could not import day {day}")
+    # Solvers are timed with their parse, but not with deferred imports
+    warm_day(module)
+    parse_func = getattr(module, "parse", None)
+    solvers = {}
+    for part in ["1", "2"]:
+        func = getattr(module, f"part{part}", None)
+        if func is None and part == "2":
+            func = getattr(module, "part1", None)
+        if func is None:
+            continue
+        if callable(parse_func):
+            solvers[part] = lambda fpath, func=func: func(parse_func(fpath))
+        else:
+            solvers[part] = func
+    return solvers
+
+
+def adapt(
+    year: str, day: str, variant: Optional[str] = None
+) -> Dict[str, AdaptedSolver]:
+    """
+    Discover a day's solvers under its year's convention & wrap them
+    into AdaptedSolvers taking an input path and returning the answer.
+
+    Args:
+        year (str): The year, one of YEARS.
+        day (str): The zero padded day.
+        variant (str, optional): The implementation's file name without .py,
+            defaults to the year's main one, see discover_variants.
+
+    Returns:
+        Dict[str, AdaptedSolver]: The solver of each part that exists.
+
+    Raises:
+        ValueError: If the day has no entry point this can adapt.
+        ImportError: If the day's module fails to import.
+    """
+    adapters = {"2022": adapt_2022, "2023": adapt_2023, "2024": adapt_2024}
+    if year not in adapters:
+        raise ValueError(f"unknown year '{year}', expected one of {YEARS}")
+    variant = variant if variant else MAIN_VARIANTS[year]
+    return adapters[year](day, variant)
+
+
+def run_year_job(
+    job: YearJobType, runs: int = 1, variant: Optional[str] = None
+) -> YearJobResult:
+    """
+    Solve a single (year, day, part, input) job with its output silenced,
+    meant to run inside a worker process. Reports the fastest of the runs,
+    which are at least one.
+    The variant picks an alternate implementation, see discover_variants.
+    """
+    year, day, part, kind, fpath = job
+    result: YearJobResult = {"year": year, "day": day, "part": part, "input": kind}
+    result.update({"answer": None, "ns": 0, "bytes": os.path.getsize(fpath)})
+    try:
+        key = (year, day, variant or MAIN_VARIANTS[year])
+        if key not in _adapters:
+            with contextlib.redirect_stdout(io.StringIO()):
+                _adapters[key] = adapt(year, day, variant)
+        solver = _adapters[key].get(part)
+        if solver is None:
+            return {**result, "error": "no solver"}
+        times_ns = []
+        for _ in range(max(runs, 1)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                tstart = time.perf_counter_ns()
+                answer = solver(fpath)
+                times_ns.append(time.perf_counter_ns() - tstart)
+    except Exception as e:
+        return {**result, "error": f"{type(e).__name__}: {e}"}
+    if hasattr(answer, "item"):
+        answer = answer.item()  # NumPy scalars
+    return {**result, "answer": answer, "ns": min(times_ns), "error": None}
+
+
+def run_year_jobs(
+    jobs: List[YearJobType], workers: Optional[int] = None, runs: int = 1
+) -> List[YearJobResult]:
+    """
+    Dispatch every job to a process pool and collect the results.
+
+    Args:
+        jobs (List[YearJobType]): The (year, day, part, kind, path) jobs.
+        workers (int, optional): Pool size, defaults to os.cpu_count().
+        runs (int): Timed runs per job, the fastest is reported.
+
+    Returns:
+        List[YearJobResult]: The results in (year, day, part, input) order.
+    """
+    workers = workers if workers else os.cpu_count()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_year_job, job, runs) for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return sorted(results, key=lambda r: (r["year"], r["day"], r["part"], r["input"]))
@@ -0,0 +1,126 @@
+# util/bench.py
+import json
+import math
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from util.sols import ParseOnce, execute_part
+
+BenchResult = Dict[str, Any]
+
+
+def percentile(samples: List[int], perc: float) -> int:
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+        samples (List[int]): The samples, in any order.
+        perc (float): The percentile to compute, between 0 and 100.
+
+    Returns:
+        int: The sample at the given percentile rank.
+    """
+    if not samples:
+        raise ValueError("Cannot compute percentile of empty samples.")
+    ordered = sorted(samples)
+    rank = max(math.ceil(perc / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(times_ns: List[int]) -> Dict[str, float]:
+    """
+    Summarize a list of timings in nanoseconds.
+
+    Args:
+        times_ns (List[int]): The timings of each run in nanoseconds.
+
+    Returns:
+        Dict[str, float]: min, median, p95, max, mean and stddev in nanoseconds.
+    """
+    return {
+        "min": min(times_ns),
+        "median": statistics.median(times_ns),
+        "p95": percentile(times_ns, 95),
+        "max": max(times_ns),
+        "mean": statistics.fmean(times_ns),
+        "stddev": statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0,
+    }
+
+
+def bench_part(
+    part_func: Callable[[Any, bool], int],
+    fpath: str,
+    runs: int,
+    warmup: int = 1,
+    debug: bool = False,
+    parse_func: Optional[Callable[[str], Any]] = None,
+) -> BenchResult:
+    """
+    Benchmark a part function on a single input file.
+
+    The part is executed `warmup` times untimed,
+    then `runs` times each timed with perf_counter_ns.
+    If the day has a parse hook, every run parses afresh
+    and parse time is reported separately from solve time.
+
+    Args:
+        part_func (callable): The part1 or part2 function to benchmark.
+        fpath (str): The path to the input file.
+        runs (int): Number of timed runs.
+        warmup (int): Number of untimed warmup runs.
+        debug (bool): Passed through to the part function.
+        parse_func (callable, optional): The day's parse(fpath) hook.
+
+    Returns:
+        BenchResult: The answer, raw timings and summary stats.
+    """
+    if runs < 1:
+        raise ValueError("Benchmark needs at least one timed run.")
+
+    def parser() -> Optional[ParseOnce]:
+        return ParseOnce(parse_func) if parse_func is not None else None
+
+    for _ in range(warmup):
+        execute_part(part_func, fpath, debug, parser=parser())
+
+    answer: Optional[Any] = None
+    times_ns: List[int] = []
+    parse_ns: List[int] = []
+    for _ in range(runs):
+        run_parser = parser()
+        tstart = time.perf_counter_ns()
+        answer = execute_part(part_func, fpath, debug, parser=run_parser)
+        elapsed = time.perf_counter_ns() - tstart
+        parsing = run_parser.times_ns.get(str(fpath), 0) if run_parser else 0
+        times_ns.append(elapsed - parsing)
+        parse_ns.append(parsing)
+
+    result = {
+        "answer": answer,
+        "runs": runs,
+        "warmup": warmup,
+        "times_ns": times_ns,
+        "stats_ns": summarize(times_ns),
+    }
+    if parse_func is not None:
+        result["parse_ns"] = parse_ns
+        result["parse_stats_ns"] = summarize(parse_ns)
+    return result
+
+
+def fmt_ns(ns: float) -> str:
+    """Format nanoseconds as milliseconds with 3 decimals."""
+    return f"{ns / 1e6:.3f}"
+
+
+def write_json(results: List[BenchResult], fpath: str) -> None:
+    """
+    Write benchmark results as JSON, to stdout if fpath is '-'.
+    """
+    content = json.dumps(results, indent=2, default=str)
+    if fpath == "-":
+        print(content)
+        return
+    with open(fpath, "w") as f:
+        f.write(content + "\n")
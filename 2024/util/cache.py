@@ -0,0 +1,144 @@
+# util/cache.py
+import hashlib
+import json
+import os
+import pathlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PATH_CACHE = pathlib.Path(__file__).parent.parent / ".cache" / "answers"
+
+
+def _scalar(obj: Any) -> Any:
+    # NumPy scalar answers like np.int64 expose their Python value via item()
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class AnswerCache:
+    """
+    Persistent content-addressed cache of solver answers.
+
+    Each answer is keyed on a hash of the day's solve.py source,
+    the input file's bytes and the part function's name,
+    so changing any of them naturally misses the cache.
+    Entries are JSON files whose mtime is bumped on every hit,
+    the oldest entries get evicted once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, path: pathlib.Path = PATH_CACHE, max_bytes: int = 2**20):
+        """
+        Initialize the cache.
+
+        Args:
+            path (pathlib.Path): The directory holding the cache entries.
+            max_bytes (int): Size bound of all entries before LRU eviction.
+        """
+        self.path = pathlib.Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, part_func: Callable, fpath: str) -> Optional[str]:
+        """
+        Hash the part's source file, input bytes & part name into a key.
+
+        Returns:
+            Optional[str]: The hex digest, or None if a file can't be read.
+        """
+        # The code object's file is the day's solve.py, builtins have none
+        source = getattr(getattr(part_func, "__code__", None), "co_filename", None)
+        if source is None:
+            return None
+        try:
+            with open(source, "rb") as f:
+                source_bytes = f.read()
+            with open(fpath, "rb") as f:
+                input_bytes = f.read()
+        except OSError:
+            return None
+        digest = hashlib.sha256()
+        for chunk in [source_bytes, input_bytes, part_func.__name__.encode()]:
+            digest.update(hashlib.sha256(chunk).digest())
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> pathlib.Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up an answer, bumping the entry's recency on a hit.
+
+        Returns:
+            Optional[Any]: The cached answer, or None on a miss.
+        """
+        entry = self._entry(key)
+        try:
+            with open(entry, "r") as f:
+                answer = json.load(f)["answer"]
+            os.utime(entry)
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return answer
+
+    def put(self, key: str, answer: Any) -> None:
+        """
+        Store an answer then evict least recently used entries if over size.
+        Answers that can't be serialized to JSON are silently not cached.
+        """
+        try:
+            content = json.dumps({"answer": answer}, default=_scalar)
+        except (TypeError, ValueError):
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first so concurrent workers never see partial files
+        tmp = self.path / f"{key}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(content)
+        os.replace(tmp, self._entry(key))
+        self.evict()
+
+    def entries(self) -> List[Tuple[float, int, pathlib.Path]]:
+        """
+        List (mtime, size, path) of all entries, least recently used first.
+        """
+        if not self.path.exists():
+            return []
+        entries = []
+        for entry in self.path.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue  # Evicted by another process in the meantime
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        return sorted(entries)
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until within max_bytes.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit/miss/eviction counters of this process & current size on disk.
+        """
+        entries = self.entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
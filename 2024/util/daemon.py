@@ -0,0 +1,151 @@
+# util/daemon.py
+import json
+import os
+import pathlib
+import socket
+import socketserver
+import time
+from typing import Any, Dict, Optional
+
+from util.cache import AnswerCache
+from util.sols import execute_part, get_parser, input_paths, registry
+from util.sweep import get_part_func
+
+PATH_SOCKET = pathlib.Path(__file__).parent.parent / ".cache" / "aoc.sock"
+
+Reply = Dict[str, Any]
+
+USAGE = "expected 'solve day D part P input example|real|PATH' or 'ping'"
+
+
+def parse_request(line: str) -> Dict[str, str]:
+    """
+    Parse a request line like 'solve day 6 part 2 input example'.
+
+    Returns:
+        Dict[str, str]: The day (zero padded), part and input of the request.
+    """
+    words = line.split()
+    keywords = ["solve", "day", "part", "input"]
+    if len(words) != 7 or [words[0]] + words[1::2] != keywords:
+        raise ValueError(USAGE)
+    day, part, inp = words[2], words[4], words[6]
+    if not day.isdigit() or not 1 <= int(day) <= 25:
+        raise ValueError(f"invalid day '{day}', expected 1-25")
+    if part not in ["1", "2"]:
+        raise ValueError(f"invalid part '{part}', expected 1 or 2")
+    return {"day": f"{int(day):02d}", "part": part, "input": inp}
+
+
+def _json_default(obj: Any) -> Any:
+    # NumPy scalar answers like np.int64 expose their Python value via item()
+    return obj.item() if hasattr(obj, "item") else str(obj)
+
+
+class WarmSolver:
+    """
+    Keeps day modules imported between requests, re-importing a day only
+    when its solve.py's mtime changes, and answers solve requests.
+    """
+
+    def __init__(self, use_cache: bool = True):
+        self.cache = AnswerCache() if use_cache else None
+
+    def preload(self, days) -> None:
+        """
+        Import the given days up front so their libraries are warm.
+        """
+        for day in days:
+            registry.get(day)
+
+    def handle(self, line: str) -> Reply:
+        """
+        Answer one request line, errors are reported in the reply.
+        """
+        if line.strip() == "ping":
+            return {"pong": True, "pid": os.getpid()}
+        try:
+            request = parse_request(line)
+        except ValueError as e:
+            return {"error": str(e)}
+        return {**request, **self.solve(**request)}
+
+    def solve(self, day: str, part: str, input: str) -> Reply:
+        """
+        Solve a day's part, hot reloading the module if its source changed.
+        The input is 'example', 'real'/'input' or a path to an input file.
+        """
+        reloaded = registry.refresh(day)
+        module = registry.get(day)
+        if module is None:
+            return {"error": f"could not import day {day}", "reloaded": reloaded}
+        func = get_part_func(day, part)
+        if func is None:
+            return {"error": f"no part{part} in day {day}", "reloaded": reloaded}
+
+        path_ex, path_real = input_paths(day)[part]
+        fpath = {"example": path_ex, "real": path_real, "input": path_real}.get(
+            input, pathlib.Path(input)
+        )
+        if not fpath.exists():
+            return {"error": f"input not found: {fpath}", "reloaded": reloaded}
+
+        parser = get_parser(module)
+        tstart = time.perf_counter_ns()
+        answer = execute_part(func, str(fpath), False, self.cache, parser)
+        elapsed = time.perf_counter_ns() - tstart
+        parse_ns = parser.times_ns.get(str(fpath), 0) if parser is not None else 0
+        return {
+            "answer": answer,
+            "ns": elapsed - parse_ns,
+            "parse_ns": parse_ns,
+            "reloaded": reloaded,
+            "error": None if answer is not None else "no solution",
+        }
+
+
+class SolveHandler(socketserver.StreamRequestHandler):
+    """
+    Answers each request line of a connection with one JSON reply line.
+    """
+
+    def handle(self) -> None:
+        for raw in self.rfile:
+            line = raw.decode().strip()
+            if not line:
+                continue
+            reply = self.server.solver.handle(line)  # type: ignore
+            content = json.dumps(reply, default=_json_default) + "\n"
+            self.wfile.write(content.encode())
+
+
+class SolveServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server handling one request at a time with a WarmSolver.
+    Requests are served serially since solvers may use process pools.
+    """
+
+    def __init__(self, path: pathlib.Path, solver: WarmSolver):
+        self.solver = solver
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()  # Stale socket from a previous server
+        super().__init__(str(path), SolveHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        pathlib.Path(self.server_address).unlink(missing_ok=True)  # type: ignore
+
+
+def send(line: str, path: pathlib.Path = PATH_SOCKET, timeout: Optional[float] = None):
+    """
+    Send one request line to a running server and return its decoded reply.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall((line.strip() + "\n").encode())
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("r") as f:
+            return json.loads(f.readline())
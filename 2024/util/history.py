@@ -0,0 +1,155 @@
+# util/history.py
+import hashlib
+import json
+import pathlib
+import subprocess
+import time
+from typing import Any, Dict, List, Optional
+
+PATH_AOC = pathlib.Path(__file__).parent.parent
+PATH_HISTORY = PATH_AOC / ".cache" / "history.jsonl"
+
+Entry = Dict[str, Any]
+
+
+def git_commit(path: pathlib.Path = PATH_AOC) -> Optional[str]:
+    """
+    Short hash of the checked out commit, suffixed with '-dirty'
+    when the tree has uncommitted changes. None outside a git repo.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if status else commit
+
+
+def input_hash(fpath: str) -> str:
+    """
+    Short sha256 of an input file, timings are only comparable on equal inputs.
+    """
+    with open(fpath, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def make_entry(
+    day: str, part: str, kind: str, fpath: str, result: Dict[str, Any], commit=None
+) -> Entry:
+    """
+    Build a history entry from a bench_part result.
+
+    Args:
+        day (str): The zero padded day.
+        part (str): The part, '1' or '2'.
+        kind (str): EXAMPLE or INPUT.
+        fpath (str): The input file, hashed into the entry.
+        result (dict): The bench_part result.
+        commit (str, optional): The git commit, looked up if not given.
+
+    Returns:
+        Entry: The entry, without the raw per run timings.
+    """
+    return {
+        "time": time.time(),
+        "commit": commit if commit is not None else git_commit(),
+        "day": day,
+        "part": part,
+        "input": kind,
+        "input_hash": input_hash(fpath),
+        "runs": result["runs"],
+        "stats_ns": result["stats_ns"],
+        "parse_stats_ns": result.get("parse_stats_ns"),
+    }
+
+
+def append(entries: List[Entry], path: pathlib.Path = PATH_HISTORY) -> None:
+    """
+    Append entries to the JSONL history, one JSON object per line.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+
+def load(path: pathlib.Path = PATH_HISTORY) -> List[Entry]:
+    """
+    Read every entry of the history in the order they were recorded.
+    Lines that fail to parse, e.g. from an interrupted write, are skipped.
+    """
+    if not path.exists():
+        return []
+    entries = []
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+    return entries
+
+
+def same_run(a: Entry, b: Entry) -> bool:
+    """Whether two entries time the same day, part & input file."""
+    keys = ["day", "part", "input", "input_hash"]
+    return all(a.get(k) == b.get(k) for k in keys)
+
+
+def baseline(
+    history: List[Entry], current: Entry, commit: Optional[str] = None
+) -> Optional[Entry]:
+    """
+    Find the entry to compare the current one against.
+
+    Args:
+        history (List[Entry]): Recorded entries, oldest first.
+        current (Entry): The entry being checked, it's never its own baseline.
+        commit (str, optional): Only consider entries whose commit starts
+            with this, otherwise the latest recorded run before the current.
+
+    Returns:
+        Optional[Entry]: The latest matching entry, None if there is none.
+    """
+    for entry in reversed(history):
+        if entry is current or entry == current or not same_run(entry, current):
+            continue
+        if commit is not None and not str(entry.get("commit")).startswith(commit):
+            continue
+        return entry
+    return None
+
+
+def compare(base: Entry, current: Entry, threshold: float) -> Dict[str, Any]:
+    """
+    Compare the median solve time of two entries.
+
+    Args:
+        base (Entry): The baseline entry.
+        current (Entry): The entry being checked.
+        threshold (float): Percentage slowdown above which it's a regression.
+
+    Returns:
+        Dict[str, Any]: Both medians, the change in percent & regression flag.
+    """
+    base_ns = base["stats_ns"]["median"]
+    current_ns = current["stats_ns"]["median"]
+    change = (current_ns - base_ns) / base_ns * 100 if base_ns else 0.0
+    return {
+        "base_ns": base_ns,
+        "current_ns": current_ns,
+        "change": change,
+        "regression": change > threshold,
+    }
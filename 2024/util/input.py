@@ -1,6 +1,151 @@
-from typing import List
+import mmap
+import os
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# A read-only mapping of an input file, or empty bytes for an empty file
+Buffer = Union[mmap.mmap, bytes]
+
+# Bytes of an input handled at once by chunked readers, bounds their temporaries
+CHUNK_BYTES: int = 64 * 2**20
+
 
 def input_lines(input_file_path: str) -> List[str]:
     with open(input_file_path, "r") as f:
         lines = f.read().splitlines()
     return lines
+
+
+def map_input(fpath: str) -> Buffer:
+    """
+    Memory map an input file read-only, so nothing is copied until used.
+    The mapping stays open as long as something (e.g. a view) references it.
+
+    Returns:
+        Buffer: The mmap, usable like bytes, e.g. for re.finditer(rb"...", buf),
+            or b"" since empty files can't be mapped.
+    """
+    with open(fpath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_lines(fpath: str) -> Iterator[memoryview]:
+    """
+    Lazily yield the lines of an input file as zero-copy memoryview slices
+    of its mapping, without line endings. Decode one with str(line, "ascii")
+    or compare it to bytes, e.g. line == b"...".
+    """
+    buf = map_input(fpath)
+    view = memoryview(buf)
+    start, end = 0, len(buf)
+    while start < end:
+        stop = buf.find(b"\n", start)
+        stop = end if stop < 0 else stop
+        line_end = stop - 1 if stop > start and buf[stop - 1] == ord("\r") else stop
+        yield view[start:line_end]
+        start = stop + 1
+
+
+def read_grid(fpath: str) -> "np.ndarray":
+    """
+    A read-only (rows, cols) uint8 view of a character grid file, straight
+    on its mapping with no per-line strings, e.g. grid == ord("#").
+
+    Raises:
+        ValueError: If the file is empty or its lines differ in width.
+    """
+    import numpy as np
+    from numpy.lib.stride_tricks import as_strided
+
+    buf = map_input(fpath)
+    cols = buf.find(b"\n")
+    if len(buf) == 0 or cols == 0:
+        raise ValueError(f"No grid in {fpath}")
+    cols = len(buf) if cols < 0 else cols  # A single line without a newline
+    sep = 2 if buf[cols - 1] == ord("\r") else 1  # CRLF or LF line endings
+    cols -= sep - 1
+    stride = cols + sep
+    rows = (len(buf) + sep) // stride
+    data = np.frombuffer(buf, dtype=np.uint8)
+    # With the last line ending in a newline or not, no line may be off width
+    ends = rows if len(data) == rows * stride else rows - 1
+    newlines = data[stride - 1 :: stride][:ends]
+    grid = as_strided(data, shape=(rows, cols), strides=(stride, 1), writeable=False)
+    if (
+        len(data) not in [rows * stride - sep, rows * stride]
+        or len(newlines) != ends
+        or (newlines != ord("\n")).any()
+        or (grid == ord("\n")).any()
+    ):
+        raise ValueError(f"Lines of {fpath} differ in width")
+    return grid
+
+
+def iter_chunks(fpath: str, chunk_bytes: Optional[int] = None) -> Iterator[memoryview]:
+    """
+    Yield zero-copy views of the mapped input, each about chunk_bytes long
+    (default CHUNK_BYTES) and cut after a newline so no line is split
+    between two chunks. A line longer than a chunk is yielded whole.
+    """
+    chunk_bytes = chunk_bytes if chunk_bytes else CHUNK_BYTES
+    buf = map_input(fpath)
+    view = memoryview(buf)
+    start = 0
+    while start < len(buf):
+        end = min(start + chunk_bytes, len(buf))
+        if end < len(buf):
+            newline = buf.rfind(b"\n", start, end)
+            if newline < 0:
+                newline = buf.find(b"\n", end)
+            end = newline + 1 if newline >= 0 else len(buf)
+        yield view[start:end]
+        start = end
+
+
+def _int_tokens(buf) -> "Tuple[np.ndarray, np.ndarray]":
+    # The ints of buf and the byte offset each starts at, see parse_ints
+    import numpy as np
+
+    digits = np.frombuffer(buf, dtype=np.uint8) - ord("0")
+    is_digit = digits < 10  # Anything below '0' wraps around as uint8
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+    values = np.zeros(len(starts), dtype=np.int64)
+    for k in range(lengths.max(initial=0)):
+        more = lengths > k  # Numbers that still have a k-th digit
+        values[more] = values[more] * 10 + digits[starts[more] + k]
+    return values, starts
+
+
+def parse_ints(buf) -> "np.ndarray":
+    """
+    Parse the non-negative ints separated by anything but digits
+    from a bytes-like buffer into an int64 array, without Python ints,
+    in one vectorized pass per digit of the longest number.
+    """
+    return _int_tokens(buf)[0]
+
+
+def parse_int_rows(buf, fill: int = 0) -> "Tuple[np.ndarray, np.ndarray]":
+    """
+    Parse lines of ints of any count into a (lines, longest) int64 matrix
+    padded with fill, like parse_ints. Lines without ints are skipped.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The padded matrix & each row's length.
+    """
+    import numpy as np
+
+    values, starts = _int_tokens(buf)
+    newlines = np.flatnonzero(np.frombuffer(buf, dtype=np.uint8) == ord("\n"))
+    lines = np.searchsorted(newlines, starts)  # Line of each int, ascending
+    _, rows, lengths = np.unique(lines, return_inverse=True, return_counts=True)
+    offsets = np.cumsum(lengths) - lengths
+    matrix = np.full((len(lengths), lengths.max(initial=0)), fill, dtype=np.int64)
+    matrix[rows, np.arange(len(values)) - offsets[rows]] = values
+    return matrix, lengths
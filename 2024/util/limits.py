@@ -0,0 +1,137 @@
+# util/limits.py
+import multiprocessing
+import os
+import signal
+import time
+import traceback
+from typing import Any, Dict, Optional
+
+from util.memory import max_rss_bytes, peak_rss_bytes, reset_peak_rss
+from util.sols import get_parser, load_day, warm_day
+from util.sweep import get_part_func
+
+try:
+    import resource
+except ImportError:  # Not available on Windows, memory caps are then skipped
+    resource = None  # type: ignore
+
+LimitedResult = Dict[str, Any]
+
+# Statuses of a limited run, ERROR covers exceptions & crashes
+OK, TIMEOUT, OOM, ERROR = "ok", "timed out", "OOM", "error"
+
+# Exit codes of a child killed by a failed allocation, C extensions tend to
+# abort() rather than raise MemoryError & the kernel's OOM killer sends SIGKILL
+_OOM_EXITCODES = {-signal.SIGABRT, -signal.SIGKILL}
+
+
+def _solve_child(day: str, part: str, fpath: str, debug: bool, max_mem, conn):
+    # New process group so pools started by the solver are killed along with it
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    if max_mem is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_mem, max_mem))
+
+    result: LimitedResult = {"status": OK, "answer": None, "error": None}
+    module = load_day(day)
+    func = get_part_func(day, part)
+    parser = get_parser(module)
+    warm_day(module)
+    measured = reset_peak_rss()
+    tstart = time.perf_counter_ns()
+    try:
+        data = parser(fpath) if parser is not None else fpath
+        if debug:
+            result["answer"] = func(data, debug=True)
+        else:
+            result["answer"] = func(data)
+    except MemoryError:
+        result = {**result, "status": OOM, "error": "MemoryError"}
+    except Exception as e:
+        traceback.print_exc()
+        result = {**result, "status": ERROR, "error": f"{type(e).__name__}: {e}"}
+    elapsed = time.perf_counter_ns() - tstart
+    parse_ns = parser.times_ns.get(fpath, 0) if parser is not None else 0
+    result["ns"] = elapsed - parse_ns
+    result["parse_ns"] = parse_ns
+    # Forked children start with their parent's peak, reset it if possible
+    result["max_rss_bytes"] = peak_rss_bytes() if measured else max_rss_bytes()
+    # NumPy scalars are sent as plain Python values
+    if hasattr(result["answer"], "item"):
+        result["answer"] = result["answer"].item()
+    conn.send(result)
+    conn.close()
+
+
+def _kill_group(process: multiprocessing.Process) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGKILL)  # type: ignore
+    except (AttributeError, ProcessLookupError):
+        process.kill()  # No process groups, or the child hasn't made its own yet
+    process.join()
+
+
+def run_limited(
+    day: str,
+    part: str,
+    fpath: str,
+    debug: bool = False,
+    timeout: Optional[float] = None,
+    max_mem_mb: Optional[int] = None,
+) -> LimitedResult:
+    """
+    Solve a day's part in a child process bounded in time and memory.
+
+    The child imports the day itself so this works with any start method.
+    The memory cap is an RLIMIT_AS address space limit, so it must leave room
+    for the interpreter & libraries like numpy on top of the solver's data.
+
+    Args:
+        day (str): The zero padded day.
+        part (str): The part, '1' or '2', falling back to part1 like the runner.
+        fpath (str): The path to the input file.
+        debug (bool): Passed through to the part function.
+        timeout (float, optional): Wall clock seconds before the child is killed.
+        max_mem_mb (int, optional): Address space limit of the child in MiB.
+
+    Returns:
+        LimitedResult: The status (ok, timed out, OOM or error), the answer,
+            solve & parse nanoseconds, the child's max RSS in bytes (None if
+            it didn't report back) and an error message if any.
+    """
+    max_mem = max_mem_mb * 2**20 if max_mem_mb is not None else None
+    recv, send = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_solve_child, args=(day, part, fpath, debug, max_mem, send)
+    )
+    tstart = time.perf_counter_ns()
+    process.start()
+    send.close()  # Only the child writes, so EOF shows up if it dies
+
+    # Wait on the pipe rather than the process so large results can't deadlock
+    ready = recv.poll(timeout)
+    elapsed = time.perf_counter_ns() - tstart
+    result: Optional[LimitedResult] = None
+    if ready:
+        try:
+            result = recv.recv()
+        except EOFError:
+            pass  # Died before sending, e.g. killed by the kernel
+    recv.close()
+    if result is not None:
+        process.join()
+        return result
+
+    failed: LimitedResult = {"answer": None, "ns": elapsed, "parse_ns": 0}
+    failed["max_rss_bytes"] = None  # The child never reported back
+    if not ready:
+        _kill_group(process)
+        return {**failed, "status": TIMEOUT, "error": f"exceeded {timeout}s"}
+    # The child closed the pipe by dying, reap it before killing its pool
+    process.join()
+    _kill_group(process)
+    msg = f"exit code {process.exitcode}"
+    if max_mem is not None and process.exitcode in _OOM_EXITCODES:
+        msg += f" with {max_mem_mb} MiB limit"
+        return {**failed, "status": OOM, "error": msg}
+    return {**failed, "status": ERROR, "error": msg}
@@ -0,0 +1,185 @@
+# util/memory.py
+import linecache
+import pathlib
+import sys
+import threading
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from util.sols import ParseOnce, execute_part
+
+try:
+    import resource
+except ImportError:  # Not available on Windows, RSS is then skipped
+    resource = None  # type: ignore
+
+MemResult = Dict[str, Any]
+
+PATH_AOC = pathlib.Path(__file__).parent.parent
+
+# Files whose allocations are bookkeeping of the measurement or import system
+_IGNORED_FILES = [
+    tracemalloc.__file__,
+    threading.__file__,
+    linecache.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+]
+
+
+def max_rss_bytes(children: bool = False) -> Optional[int]:
+    """
+    Max resident set size of this process (or its reaped children) in bytes.
+    Returns None where the resource module is unavailable.
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    maxrss = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes while macOS reports bytes
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset this process' peak RSS to its current RSS, so peak_rss_bytes()
+    covers only what runs next, e.g. one job of a long lived worker.
+    Linux only, returns False where the peak can't be reset.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Peak RSS of this process since the last reset_peak_rss() in bytes,
+    None where /proc/self/status is unavailable.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class PeakSnapshotter:
+    """
+    Background thread that snapshots tracemalloc whenever traced memory
+    grows past the last snapshot by `growth`, so the kept snapshot shows
+    the allocation sites alive close to the peak rather than at the end.
+    """
+
+    def __init__(self, interval: float = 0.01, growth: float = 1.1):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_bytes * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_bytes = current
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.sample()  # Short runs may finish before the first interval
+
+
+def mem_part(
+    part_func: Callable[[Any, bool], int],
+    fpath: str,
+    debug: bool = False,
+    parse_func: Optional[Callable[[str], Any]] = None,
+    top: int = 10,
+) -> MemResult:
+    """
+    Run a part once under tracemalloc, parsing included if the day has a hook.
+
+    Args:
+        part_func (callable): The part1 or part2 function to measure.
+        fpath (str): The path to the input file.
+        debug (bool): Passed through to the part function.
+        parse_func (callable, optional): The day's parse(fpath) hook.
+        top (int): Number of allocation sites to report.
+
+    Returns:
+        MemResult: The answer, traced peak bytes, top allocation sites
+            and the growth of the process' max RSS in bytes.
+    """
+    parser = ParseOnce(parse_func) if parse_func is not None else None
+    rss_before = max_rss_bytes()
+    rss_children_before = max_rss_bytes(children=True)
+
+    tracemalloc.start()
+    snapshotter = PeakSnapshotter()
+    snapshotter.start()
+    try:
+        answer = execute_part(part_func, fpath, debug, None, parser)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        snapshotter.stop()
+        tracemalloc.stop()
+
+    rss_after = max_rss_bytes()
+    rss_children_after = max_rss_bytes(children=True)
+
+    sites: List[Dict[str, Any]] = []
+    if snapshotter.snapshot is not None:
+        filters = [tracemalloc.Filter(False, f) for f in _IGNORED_FILES]
+        snapshot = snapshotter.snapshot.filter_traces(filters)
+        for stat in snapshot.statistics("lineno")[:top]:
+            frame = stat.traceback[0]
+            site = f"{short_path(frame.filename)}:{frame.lineno}"
+            sites.append({"site": site, "bytes": stat.size, "count": stat.count})
+
+    def delta(before: Optional[int], after: Optional[int]) -> Optional[int]:
+        return after - before if before is not None and after is not None else None
+
+    return {
+        "answer": answer,
+        "peak_bytes": peak,
+        "snapshot_bytes": snapshotter.snapshot_bytes,
+        "rss_delta_bytes": delta(rss_before, rss_after),
+        "rss_children_delta_bytes": delta(rss_children_before, rss_children_after),
+        "top": sites,
+    }
+
+
+def short_path(fpath: str) -> str:
+    """
+    Path relative to the year's directory, or the last two parts outside it.
+    """
+    path = pathlib.Path(fpath)
+    if path.is_relative_to(PATH_AOC):
+        return str(path.relative_to(PATH_AOC))
+    return str(pathlib.Path(*path.parts[-2:]))
+
+
+def fmt_bytes(nbytes: Optional[float]) -> str:
+    """Format a byte count with a binary unit, '-' if unknown."""
+    if nbytes is None:
+        return "-"
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(nbytes) < 1024:
+            return f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+    return f"{nbytes:.1f} GiB"
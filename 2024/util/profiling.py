@@ -0,0 +1,127 @@
+# util/profiling.py
+import cProfile
+import os
+import pathlib
+import pstats
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from util.sols import ParseOnce, execute_part
+
+PATH_PROFILES = pathlib.Path(__file__).parent.parent / ".cache" / "profiles"
+
+FuncKey = Tuple[str, int, str]  # (filename, lineno, funcname) as used by pstats
+
+# Paths carrying less than this many seconds are pruned from collapsed stacks
+MIN_STACK_SECONDS = 1e-6
+
+
+def profile_part(
+    part_func: Callable[[Any, bool], int],
+    fpath: str,
+    debug: bool = False,
+    parse_func: Optional[Callable[[str], Any]] = None,
+) -> Tuple[Optional[Any], pstats.Stats]:
+    """
+    Run a part once under cProfile, parsing included if the day has a hook.
+
+    Returns:
+        Tuple[Optional[Any], pstats.Stats]: The answer and the profile stats.
+    """
+    parser = ParseOnce(parse_func) if parse_func is not None else None
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(execute_part, part_func, fpath, debug, None, parser)
+    return answer, pstats.Stats(profiler)
+
+
+def func_label(func: FuncKey) -> str:
+    """
+    Readable name for a pstats function key, e.g. 'blink (solve.py:40)'.
+    """
+    filename, lineno, funcname = func
+    if filename == "~":  # Built-ins have no source file
+        return funcname
+    return f"{funcname} ({os.path.basename(filename)}:{lineno})"
+
+
+def top_functions(stats: pstats.Stats, sort: str, n: int) -> List[Dict[str, Any]]:
+    """
+    Top n functions sorted by 'cumulative' or 'tottime' (self) seconds.
+    """
+    index = {"cumulative": 3, "tottime": 2}[sort]
+    rows = sorted(
+        stats.stats.items(),  # type: ignore
+        key=lambda item: item[1][index],
+        reverse=True,
+    )
+    return [
+        {"func": func_label(func), "ncalls": nc, "tottime": tt, "cumtime": ct}
+        for func, (cc, nc, tt, ct, callers) in rows[:n]
+    ]
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, int]:
+    """
+    Reconstruct collapsed stacks in microseconds from the profile's call graph.
+
+    cProfile only records caller -> callee edges, not whole stacks,
+    so time through a function is split across its callers in proportion
+    to the time each caller spent in it. Recursive edges are cut.
+
+    Returns:
+        Dict[str, int]: 'root;caller;callee' stacks mapped to self time.
+    """
+    raw = stats.stats  # type: ignore
+    callees: Dict[FuncKey, Dict[FuncKey, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]  # Cumulative time of this edge
+
+    stacks: Dict[str, float] = defaultdict(float)
+
+    def walk(func: FuncKey, stack: List[FuncKey], share: float) -> None:
+        # share is the fraction of func's total time that belongs to this stack
+        stack = stack + [func]
+        _, _, tt, ct, _ = raw[func]
+        if tt * share > 0:
+            key = ";".join(func_label(f).replace(";", ",") for f in stack)
+            stacks[key] += tt * share
+        for callee, edge_ct in callees.get(func, {}).items():
+            callee_ct = raw[callee][3]
+            if callee in stack or callee_ct <= 0:
+                continue
+            if edge_ct * share < MIN_STACK_SECONDS:
+                continue
+            walk(callee, stack, edge_ct * share / callee_ct)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        # Roots have no callers, skip the profiler's own disable() call
+        if not callers and "_lsprof.Profiler" not in func[2]:
+            walk(func, [], 1.0)
+
+    micros = {stack: round(secs * 1e6) for stack, secs in stacks.items()}
+    return {stack: us for stack, us in micros.items() if us > 0}
+
+
+def write_profile(
+    stats: pstats.Stats, name: str, path: pathlib.Path = PATH_PROFILES
+) -> Tuple[pathlib.Path, pathlib.Path]:
+    """
+    Write the .pstats dump and a flamegraph compatible collapsed stack file.
+
+    Args:
+        stats (pstats.Stats): The profile stats to write.
+        name (str): Base file name, e.g. 'day06-part2-input'.
+        path (pathlib.Path): Directory to write into.
+
+    Returns:
+        Tuple[pathlib.Path, pathlib.Path]: The .pstats & .collapsed paths.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    path_pstats = path / f"{name}.pstats"
+    path_collapsed = path / f"{name}.collapsed"
+    stats.dump_stats(path_pstats)
+    with open(path_collapsed, "w") as f:
+        for stack, us in sorted(collapsed_stacks(stats).items()):
+            f.write(f"{stack} {us}\n")
+    return path_pstats, path_collapsed
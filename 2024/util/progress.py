@@ -0,0 +1,79 @@
+# util/progress.py
+import threading
+import time
+from typing import Dict, Optional
+
+from rich.live import Live
+from rich.text import Text
+
+from util.sols import console, reset_work, work_counts
+
+
+def fmt_work(counts: Dict[str, int], seconds: float) -> str:
+    """
+    Format work counts with their rates, e.g. '1,234 candidate (5,678/s)'.
+    """
+    parts = []
+    for kind, count in sorted(counts.items()):
+        rate = f"{count / seconds:,.0f}/s" if seconds > 0 else "-"
+        parts.append(f"{count:,} {kind} ({rate})")
+    return " - ".join(parts)
+
+
+class WorkSampler:
+    """
+    Background thread sampling the work counters solvers report through
+    util.sols.work, showing the rate of the last interval live while the
+    solve runs. Nothing is shown for solvers that never report work.
+    The totals & overall rate since start() are kept once stopped.
+    """
+
+    def __init__(self, interval: float = 0.5, live: bool = True):
+        self.interval = interval
+        self.totals: Dict[str, int] = {}
+        self.seconds = 0.0
+        self._live: Optional[Live] = None
+        if live:
+            self._live = Live(console=console, transient=True, auto_refresh=False)
+        self._last: Dict[str, int] = {}
+        self._tstart = 0.0
+        self._tlast = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        counts = work_counts()
+        now = time.perf_counter()
+        if counts and self._live is not None:
+            delta = {k: n - self._last.get(k, 0) for k, n in counts.items()}
+            msg = fmt_work(delta, now - self._tlast)
+            totals = ", ".join(f"{n:,} {k}" for k, n in sorted(counts.items()))
+            text = Text(f"{msg} - total {totals}", style="blue")
+            if not self._live.is_started:
+                self._live.start()  # Only once there's something to show
+            self._live.update(text, refresh=True)
+        self._last, self._tlast = counts, now
+
+    def start(self) -> None:
+        reset_work()
+        self._tstart = self._tlast = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        if self._live is not None and self._live.is_started:
+            self._live.stop()
+        self.totals = work_counts()
+        self.seconds = time.perf_counter() - self._tstart
+        reset_work()
+
+    def summary(self) -> Optional[str]:
+        """
+        The totals & overall rates, None if the solver reported no work.
+        """
+        return fmt_work(self.totals, self.seconds) if self.totals else None
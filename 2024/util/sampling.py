@@ -0,0 +1,218 @@
+# util/sampling.py
+import contextlib
+import linecache
+import multiprocessing.util
+import os
+import pathlib
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from types import FrameType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from util.profiling import PATH_PROFILES, FuncKey, func_label
+from util.sols import ParseOnce, execute_part
+
+# A sampled stack, root first, and the line the innermost frame was on
+SampleKey = Tuple[Tuple[FuncKey, ...], int]
+
+# Stacks are cut at the runner's frame & pool workers' stacks at their loop
+ROOT_FUNC = "execute_part"
+WORKER_FUNC = "_process_worker"
+WORKER_LABEL = "<pool worker>"
+
+# Worker frames directly under the worker loop in here are waiting for work
+_IDLE_DIR = os.path.dirname(multiprocessing.util.__file__)
+
+
+def stack_key(frame: FrameType) -> Optional[SampleKey]:
+    """
+    The stack of a frame up to execute_part or a pool worker's loop,
+    None if the frame is outside both or a worker waiting for work.
+    """
+    line = frame.f_lineno
+    stack: List[FuncKey] = []
+    current: Optional[FrameType] = frame
+    while current is not None:
+        code = current.f_code
+        if code.co_name == WORKER_FUNC:
+            if not stack or stack[-1][0].startswith(_IDLE_DIR):
+                return None
+            stack.append(("~", 0, WORKER_LABEL))
+            return tuple(reversed(stack)), line
+        stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+        if code.co_name == ROOT_FUNC:
+            return tuple(reversed(stack)), line
+        current = current.f_back
+    return None
+
+
+class StackSampler:
+    """
+    Background thread capturing a thread's stack from sys._current_frames()
+    hz times a second. Unlike cProfile nothing runs on each call, so tight
+    loops run near full speed. The sampler needs the GIL to take a sample,
+    so a busy solver thread is sampled at most every sys.getswitchinterval().
+    """
+
+    def __init__(self, hz: float = 200.0, thread_id: Optional[int] = None):
+        self.interval = 1.0 / hz
+        # Default to the thread creating the sampler, i.e. the solving thread
+        self.thread_id = thread_id if thread_id else threading.get_ident()
+        self.samples: Counter = Counter()
+        self.seconds = 0.0
+        self._tstart = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        frame = sys._current_frames().get(self.thread_id)
+        key = stack_key(frame) if frame is not None else None
+        if key is not None:
+            self.samples[key] += 1
+
+    def start(self) -> None:
+        self._tstart = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.seconds = time.perf_counter() - self._tstart
+
+
+def _dump_worker(sampler: StackSampler, out_dir: str) -> None:
+    sampler.stop()
+    with open(os.path.join(out_dir, f"worker-{os.getpid()}.pkl"), "wb") as f:
+        pickle.dump(dict(sampler.samples), f)
+
+
+def _init_worker(
+    out_dir: str, hz: float, initializer: Optional[Callable], initargs: Tuple
+) -> None:
+    """
+    Pool worker initializer starting a sampler on the worker's main thread,
+    its samples are dumped to out_dir when the worker exits.
+    """
+    sampler = StackSampler(hz)
+    sampler.start()
+    # Worker processes skip atexit but run multiprocessing finalizers
+    multiprocessing.util.Finalize(
+        None, _dump_worker, args=(sampler, out_dir), exitpriority=10
+    )
+    if initializer is not None:
+        initializer(*initargs)
+
+
+@contextlib.contextmanager
+def sample_pools(hz: float = 200.0) -> Iterator[Counter]:
+    """
+    Sample every worker of the ProcessPoolExecutors created inside the block,
+    e.g. by a solver fanning out on its own. Yields a Counter that holds the
+    workers' samples once the block exits, their pools must be shut down.
+    """
+    out_dir = tempfile.mkdtemp(prefix="aoc-sample-")
+    samples: Counter = Counter()
+    original = ProcessPoolExecutor.__init__
+
+    def __init__(
+        self, max_workers=None, mp_context=None, initializer=None, initargs=(), **kw
+    ):
+        initargs = (out_dir, hz, initializer, initargs)
+        original(self, max_workers, mp_context, _init_worker, initargs, **kw)
+
+    ProcessPoolExecutor.__init__ = __init__  # type: ignore
+    try:
+        yield samples
+    finally:
+        ProcessPoolExecutor.__init__ = original  # type: ignore
+        for name in sorted(os.listdir(out_dir)):
+            with open(os.path.join(out_dir, name), "rb") as f:
+                samples.update(pickle.load(f))
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def sample_part(
+    part_func: Callable[[Any, bool], int],
+    fpath: str,
+    debug: bool = False,
+    parse_func: Optional[Callable[[str], Any]] = None,
+    hz: float = 200.0,
+) -> Tuple[Optional[Any], Dict[str, Any]]:
+    """
+    Run a part once under the sampling profiler, parsing included if the day
+    has a hook, along with any process pool workers the part starts.
+
+    Returns:
+        Tuple[Optional[Any], Dict[str, Any]]: The answer and the 'samples'
+            Counter of SampleKeys, wall 'seconds' & 'worker_samples' count.
+    """
+    parser = ParseOnce(parse_func) if parse_func is not None else None
+    sampler = StackSampler(hz)
+    with sample_pools(hz) as worker_samples:
+        sampler.start()
+        answer = execute_part(part_func, fpath, debug, None, parser)
+        sampler.stop()
+    samples = sampler.samples + worker_samples
+    result = {
+        "samples": samples,
+        "seconds": sampler.seconds,
+        "worker_samples": sum(worker_samples.values()),
+    }
+    return answer, result
+
+
+def hot_lines(samples: Counter, n: int) -> List[Dict[str, Any]]:
+    """
+    Top n source lines by the samples the innermost frame was on them.
+    """
+    lines: Counter = Counter()
+    for (stack, line), count in samples.items():
+        filename, _, funcname = stack[-1]
+        lines[(filename, line, funcname)] += count
+    total = sum(lines.values())
+    return [
+        {
+            "line": func_label(key),
+            "source": linecache.getline(key[0], key[1]).strip(),
+            "samples": count,
+            "percent": 100 * count / total,
+        }
+        for key, count in lines.most_common(n)
+    ]
+
+
+def collapsed_samples(samples: Counter) -> Dict[str, int]:
+    """
+    Collapsed 'root;caller;callee' stacks mapped to their sample counts.
+    """
+    stacks: Counter = Counter()
+    for (stack, _), count in samples.items():
+        stacks[";".join(func_label(f).replace(";", ",") for f in stack)] += count
+    return dict(stacks)
+
+
+def write_samples(
+    samples: Counter, name: str, path: pathlib.Path = PATH_PROFILES
+) -> pathlib.Path:
+    """
+    Write a flamegraph compatible collapsed stack file of the samples.
+
+    Returns:
+        pathlib.Path: The written '{name}.sampled.collapsed' path.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    path_collapsed = path / f"{name}.sampled.collapsed"
+    with open(path_collapsed, "w") as f:
+        for stack, count in sorted(collapsed_samples(samples).items()):
+            f.write(f"{stack} {count}\n")
+    return path_collapsed
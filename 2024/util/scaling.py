@@ -0,0 +1,151 @@
+# util/scaling.py
+import contextlib
+import math
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from util.memory import mem_part
+from util.sols import ParseOnce, execute_part
+
+ScalingPoint = Dict[str, Any]
+
+# Exponents above this are flagged, e.g. a quadratic solver fits k ~ 2
+SUPERLINEAR_K = 1.3
+
+
+def fit_exponent(sizes: List[float], values: List[float]) -> Tuple[float, float]:
+    """
+    Least squares fit of values ~ c * size^k on a log-log scale.
+
+    Args:
+        sizes (List[float]): The input sizes, all positive.
+        values (List[float]): The measured times or bytes, all positive.
+
+    Returns:
+        Tuple[float, float]: The exponent k and the r^2 of the fit.
+    """
+    if len(sizes) < 2:
+        raise ValueError("Fitting an exponent needs at least two sizes.")
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(v) for v in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    k = sxy / sxx
+    r2 = (sxy * sxy) / (sxx * syy) if syy > 0 else 1.0
+    return k, r2
+
+
+@contextlib.contextmanager
+def generated_input(
+    generate: Callable[[int, int], str], size: int, seed: int = 0
+) -> Iterator[Tuple[str, int]]:
+    """
+    Write a generated input to a temporary file, removed once the block exits.
+    Yields the file's path & its length in bytes.
+    """
+    content = generate(size, seed)
+    fd, fpath = tempfile.mkstemp(suffix=".txt", prefix=f"scaling-{size}-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        yield fpath, len(content)
+    finally:
+        os.remove(fpath)
+
+
+def scale_part(
+    part_func: Callable[[Any, bool], int],
+    generate: Callable[[int, int], str],
+    sizes: List[int],
+    parse_func: Optional[Callable[[str], Any]] = None,
+    budget: float = 10.0,
+    measure_mem: bool = True,
+    seed: int = 0,
+    on_point: Optional[Callable[[ScalingPoint], None]] = None,
+) -> List[ScalingPoint]:
+    """
+    Solve a part on generated inputs of increasing size.
+
+    The smallest size is solved once untimed first, so imports & other first
+    call costs don't land on the first point and skew the fit.
+    Sizes are tried in order until one run takes longer than the budget
+    or gives no answer, so slow solvers stop before the largest sizes.
+    Each size is timed once without tracing and, if measure_mem,
+    measured again under tracemalloc.
+
+    Args:
+        part_func (callable): The part1 or part2 function to scale.
+        generate (callable): The day's generate(size, seed) hook.
+        sizes (List[int]): The sizes to pass to generate, ascending.
+        parse_func (callable, optional): The day's parse(fpath) hook.
+        budget (float): Seconds of a single run after which larger sizes stop.
+        measure_mem (bool): Whether to measure the traced peak memory too.
+        seed (int): Passed through to generate.
+        on_point (callable, optional): Called with each point once measured.
+
+    Returns:
+        List[ScalingPoint]: Size, input bytes, answer, solve & parse ns,
+            peak traced bytes (None if not measured) of every size run
+            and why larger sizes were skipped, 'stop' of the last point
+            ('no answer' or 'over budget'), None on every other point.
+    """
+    if sizes:
+        with generated_input(generate, min(sizes), seed) as (fpath, _):
+            parser = ParseOnce(parse_func) if parse_func is not None else None
+            execute_part(part_func, fpath, parser=parser)
+
+    points = []
+    for size in sizes:
+        with generated_input(generate, size, seed) as (fpath, nbytes):
+            parser = ParseOnce(parse_func) if parse_func is not None else None
+            tstart = time.perf_counter_ns()
+            answer = execute_part(part_func, fpath, parser=parser)
+            elapsed = time.perf_counter_ns() - tstart
+            parse_ns = parser.times_ns.get(fpath, 0) if parser is not None else 0
+            peak = None
+            if measure_mem:
+                peak = mem_part(part_func, fpath, parse_func=parse_func)["peak_bytes"]
+        stop = None
+        if answer is None:
+            stop = "no answer"
+        elif elapsed / 1e9 > budget:
+            stop = "over budget"
+        point = {
+            "size": size,
+            "bytes": nbytes,
+            "answer": answer,
+            "ns": elapsed - parse_ns,
+            "parse_ns": parse_ns,
+            "peak_bytes": peak,
+            "stop": stop,
+        }
+        points.append(point)
+        if on_point is not None:
+            on_point(point)
+        if stop is not None:
+            break
+    return points
+
+
+def fit_points(points: List[ScalingPoint]) -> Dict[str, Optional[Tuple[float, float]]]:
+    """
+    Fit time & memory exponents against input bytes of the solved points,
+    so a solver linear in the number of grid cells fits k ~ 1.
+
+    Returns:
+        Dict[str, Optional[Tuple[float, float]]]: (k, r^2) of 'ns',
+            'parse_ns' & 'peak_bytes', None where there's too little data.
+    """
+    solved = [p for p in points if p["answer"] is not None]
+    fits: Dict[str, Optional[Tuple[float, float]]] = {}
+    for key in ["ns", "parse_ns", "peak_bytes"]:
+        pairs = [(p["bytes"], p[key]) for p in solved if p[key]]
+        fits[key] = None
+        if len(pairs) >= 2:
+            fits[key] = fit_exponent(*map(list, zip(*pairs)))  # type: ignore
+    return fits
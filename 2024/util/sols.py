@@ -1,16 +1,48 @@
 # util/sols.py
 import importlib.util
 import os
+import pathlib
 import sys
+import time
 import traceback
 from rich.console import Console
 from rich.panel import Panel
 
-from typing import Literal, Optional, Callable, Any
+from typing import Literal, Optional, Callable, Any, Dict, Tuple, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from util.cache import AnswerCache
 
 console = Console()
 cprint = console.print
 
+# Work done by the running solver per kind, e.g. {"candidate": 1234}
+# Only the solving thread writes, the runner's sampler thread only copies it
+_work: Dict[str, int] = {}
+
+# Modules whose warm hook already ran in this process
+_warmed: Set[int] = set()
+
+
+def work(n: int = 1, kind: str = "item") -> None:
+    """
+    Report n items of work done, e.g. work(kind="blink") once per blink,
+    so the runner can show how fast a long solve is progressing.
+    Cheap enough for per-item calls in outer loops, not the innermost ones.
+    """
+    _work[kind] = _work.get(kind, 0) + n
+
+
+def work_counts() -> Dict[str, int]:
+    """
+    Returns a copy of the work reported since the last reset_work().
+    """
+    return dict(_work)
+
+
+def reset_work() -> None:
+    _work.clear()
+
 
 def print_solution(
     sol: str,
@@ -62,6 +94,32 @@ def read_lines(fpath: str) -> list[str]:
     return lines
 
 
+def input_paths(day: str) -> Dict[str, Tuple[pathlib.Path, pathlib.Path]]:
+    """
+    The (example, real) input paths of each part of a day.
+    Part 2 uses example2.txt & input2.txt when they exist.
+
+    Args:
+        day (str): The day directory name (e.g., '01').
+
+    Returns:
+        dict: Maps part '1' & '2' to its (example, real) input paths.
+    """
+    path_day = pathlib.Path(__file__).parent.parent / day
+    path_real = path_day / "input.txt"
+    path_real2 = path_day / "input2.txt"
+    path_ex = path_day / "example.txt"
+    path_ex2 = path_day / "example2.txt"
+
+    # If either example2.txt or input2.txt doesn't exist use the first
+    if not path_ex2.exists():
+        path_ex2 = path_ex
+    if not path_real2.exists():
+        path_real2 = path_real
+
+    return {"1": (path_ex, path_real), "2": (path_ex2, path_real2)}
+
+
 def dynamic_import(day: str) -> Optional[object]:
     """
     Dynamically imports the solve.py module from the given day directory.
@@ -100,9 +158,13 @@ def dynamic_import(day: str) -> Optional[object]:
         return None
 
     module = importlib.util.module_from_spec(spec)
+    # Register before executing so functions defined in the module can be
+    # pickled by name, e.g. when a solver hands them to a process pool
+    sys.modules[module_name] = module
     try:
         spec.loader.exec_module(module)
     except Exception as e:
+        sys.modules.pop(module_name, None)
         console.print(
             f"[bold red]Error importing module '{module_name}': {e}[/bold red]"
         )
@@ -112,8 +174,112 @@ def dynamic_import(day: str) -> Optional[object]:
     return module
 
 
+class ModuleRegistry:
+    """
+    Imports each day's solve.py once per process and hands out that same
+    module afterwards, so heavy top level imports (numpy, scipy...) of a day
+    only run once and objects made by one part work with the other.
+    The mtime of each loaded solve.py is recorded alongside its module.
+    """
+
+    def __init__(self):
+        self.modules: Dict[str, Optional[object]] = {}
+        self.mtimes: Dict[str, float] = {}
+
+    def path(self, day: str) -> str:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        return os.path.normpath(os.path.join(current_dir, "..", day, "solve.py"))
+
+    def get(self, day: str) -> Optional[object]:
+        """
+        Returns the day's module, importing it on first use.
+        """
+        if day not in self.modules:
+            self.load(day)
+        return self.modules[day]
+
+    def refresh(self, day: str) -> bool:
+        """
+        Re-imports the day's module if its solve.py changed since loading.
+
+        Returns:
+            bool: Whether the module was (re)imported.
+        """
+        path = self.path(day)
+        mtime = os.path.getmtime(path) if os.path.exists(path) else 0.0
+        if day in self.modules and self.mtimes.get(day) == mtime:
+            return False
+        self.load(day)
+        return True
+
+    def load(self, day: str) -> Optional[object]:
+        """
+        (Re)imports the day's module regardless of whether it's loaded.
+        """
+        path = self.path(day)
+        self.mtimes[day] = os.path.getmtime(path) if os.path.exists(path) else 0.0
+        self.modules[day] = dynamic_import(day)
+        return self.modules[day]
+
+
+registry = ModuleRegistry()
+
+
+def load_day(day: str) -> Optional[object]:
+    """
+    Returns the day's solve.py module from the process wide registry.
+    """
+    return registry.get(day)
+
+
+class ParseOnce:
+    """
+    Wraps a day's optional parse(fpath) hook so each input file is parsed once.
+
+    A day that defines parse(fpath) gets the parsed object handed to
+    part1 and part2 instead of the file path, so parts must not mutate it.
+    The time each parse took is recorded per input file.
+    """
+
+    def __init__(self, parse_func: Callable[[str], Any]):
+        self.parse_func = parse_func
+        self.parsed: Dict[str, Any] = {}
+        self.times_ns: Dict[str, int] = {}
+
+    def __call__(self, fpath: str) -> Any:
+        fpath = str(fpath)
+        if fpath not in self.parsed:
+            tstart = time.perf_counter_ns()
+            self.parsed[fpath] = self.parse_func(fpath)
+            self.times_ns[fpath] = time.perf_counter_ns() - tstart
+        return self.parsed[fpath]
+
+
+def get_parser(module: Optional[object]) -> Optional[ParseOnce]:
+    """
+    Returns a ParseOnce for the module's parse hook, or None if it has none.
+    """
+    parse_func = getattr(module, "parse", None)
+    return ParseOnce(parse_func) if callable(parse_func) else None
+
+
+def warm_day(module: Optional[object]) -> None:
+    """
+    Run the module's optional warm() hook once per process, before timing.
+    Days import heavy libraries in it so they aren't charged to a part.
+    """
+    warm = getattr(module, "warm", None)
+    if callable(warm) and id(module) not in _warmed:
+        warm()
+        _warmed.add(id(module))
+
+
 def execute_part(
-    part_func: Callable[[Any, bool], int], fpath: str, debug: bool = False
+    part_func: Callable[[Any, bool], int],
+    fpath: str,
+    debug: bool = False,
+    cache: Optional["AnswerCache"] = None,
+    parser: Optional[Callable[[str], Any]] = None,
 ) -> Optional[Any]:
     """
     Executes a part function and handles exceptions.
@@ -121,16 +287,34 @@ def execute_part(
     Args:
         part_func (callable): The part1 or part2 function to execute.
         fpath (str): The path to the input file.
+        debug (bool): Whether to pass debug=True to the part function.
+        cache (AnswerCache, optional): Answer cache to check before solving.
+            Debug runs always bypass the cache so their output is printed.
+        parser (callable, optional): The day's parse hook, usually a ParseOnce.
+            When given, the part gets the parsed input instead of fpath.
 
     Returns:
         The result of the part function, or None if an error occurred.
     """
+    key = None
+    if cache is not None and not debug:
+        key = cache.key(part_func, fpath)
+        answer = cache.get(key) if key is not None else None
+        if answer is not None:
+            return answer
+
     try:
+        # Parse inside the try so a parse error is reported like a solve error
+        data = parser(fpath) if parser is not None else fpath
         if debug:
-            return part_func(fpath, debug=True)  # type: ignore
+            answer = part_func(data, debug=True)  # type: ignore
         else:
-            return part_func(fpath)  # type: ignore
+            answer = part_func(data)  # type: ignore
     except Exception as e:
         console.print(f"[bold red]Error executing {part_func.__name__}: {e}[/bold red]")
         traceback.print_exc()
         return None
+
+    if key is not None and answer is not None:
+        cache.put(key, answer)  # type: ignore
+    return answer
@@ -0,0 +1,69 @@
+# util/startup.py
+import pathlib
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+PATH_AOC = pathlib.Path(__file__).parent.parent
+
+ImportTime = Tuple[str, int, int]  # (module, self us, cumulative us)
+
+
+def parse_importtime(stderr: str) -> List[ImportTime]:
+    """
+    Parse the stderr of 'python -X importtime' into per module timings.
+
+    Lines look like 'import time:       362 |      10012 |     attr.converters'
+    where the indentation of the module name shows its nesting.
+
+    Returns:
+        List[ImportTime]: (module, self us, cumulative us) in import order.
+    """
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The 'self [us] | cumulative | imported package' header
+        timings.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return timings
+
+
+def measure_startup(module: str, runs: int = 10) -> Dict[str, Any]:
+    """
+    Time a cold interpreter importing a module, once per run.
+
+    Each run is a fresh 'python -X importtime -c "import <module>"'
+    in the year's directory so nothing is shared between runs.
+
+    Args:
+        module (str): The module to import, e.g. 'cmd.solve'.
+        runs (int): Number of cold starts to time.
+
+    Returns:
+        Dict[str, Any]: Wall clock ns and summed import us of every run,
+            plus the per module import times of the fastest run.
+    """
+    wall_ns: List[int] = []
+    import_us: List[int] = []
+    fastest: List[ImportTime] = []
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    for _ in range(runs):
+        tstart = time.perf_counter_ns()
+        proc = subprocess.run(cmd, cwd=PATH_AOC, capture_output=True, text=True)
+        wall_ns.append(time.perf_counter_ns() - tstart)
+        if proc.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{proc.stderr}")
+        timings = parse_importtime(proc.stderr)
+        import_us.append(sum(self_us for _, self_us, _ in timings))
+        if import_us[-1] == min(import_us):
+            fastest = timings
+    return {
+        "module": module,
+        "runs": runs,
+        "wall_ns": wall_ns,
+        "import_us": import_us,
+        "imports": fastest,
+    }
@@ -0,0 +1,292 @@
+# util/sweep.py
+import asyncio
+import multiprocessing
+import os
+import pathlib
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from util.cache import AnswerCache
+from util.memory import peak_rss_bytes, reset_peak_rss
+from util.sols import ParseOnce, execute_part, get_parser, load_day, warm_day
+
+PATH_AOC = pathlib.Path(__file__).parent.parent
+
+# A job is (day, part, kind, path) where kind is EXAMPLE or INPUT
+JobType = Tuple[str, str, str, str]
+JobResult = Dict[str, Any]
+
+# Answer cache of this worker process, created on first use
+_cache: Optional[AnswerCache] = None
+
+# Queue a streaming worker puts each (index, result) on as soon as it's done
+_results: Optional[Any] = None
+
+
+def discover_days(path_aoc: pathlib.Path = PATH_AOC) -> List[str]:
+    """
+    Find every zero padded NN directory with a solve.py in the year's tree.
+
+    Returns:
+        List[str]: The sorted day strings, e.g. ['01', '02', ...].
+    """
+    days = []
+    for path in path_aoc.iterdir():
+        if re.fullmatch(r"\d{2}", path.name) and (path / "solve.py").exists():
+            days.append(path.name)
+    return sorted(days)
+
+
+def parse_days(spec: str, available: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Parse a day spec like 'all', '6', '1-14' or '1,3,5-7' into day strings.
+
+    Args:
+        spec (str): The day specification.
+        available (Iterable[str], optional): Days to pick from for 'all'.
+
+    Returns:
+        List[str]: The zero padded day strings in ascending order.
+    """
+    if spec == "all":
+        return sorted(available) if available is not None else discover_days()
+    days = set()
+    for chunk in spec.split(","):
+        if "-" in chunk:
+            start, end = chunk.split("-", 1)
+            days.update(range(int(start), int(end) + 1))
+        else:
+            days.add(int(chunk))
+    if any(day < 1 or day > 25 for day in days):
+        raise ValueError(f"Days must be between 1 and 25, got '{spec}'")
+    return [f"{day:02d}" for day in sorted(days)]
+
+
+def get_module(day: str) -> Optional[Any]:
+    """
+    Import a day's module once per process.
+    """
+    return load_day(day)
+
+
+def get_part_func(day: str, part: str) -> Optional[Any]:
+    """
+    Return a day's part function.
+    Falls back to part1 when part2 doesn't exist, same as the single day runner.
+    """
+    module = get_module(day)
+    func = getattr(module, f"part{part}", None)
+    if func is None and part == "2":
+        func = getattr(module, "part1", None)
+    return func
+
+
+def run_job(
+    job: JobType,
+    debug: bool = False,
+    use_cache: bool = False,
+    parser: Optional[ParseOnce] = None,
+) -> JobResult:
+    """
+    Solve a single (day, part, input) job, meant to run inside a worker process.
+    Parse time is only reported by the job that actually parsed the input,
+    jobs sharing a parser with one that already did get it for free.
+    max_rss_bytes is the worker's peak RSS while the job ran, None if the
+    peak can't be reset per job (only on Linux).
+    """
+    global _cache
+    day, part, kind, fpath = job
+    result: JobResult = {"day": day, "part": part, "input": kind, "cached": False}
+    func = get_part_func(day, part)
+    if func is None:
+        result.update({"answer": None, "ns": 0, "parse_ns": 0, "max_rss_bytes": None})
+        return {**result, "error": "no solver"}
+    if use_cache and _cache is None:
+        _cache = AnswerCache()
+    cache = _cache if use_cache else None
+    hits = cache.hits if cache is not None else 0
+    parser = parser if parser is not None else get_parser(get_module(day))
+    parsed = parser is not None and fpath in parser.parsed
+    warm_day(get_module(day))
+    # Workers solve many jobs, so their lifetime peak RSS isn't this job's
+    measured = reset_peak_rss()
+    tstart = time.perf_counter_ns()
+    answer = execute_part(func, fpath, debug, cache, parser)
+    ns = time.perf_counter_ns() - tstart
+    # Parse time is reported apart from the solve time
+    parse_ns = 0
+    if parser is not None and not parsed:
+        parse_ns = parser.times_ns.get(fpath, 0)
+    error = None if answer is not None else "no solution"
+    cached = cache is not None and cache.hits > hits
+    return {
+        **result,
+        "answer": answer,
+        "ns": ns - parse_ns,
+        "parse_ns": parse_ns,
+        "max_rss_bytes": peak_rss_bytes() if measured else None,
+        "cached": cached,
+        "error": error,
+    }
+
+
+def group_jobs(jobs: List[JobType]) -> List[List[int]]:
+    """
+    Indices of the jobs grouped by (day, input), in the order first seen,
+    so every part of an input is solved by the same worker.
+    Only days with a parse hook are grouped, as only they share any work,
+    every other job is dispatched on its own.
+    """
+    groups: Dict[Tuple[str, str], List[int]] = {}
+    singles: List[List[int]] = []
+    for i, (day, _, _, fpath) in enumerate(jobs):
+        if get_parser(get_module(day)) is None:
+            singles.append([i])
+        else:
+            groups.setdefault((day, fpath), []).append(i)
+    return sorted(list(groups.values()) + singles)
+
+
+def init_worker(results: Any) -> None:
+    """
+    Pool initializer, giving a streaming worker the queue for its results.
+    """
+    global _results
+    _results = results
+
+
+def run_input_jobs(
+    jobs: List[JobType],
+    debug: bool = False,
+    use_cache: bool = False,
+    indices: Optional[List[int]] = None,
+) -> List[JobResult]:
+    """
+    Solve the jobs of one day & input in turn, sharing one ParseOnce so a day
+    with a parse hook parses the input once for all its parts.
+    In a streaming worker each result is also put on the queue with its index
+    as soon as it's done, rather than only when the whole group is.
+    """
+    parser = get_parser(get_module(jobs[0][0])) if jobs else None
+    indices = indices if indices is not None else list(range(len(jobs)))
+    results = []
+    for index, job in zip(indices, jobs):
+        results.append(run_job(job, debug, use_cache, parser))
+        if _results is not None:
+            _results.put((index, results[-1]))
+    return results
+
+
+def run_jobs(
+    jobs: List[JobType],
+    workers: Optional[int] = None,
+    debug: bool = False,
+    use_cache: bool = False,
+) -> List[JobResult]:
+    """
+    Dispatch every job to a process pool and collect the results.
+    The parts of an input of a day with a parse hook go to one worker.
+
+    Args:
+        jobs (List[JobType]): The (day, part, kind, path) jobs to solve.
+        workers (int, optional): Pool size, defaults to os.cpu_count().
+        debug (bool): Passed through to the part functions.
+        use_cache (bool): Whether workers check the answer cache first.
+
+    Returns:
+        List[JobResult]: The results sorted by cost, most expensive first.
+    """
+    workers = workers if workers else os.cpu_count()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_input_jobs, [jobs[i] for i in group], debug, use_cache)
+            for group in group_jobs(jobs)
+        ]
+        for future in as_completed(futures):
+            results.extend(future.result())
+    return sorted(results, key=lambda r: r["ns"] + r["parse_ns"], reverse=True)
+
+
+async def _stream_jobs(
+    jobs: List[JobType],
+    workers: Optional[int],
+    debug: bool,
+    use_cache: bool,
+    on_result: Callable[[JobResult], None],
+) -> List[JobResult]:
+    loop = asyncio.get_running_loop()
+    results: List[Optional[JobResult]] = [None] * len(jobs)
+
+    def report(index: int, result: JobResult) -> None:
+        # A result comes off the queue or with its group, whichever is first
+        if results[index] is None:
+            results[index] = result
+            on_result(result)
+
+    queue = multiprocessing.Queue()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(queue,)
+    ) as executor:
+        groups = {
+            loop.run_in_executor(
+                executor,
+                run_input_jobs,
+                [jobs[i] for i in group],
+                debug,
+                use_cache,
+                group,
+            ): group
+            for group in group_jobs(jobs)
+        }
+        pending = set(groups)
+        getter = loop.run_in_executor(None, queue.get)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending | {getter}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter in done:
+                    report(*getter.result())
+                    getter = loop.run_in_executor(None, queue.get)
+                # A finished group carries every result, including any still
+                # queued, and raises if its worker failed
+                for future in done & pending:
+                    pending.discard(future)
+                    for index, result in zip(groups[future], future.result()):
+                        report(index, result)
+        finally:
+            queue.put(None)  # Wakes the last getter if nothing else does
+            await getter
+    queue.close()
+    return results  # type: ignore
+
+
+def stream_jobs(
+    jobs: List[JobType],
+    on_result: Callable[[JobResult], None],
+    workers: Optional[int] = None,
+    debug: bool = False,
+    use_cache: bool = False,
+) -> List[JobResult]:
+    """
+    Solve every job concurrently in a process pool driven by asyncio.
+    The parts of an input of a day with a parse hook go to one worker.
+
+    Args:
+        jobs (List[JobType]): The (day, part, kind, path) jobs to solve.
+        on_result (callable): Called with each result as soon as it's done.
+        workers (int, optional): Pool size, one per input up to the cpu count.
+        debug (bool): Passed through to the part functions.
+        use_cache (bool): Whether workers check the answer cache first.
+
+    Returns:
+        List[JobResult]: The results in the same order as the jobs.
+    """
+    if not jobs:
+        return []  # A pool needs at least one worker
+    groups = len(group_jobs(jobs))
+    workers = workers if workers else min(groups, os.cpu_count() or 1)
+    return asyncio.run(_stream_jobs(jobs, workers, debug, use_cache, on_result))